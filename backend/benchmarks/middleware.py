@@ -0,0 +1,176 @@
+"""Per-request overhead of the request logging middleware.
+
+Calls a minimal FastAPI app directly through ASGI (no network or HTTP
+client) with no middleware, the previous ``BaseHTTPMiddleware``
+implementation and the current pure ASGI one, for a JSON and a streaming
+route. Log records are formatted and written to os.devnull so logging cost
+is included.
+
+    python -m benchmarks.middleware --requests 20000 --output middleware.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+
+os.environ.setdefault("LOG_DIR", os.path.join(tempfile.gettempdir(), "bench-logs"))
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.responses import StreamingResponse  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import Response  # noqa: E402
+
+from benchmarks.signal_pipeline import _git_revision  # noqa: E402
+from src.api.middleware.request_logging import RequestLoggingMiddleware  # noqa: E402
+from src.common.logging import DATE_FORMAT, TEXT_FORMAT, setup_logger  # noqa: E402
+
+logger = setup_logger("api")
+
+
+class LegacyRequestLoggingMiddleware(BaseHTTPMiddleware):
+    """The BaseHTTPMiddleware implementation this benchmark compares against."""
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        request_id = str(uuid.uuid4())[:8]
+        request.state.request_id = request_id
+
+        start = time.perf_counter()
+        logger.info(
+            "REQ %s | %s %s | wallet=%s",
+            request_id,
+            request.method,
+            request.url.path,
+            request.headers.get("x-wallet-address", "anonymous"),
+        )
+
+        response = await call_next(request)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info("RES %s | %d | %.1fms", request_id, response.status_code, elapsed_ms)
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
+def _build_app(middleware) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/json")
+    async def json_route():
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    async def stream_route():
+        async def chunks():
+            for _ in range(20):
+                yield b"x" * 1024
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    if middleware is not None:
+        app.add_middleware(middleware)
+    return app
+
+
+async def _call(app, path: str) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"x-wallet-address", b"7xK3mBf9rQvZ8nJp4sW2yL6hT1cX5dA8kF3gN9fPq")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    return (time.perf_counter() - start) * 1e6
+
+
+async def _measure(app, path: str, requests: int) -> dict:
+    for _ in range(min(500, requests)):
+        await _call(app, path)
+    samples = [await _call(app, path) for _ in range(requests)]
+    samples.sort()
+    return {
+        "mean_us": round(statistics.fmean(samples), 2),
+        "p50_us": round(samples[len(samples) // 2], 2),
+        "p99_us": round(samples[int(len(samples) * 0.99) - 1], 2),
+    }
+
+
+async def run_benchmark(requests: int) -> dict:
+    # Write synchronously to os.devnull so formatting and write costs are measured
+    # without flooding the console
+    devnull = logging.FileHandler(os.devnull)
+    devnull.setFormatter(logging.Formatter(TEXT_FORMAT, datefmt=DATE_FORMAT))
+    original_handlers = logger.handlers[:]
+    logger.handlers = [devnull]
+    try:
+        results = {}
+        for path in ("/json", "/stream"):
+            baseline = await _measure(_build_app(None), path, requests)
+            legacy = await _measure(_build_app(LegacyRequestLoggingMiddleware), path, requests)
+            current = await _measure(_build_app(RequestLoggingMiddleware), path, requests)
+            results[path] = {
+                "no_middleware": baseline,
+                "base_http_middleware": legacy,
+                "pure_asgi_middleware": current,
+                "overhead_us": {
+                    "base_http_middleware": round(legacy["mean_us"] - baseline["mean_us"], 2),
+                    "pure_asgi_middleware": round(current["mean_us"] - baseline["mean_us"], 2),
+                },
+            }
+        return results
+    finally:
+        logger.handlers = original_handlers
+        devnull.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark request logging middleware overhead")
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--output", default=None, help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    report = {
+        "benchmark": "middleware",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_revision": _git_revision(),
+        "python": sys.version.split()[0],
+        "requests": args.requests,
+        "results": asyncio.run(run_benchmark(args.requests)),
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
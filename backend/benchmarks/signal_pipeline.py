@@ -0,0 +1,263 @@
+"""End-to-end benchmark of the signal pipeline.
+
+Seeds N users with vaults, fires a signal through ``POST /api/signals`` and
+drives the fan-out and per-user executions exactly as the RQ workers would,
+against fakeredis and the in-process fake Jupiter API. Reports
+signal-to-last-enqueue latency, per-job execution p50/p99, DB queries per
+stage and peak memory as JSON.
+
+    python -m benchmarks.signal_pipeline --users 1000 10000 --output bench.json
+
+``--owners-per-job`` and ``--execution-mode aggregate`` benchmark the batch
+and aggregate execution jobs instead of one job per user.
+
+By default a throwaway SQLite file is used. ``--database-url`` runs against
+another database, e.g. Postgres; all tables in it are dropped and recreated,
+so it also needs ``--drop-existing``. Compare result files across commits to
+track regressions.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+BENCHMARK_VERSION = 2
+
+AGGREGATE_WALLET = "benchaggregate" + "0" * 30
+
+
+def _configure_environment(database_url: str | None, execution_mode: str, owners_per_job: int) -> None:
+    """Point settings at benchmark resources. Must run before importing ``src``."""
+    os.environ["EXECUTION_MODE"] = execution_mode
+    os.environ["EXECUTION_OWNERS_PER_JOB"] = str(owners_per_job)
+    os.environ.setdefault("EXECUTION_AGGREGATE_WALLET", AGGREGATE_WALLET)
+    if database_url is None:
+        path = os.path.join(tempfile.mkdtemp(prefix="bench-"), "bench.db")
+        database_url = f"sqlite+aiosqlite:///{path}"
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("LOG_DIR", os.path.join(tempfile.gettempdir(), "bench-logs"))
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    os.environ.setdefault("RETRY_BUDGET_ENABLED", "false")
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class QueryCounter:
+    """Counts SQL statements per benchmark stage via engine events."""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+
+        self.stage = "setup"
+        self.counts: dict[str, int] = {}
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.counts[self.stage] = self.counts.get(self.stage, 0) + 1
+
+
+async def _seed(users: int) -> list[str]:
+    from sqlalchemy import insert
+
+    from src.common.constants import DEFAULT_TRADE_SIZE_SOL
+    from src.db.base import Base, async_session_factory, engine
+    from src.db.models import UserProfile, VaultBalance
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    owners = [f"bench{i:039d}" for i in range(users)]
+    async with async_session_factory() as session:
+        for start in range(0, users, 5_000):
+            chunk = owners[start:start + 5_000]
+            await session.execute(insert(UserProfile), [{"owner": owner} for owner in chunk])
+            await session.execute(
+                insert(VaultBalance),
+                [{"owner": owner, "sol_balance": DEFAULT_TRADE_SIZE_SOL * 4} for owner in chunk],
+            )
+        await session.commit()
+    return owners
+
+
+async def run_benchmark(
+    users: int,
+    concurrency: int = 1,
+    jupiter_latency_ms: float = 0.0,
+) -> dict:
+    """Run one pipeline benchmark for ``users`` seeded users and return the report."""
+    import fakeredis
+    from httpx import ASGITransport, AsyncClient
+
+    from src.api.main import create_app
+    from src.db.base import engine
+    from src.jupiter import route_builder
+    from src.jupiter.fake_server import FakeJupiterConfig, fake_jupiter_client
+    from src.signals import queue as queue_module
+    from src.signals.workers import execution_worker
+    from src.signals.workers.signal_worker import _process_signal_async
+
+    queue_module._redis_conn = fakeredis.FakeStrictRedis()
+    queue_module._queues = {}
+    jupiter, fake = fake_jupiter_client(FakeJupiterConfig(latency_median_ms=jupiter_latency_ms, seed=1))
+    route_builder._client = jupiter
+    if route_builder._quote_cache is not None:
+        await route_builder._quote_cache.clear()
+
+    # The queued job's function name selects the same coroutine the RQ worker would run
+    job_runners = {
+        queue_module.EXECUTE_FOR_USER: execution_worker._execute_for_user_async,
+        queue_module.EXECUTE_FOR_USERS: execution_worker._execute_for_users_async,
+        queue_module.EXECUTE_AGGREGATE: execution_worker._execute_aggregate_async,
+    }
+
+    counter = QueryCounter(engine)
+    tracemalloc.start()
+
+    seed_start = time.perf_counter()
+    await _seed(users)
+    seed_ms = (time.perf_counter() - seed_start) * 1000
+    tracemalloc.reset_peak()
+
+    # Signal ingestion through the API
+    counter.stage = "api"
+    app = create_app()
+    signal_start = time.perf_counter()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        response = await client.post("/api/signals", json={"signal_type": "SOL_TO_USDC"})
+    response.raise_for_status()
+    api_ms = (time.perf_counter() - signal_start) * 1000
+
+    # Fan-out, as the signal worker would run the queued job
+    counter.stage = "fanout"
+    signal_job = queue_module.get_signal_queue().get_jobs()[0]
+    fanout_start = time.perf_counter()
+    await _process_signal_async(*signal_job.args)
+    last_enqueue_ms = (time.perf_counter() - signal_start) * 1000
+    fanout_ms = (time.perf_counter() - fanout_start) * 1000
+
+    # Executions, as execution workers would run the queued jobs
+    counter.stage = "execution"
+    execution_jobs = queue_module.get_execution_queue().get_jobs()
+    latencies: list[float] = []
+    outcomes: dict[str, int] = {}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_job(job) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            result = await job_runners[job.func_name](*job.args)
+            latencies.append((time.perf_counter() - start) * 1000)
+            # Per-user jobs return one outcome, batch and aggregate jobs one per owner
+            for outcome in result.values() if isinstance(result, dict) else [result]:
+                outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    execution_start = time.perf_counter()
+    await asyncio.gather(*(run_job(job) for job in execution_jobs))
+    execution_ms = (time.perf_counter() - execution_start) * 1000
+
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    await jupiter.close()
+
+    return {
+        "users": users,
+        "concurrency": concurrency,
+        "jupiter_latency_ms": jupiter_latency_ms,
+        "execution_mode": execution_worker.settings.execution_mode,
+        "owners_per_job": execution_worker.settings.execution_owners_per_job,
+        "seed_ms": round(seed_ms, 2),
+        "signal_api_ms": round(api_ms, 2),
+        "fanout_ms": round(fanout_ms, 2),
+        "signal_to_last_enqueue_ms": round(last_enqueue_ms, 2),
+        "jobs_enqueued": len(execution_jobs),
+        "execution_total_ms": round(execution_ms, 2),
+        "execution_ms": {
+            "p50": round(_percentile(latencies, 50), 3),
+            "p99": round(_percentile(latencies, 99), 3),
+            "max": round(max(latencies, default=0.0), 3),
+            "mean": round(statistics.fmean(latencies), 3) if latencies else 0.0,
+        },
+        "execution_outcomes": outcomes,
+        "db_queries": {stage: counter.counts.get(stage, 0) for stage in ("api", "fanout", "execution")},
+        "jupiter_requests": dict(fake.requests),
+        "peak_memory_mb": round(peak_bytes / (1024 * 1024), 2),
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the signal pipeline end to end")
+    parser.add_argument("--users", type=int, nargs="+", default=[1_000])
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrent executions")
+    parser.add_argument("--jupiter-latency-ms", type=float, default=0.0, help="Median fake Jupiter latency")
+    parser.add_argument(
+        "--execution-mode", choices=["per_user", "aggregate"], default="per_user", help="EXECUTION_MODE to run"
+    )
+    parser.add_argument("--owners-per-job", type=int, default=1, help="EXECUTION_OWNERS_PER_JOB to run")
+    parser.add_argument("--database-url", default=None, help="Defaults to a temporary SQLite file")
+    parser.add_argument(
+        "--drop-existing",
+        action="store_true",
+        help="Allow dropping and recreating all tables in --database-url",
+    )
+    parser.add_argument("--output", default=None, help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    if args.database_url and not args.drop_existing:
+        parser.error("--database-url drops every table in that database; pass --drop-existing to confirm")
+
+    _configure_environment(args.database_url, args.execution_mode, args.owners_per_job)
+
+    async def run_all() -> list[dict]:
+        from src.db.base import engine
+
+        results = [
+            await run_benchmark(users, args.concurrency, args.jupiter_latency_ms)
+            for users in args.users
+        ]
+        await engine.dispose()
+        return results
+
+    report = {
+        "benchmark": "signal_pipeline",
+        "version": BENCHMARK_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_revision": _git_revision(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "database": os.environ["DATABASE_URL"].split("://")[0],
+        "results": asyncio.run(run_all()),
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ from collections.abc import AsyncGenerator
 from fastapi import Depends, Header, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.session import get_db
+from src.db.session import get_db, get_read_db
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -11,6 +11,12 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def get_read_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Read-only session for GET routes; may be served by a replica and is never committed."""
+    async for session in get_read_db():
+        yield session
+
+
 async def get_current_user_wallet(
     x_wallet_address: str = Header(..., description="Solana wallet address"),
 ) -> str:
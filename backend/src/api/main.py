@@ -5,9 +5,12 @@ from fastapi import FastAPI
 from src.api.middleware.cors import add_cors_middleware
 from src.api.middleware.error_handler import add_error_handlers
 from src.api.middleware.request_logging import RequestLoggingMiddleware
-from src.api.routes import api_router
+from src.api.routes import api_router, metrics_router
 from src.common.logging import setup_logger
+from src.config.settings import settings
 from src.db.base import engine
+from src.db.replicas import replica_router
+from src.jupiter.price_service import price_service
 
 logger = setup_logger("api")
 
@@ -15,9 +18,12 @@ logger = setup_logger("api")
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting SolanaSwapDEX API")
+    price_service.start_refresher(settings.price_refresh_interval_seconds)
     yield
     logger.info("Shutting down SolanaSwapDEX API")
+    await price_service.stop_refresher()
     await engine.dispose()
+    await replica_router.dispose()
 
 
 def create_app() -> FastAPI:
@@ -37,6 +43,7 @@ def create_app() -> FastAPI:
 
     # Routes
     app.include_router(api_router)
+    app.include_router(metrics_router)  # at the root, where Prometheus scrapes by default
 
     return app
 
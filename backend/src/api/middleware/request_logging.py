@@ -1,37 +1,86 @@
+import itertools
+import os
 import time
-import uuid
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.common.logging import setup_logger
+from src.common.metrics import HTTP_REQUEST_SECONDS
 
 logger = setup_logger("api")
 
+# Request IDs are a per-process random prefix plus a counter: unique across
+# workers without generating a UUID per request
+_id_prefix = os.urandom(3).hex()
+_id_counter = itertools.count(1)
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        request_id = str(uuid.uuid4())[:8]
-        request.state.request_id = request_id
 
+def next_request_id() -> str:
+    return f"{_id_prefix}-{next(_id_counter):x}"
+
+
+def route_template(scope: Scope) -> str:
+    """Path template of the matched route, e.g. ``/api/transactions``; ``unmatched`` for 404s."""
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if template is None:
+        return "unmatched"
+    # Routes of included routers carry their own path without the router
+    # prefix. Prefixes are static, so take them from the request path.
+    extra_segments = scope["path"].count("/") - template.count("/")
+    if extra_segments > 0:
+        template = "/".join(scope["path"].split("/")[:extra_segments + 1]) + template
+    return template
+
+
+class RequestLoggingMiddleware:
+    """Pure ASGI middleware that assigns a request ID and logs one line per request.
+
+    Request latency is also recorded in ``http_request_duration_seconds``,
+    labelled with the matched route template to keep cardinality bounded.
+    The ID is stored in ``request.state.request_id`` and returned in the
+    ``X-Request-ID`` header. Messages are passed straight through, so
+    streaming responses are not buffered.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = next_request_id()
+        scope.setdefault("state", {})["request_id"] = request_id
         start = time.perf_counter()
-        logger.info(
-            "REQ %s | %s %s | wallet=%s",
-            request_id,
-            request.method,
-            request.url.path,
-            request.headers.get("x-wallet-address", "anonymous"),
-        )
-
-        response = await call_next(request)
-
-        elapsed_ms = (time.perf_counter() - start) * 1000
-        logger.info(
-            "RES %s | %d | %.1fms",
-            request_id,
-            response.status_code,
-            elapsed_ms,
-        )
-        response.headers["X-Request-ID"] = request_id
-        return response
+        status_code = 500
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("X-Request-ID", request_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_REQUEST_SECONDS.labels(scope["method"], route_template(scope), str(status_code)).observe(elapsed)
+
+            wallet = "anonymous"
+            for name, value in scope["headers"]:
+                if name == b"x-wallet-address":
+                    wallet = value.decode("latin-1")
+                    break
+            logger.info(
+                "REQ %s | %s %s | %d | %.1fms | wallet=%s",
+                request_id,
+                scope["method"],
+                scope["path"],
+                status_code,
+                elapsed * 1000,
+                wallet,
+            )
@@ -8,6 +8,9 @@ from .transactions import router as transactions_router
 from .pnl import router as pnl_router
 from .settings import router as settings_router
 from .signals import router as signals_router
+from .dashboard import router as dashboard_router
+from .onboarding import router as onboarding_router
+from .metrics import router as metrics_router
 
 api_router = APIRouter(prefix="/api")
 
@@ -19,3 +22,5 @@ api_router.include_router(transactions_router)
 api_router.include_router(pnl_router)
 api_router.include_router(settings_router)
 api_router.include_router(signals_router)
+api_router.include_router(dashboard_router)
+api_router.include_router(onboarding_router)
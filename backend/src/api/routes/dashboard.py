@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.dependencies import get_read_db_session, get_current_user_wallet
+from src.api.routes.pnl import build_pnl_history
+from src.api.routes.portfolio import build_portfolio_metrics
+from src.api.routes.strategy import build_strategy_status
+from src.api.routes.vaults import build_vault_balances
+from src.api.schemas.dashboard import DashboardResponse
+from src.db.repositories.pnl_repo import PnlRepository
+from src.db.repositories.user_repo import UserRepository
+from src.jupiter.price_service import get_sol_price
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+HISTORY_DAYS = 30
+
+
+async def _load_pnl(db: AsyncSession, wallet: str) -> tuple:
+    """Latest PnL snapshot and the 30-day history.
+
+    Read on the request's session, like the rest of the dashboard, so every
+    figure comes from the same database; the latest snapshot query is skipped
+    when the history already contains it.
+    """
+    pnl_repo = PnlRepository(db)
+    history = await pnl_repo.get_history(wallet, days=HISTORY_DAYS)
+    latest = history[-1] if history else await pnl_repo.get_latest(wallet)
+    return latest, history
+
+
+@router.get("", response_model=DashboardResponse)
+async def get_dashboard(
+    wallet: str = Depends(get_current_user_wallet),
+    db: AsyncSession = Depends(get_read_db_session),
+) -> DashboardResponse:
+    """Everything the dashboard page shows, in one request."""
+    # Profile, vault and execution counter in one joined query
+    profile, vault, counter = await UserRepository(db).get_account(wallet)
+
+    latest_pnl, history = await _load_pnl(db, wallet)
+    sol_price = await get_sol_price()
+
+    return DashboardResponse(
+        portfolio=build_portfolio_metrics(vault, latest_pnl, history, sol_price),
+        vaults=build_vault_balances(vault, profile, sol_price),
+        strategy=build_strategy_status(profile, vault, counter),
+        pnl=build_pnl_history(history, HISTORY_DAYS),
+    )
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from src.common.logging import setup_logger
+from src.common.metrics import QUEUE_DEPTH
+from src.signals.queue import queue_depths
+
+logger = setup_logger("api")
+
+router = APIRouter(tags=["metrics"])
+
+
+# Sync on purpose: FastAPI runs it in the threadpool, so the blocking Redis calls stay off the event loop
+@router.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    try:
+        for name, depth in queue_depths().items():
+            QUEUE_DEPTH.labels(name).set(depth)
+    except Exception as e:
+        logger.warning("Queue depth unavailable: %s", str(e))
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.dependencies import get_db_session, get_current_user_wallet
+from src.api.routes.settings import build_settings_response
+from src.api.routes.vaults import build_vault_balances
+from src.api.schemas.onboarding import OnboardingResponse
+from src.db.repositories.user_repo import UserRepository
+from src.db.repositories.vault_repo import VaultRepository
+from src.jupiter.price_service import get_sol_price
+
+router = APIRouter(prefix="/onboarding", tags=["onboarding"])
+
+
+@router.post("", response_model=OnboardingResponse)
+async def onboard(
+    wallet: str = Depends(get_current_user_wallet),
+    db: AsyncSession = Depends(get_db_session),
+) -> OnboardingResponse:
+    """Provision the wallet's profile and vault. Safe to call again for a known wallet.
+
+    Read endpoints never write; until a wallet is onboarded they serve defaults.
+    """
+    profile, created = await UserRepository(db).onboard(wallet)
+    vault = await VaultRepository(db).get_by_owner(wallet)
+
+    return OnboardingResponse(
+        created=created,
+        settings=build_settings_response(profile),
+        vaults=build_vault_balances(vault, profile, await get_sol_price()),
+    )
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_db_session, get_current_user_wallet
+from src.api.dependencies import get_read_db_session, get_current_user_wallet
 from src.api.schemas.pnl import PnlDataPoint, PnlHistoryResponse
 from src.db.repositories.pnl_repo import PnlRepository
 
@@ -10,17 +10,7 @@ router = APIRouter(prefix="/pnl", tags=["pnl"])
 RANGE_MAP = {"7": 7, "30": 30, "90": 90, "all": None}
 
 
-@router.get("/history", response_model=PnlHistoryResponse)
-async def get_pnl_history(
-    wallet: str = Depends(get_current_user_wallet),
-    db: AsyncSession = Depends(get_db_session),
-    range: str = Query("30", description="Time range: 7, 30, 90, or all"),
-) -> PnlHistoryResponse:
-    days = RANGE_MAP.get(range, 30)
-
-    pnl_repo = PnlRepository(db)
-    snapshots = await pnl_repo.get_history(wallet, days=days)
-
+def build_pnl_history(snapshots: list, days: int | None) -> PnlHistoryResponse:
     history = [
         PnlDataPoint(
             date=s.date,
@@ -36,3 +26,17 @@ async def get_pnl_history(
     ]
 
     return PnlHistoryResponse(history=history, range_days=days)
+
+
+@router.get("/history", response_model=PnlHistoryResponse)
+async def get_pnl_history(
+    wallet: str = Depends(get_current_user_wallet),
+    db: AsyncSession = Depends(get_read_db_session),
+    range: str = Query("30", description="Time range: 7, 30, 90, or all"),
+) -> PnlHistoryResponse:
+    days = RANGE_MAP.get(range, 30)
+
+    pnl_repo = PnlRepository(db)
+    snapshots = await pnl_repo.get_history(wallet, days=days)
+
+    return build_pnl_history(snapshots, days)
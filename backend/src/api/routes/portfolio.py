@@ -1,36 +1,25 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_db_session, get_current_user_wallet
+from src.api.dependencies import get_read_db_session, get_current_user_wallet
 from src.api.schemas.portfolio import PortfolioMetrics
 from src.common.constants import lamports_to_sol, usdc_base_to_human
 from src.db.repositories.vault_repo import VaultRepository
 from src.db.repositories.pnl_repo import PnlRepository
+from src.jupiter.price_service import get_sol_price
 
 router = APIRouter(prefix="/portfolio", tags=["portfolio"])
 
-# Placeholder price — in production this comes from an oracle or price feed
-SOL_PRICE_USD = 148.32
-
-
-@router.get("/metrics", response_model=PortfolioMetrics)
-async def get_portfolio_metrics(
-    wallet: str = Depends(get_current_user_wallet),
-    db: AsyncSession = Depends(get_db_session),
-) -> PortfolioMetrics:
-    vault_repo = VaultRepository(db)
-    pnl_repo = PnlRepository(db)
-
-    vault = await vault_repo.get_or_create(wallet)
-    latest_pnl = await pnl_repo.get_latest(wallet)
 
+def build_portfolio_metrics(vault, latest_pnl, history_30d: list, sol_price: float) -> PortfolioMetrics:
+    """Portfolio metrics from already loaded vault and PnL snapshots."""
     sol_human = lamports_to_sol(vault.sol_balance)
     usdc_human = usdc_base_to_human(vault.usdc_balance)
     fee_human = lamports_to_sol(vault.fee_pool_balance)
 
-    sol_usd = sol_human * SOL_PRICE_USD
+    sol_usd = sol_human * sol_price
     usdc_usd = usdc_human
-    fee_usd = fee_human * SOL_PRICE_USD
+    fee_usd = fee_human * sol_price
     total_usd = sol_usd + usdc_usd + fee_usd
 
     pnl_all_time = float(latest_pnl.cumulative_pnl) if latest_pnl else 0.0
@@ -38,7 +27,6 @@ async def get_portfolio_metrics(
     usdc_pnl = float(latest_pnl.cumulative_usdc_pnl) if latest_pnl else 0.0
 
     # Get 24h and 30d PnL from history
-    history_30d = await pnl_repo.get_history(wallet, days=30)
     pnl_24h = float(history_30d[-1].daily_pnl) if history_30d else 0.0
     pnl_30d = sum(float(s.daily_pnl) for s in history_30d) if history_30d else 0.0
 
@@ -64,3 +52,18 @@ async def get_portfolio_metrics(
         sol_pnl=round(sol_pnl, 9),
         usdc_pnl=round(usdc_pnl, 6),
     )
+
+
+@router.get("/metrics", response_model=PortfolioMetrics)
+async def get_portfolio_metrics(
+    wallet: str = Depends(get_current_user_wallet),
+    db: AsyncSession = Depends(get_read_db_session),
+) -> PortfolioMetrics:
+    vault_repo = VaultRepository(db)
+    pnl_repo = PnlRepository(db)
+
+    vault = await vault_repo.get_by_owner(wallet) or vault_repo.default_vault(wallet)
+    latest_pnl = await pnl_repo.get_latest(wallet)
+    history_30d = await pnl_repo.get_history(wallet, days=30)
+
+    return build_portfolio_metrics(vault, latest_pnl, history_30d, await get_sol_price())
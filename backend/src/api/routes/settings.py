@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_db_session, get_current_user_wallet
+from src.api.dependencies import get_db_session, get_read_db_session, get_current_user_wallet
 from src.api.schemas.settings import SettingsResponse, SettingsUpdateRequest
 from src.common.constants import (
     DEFAULT_TRADE_SIZE_SOL,
@@ -17,14 +17,7 @@ from src.db.repositories.user_repo import UserRepository
 router = APIRouter(prefix="/settings", tags=["settings"])
 
 
-@router.get("", response_model=SettingsResponse)
-async def get_settings(
-    wallet: str = Depends(get_current_user_wallet),
-    db: AsyncSession = Depends(get_db_session),
-) -> SettingsResponse:
-    user_repo = UserRepository(db)
-    profile = await user_repo.get_or_create(wallet)
-
+def build_settings_response(profile) -> SettingsResponse:
     return SettingsResponse(
         owner=profile.owner,
         enabled=profile.enabled,
@@ -40,6 +33,17 @@ async def get_settings(
     )
 
 
+@router.get("", response_model=SettingsResponse)
+async def get_settings(
+    wallet: str = Depends(get_current_user_wallet),
+    db: AsyncSession = Depends(get_read_db_session),
+) -> SettingsResponse:
+    user_repo = UserRepository(db)
+    profile = await user_repo.get_by_owner(wallet) or user_repo.default_profile(wallet)
+
+    return build_settings_response(profile)
+
+
 @router.put("", response_model=SettingsResponse)
 async def update_settings(
     request: SettingsUpdateRequest,
@@ -52,19 +56,7 @@ async def update_settings(
     update_data = request.model_dump(exclude_unset=True)
     profile = await user_repo.update(wallet, **update_data)
 
-    return SettingsResponse(
-        owner=profile.owner,
-        enabled=profile.enabled,
-        trade_size_sol=profile.trade_size_sol,
-        trade_size_usdc=profile.trade_size_usdc,
-        min_fee_pool=profile.min_fee_pool,
-        target_fee_pool=profile.target_fee_pool,
-        max_slippage_bps=profile.max_slippage_bps,
-        protocol_fee_bps=profile.protocol_fee_bps,
-        relayer_refund_lamports=profile.relayer_refund_lamports,
-        keeper_allowlist=profile.keeper_allowlist,
-        daily_limit=profile.daily_limit,
-    )
+    return build_settings_response(profile)
 
 
 @router.post("/reset", response_model=SettingsResponse)
@@ -88,16 +80,4 @@ async def reset_settings(
         keeper_allowlist=None,
     )
 
-    return SettingsResponse(
-        owner=profile.owner,
-        enabled=profile.enabled,
-        trade_size_sol=profile.trade_size_sol,
-        trade_size_usdc=profile.trade_size_usdc,
-        min_fee_pool=profile.min_fee_pool,
-        target_fee_pool=profile.target_fee_pool,
-        max_slippage_bps=profile.max_slippage_bps,
-        protocol_fee_bps=profile.protocol_fee_bps,
-        relayer_refund_lamports=profile.relayer_refund_lamports,
-        keeper_allowlist=profile.keeper_allowlist,
-        daily_limit=profile.daily_limit,
-    )
+    return build_settings_response(profile)
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from opentelemetry.trace import format_trace_id
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_db_session
-from src.api.schemas.signals import SignalRequest, SignalResponse
+from src.api.dependencies import get_db_session, get_read_db_session
+from src.api.schemas.signals import SignalHistoryResponse, SignalLogEntry, SignalRequest, SignalResponse
 from src.common.logging import setup_logger
+from src.common.tracing import tracer
 from src.db.repositories.signal_repo import SignalRepository
 
 router = APIRouter(prefix="/signals", tags=["signals"])
@@ -17,24 +19,28 @@ async def receive_signal(
 ) -> SignalResponse:
     signal_repo = SignalRepository(db)
 
-    # Log the signal to DB
-    signal_log = await signal_repo.create(
-        signal_type=request.signal_type,
-        status="received",
-        metadata_=request.metadata,
-    )
+    # The signal and execution workers continue this trace through the job meta
+    with tracer.start_as_current_span("receive_signal", attributes={"signal.type": request.signal_type}) as span:
+        # Log the signal to DB
+        signal_log = await signal_repo.create(
+            signal_type=request.signal_type,
+            status="received",
+            metadata_=request.metadata,
+            trace_id=format_trace_id(span.get_span_context().trace_id) if span.is_recording() else None,
+        )
+        span.set_attribute("signal.id", signal_log.id)
 
-    logger.info("Signal received: id=%d type=%s", signal_log.id, request.signal_type)
+        logger.info("Signal received: id=%d type=%s", signal_log.id, request.signal_type)
 
-    # Enqueue to Redis for processing
-    try:
-        from src.signals.receiver import enqueue_signal
+        # Enqueue to Redis for processing
+        try:
+            from src.signals.receiver import enqueue_signal
 
-        enqueue_signal(signal_log.id, request.signal_type)
-        message = "Signal received and queued for processing"
-    except Exception as e:
-        logger.warning("Failed to enqueue signal %d: %s", signal_log.id, str(e))
-        message = "Signal received but queuing failed — will retry"
+            enqueue_signal(signal_log.id, request.signal_type)
+            message = "Signal received and queued for processing"
+        except Exception as e:
+            logger.warning("Failed to enqueue signal %d: %s", signal_log.id, str(e))
+            message = "Signal received but queuing failed — will retry"
 
     return SignalResponse(
         id=signal_log.id,
@@ -42,3 +48,27 @@ async def receive_signal(
         status="received",
         message=message,
     )
+
+
+@router.get("", response_model=SignalHistoryResponse)
+async def get_signal_history(
+    db: AsyncSession = Depends(get_read_db_session),
+    limit: int = Query(20, ge=1, le=200),
+) -> SignalHistoryResponse:
+    signals = await SignalRepository(db).get_recent(limit)
+
+    return SignalHistoryResponse(
+        signals=[
+            SignalLogEntry(
+                id=s.id,
+                signal_type=s.signal_type,
+                status=s.status,
+                received_at=s.received_at,
+                processed_at=s.processed_at,
+                affected_users=s.affected_users,
+                end_to_end_ms=s.end_to_end_ms,
+                error_message=s.error_message,
+            )
+            for s in signals
+        ]
+    )
@@ -1,30 +1,18 @@
 from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_db_session, get_current_user_wallet
+from src.api.dependencies import get_read_db_session, get_current_user_wallet
 from src.api.schemas.strategy import StrategyStatus
 from src.config.settings import settings
-from src.db.models.transaction import Transaction
 from src.db.repositories.user_repo import UserRepository
-from src.db.repositories.vault_repo import VaultRepository
 
 router = APIRouter(prefix="/strategy", tags=["strategy"])
 
 
-@router.get("/status", response_model=StrategyStatus)
-async def get_strategy_status(
-    wallet: str = Depends(get_current_user_wallet),
-    db: AsyncSession = Depends(get_db_session),
-) -> StrategyStatus:
-    user_repo = UserRepository(db)
-    vault_repo = VaultRepository(db)
-
-    profile = await user_repo.get_or_create(wallet)
-    vault = await vault_repo.get_or_create(wallet)
-
+def build_strategy_status(profile, vault, counter) -> StrategyStatus:
+    """Strategy status from a profile, its vault and its execution counter."""
     # Determine current position based on vault balances
     if vault.sol_balance > vault.usdc_balance:
         position = "SOL"
@@ -33,20 +21,9 @@ async def get_strategy_status(
     else:
         position = "mixed"
 
-    # Count total executions
-    total_result = await db.execute(
-        select(func.count()).select_from(Transaction).where(Transaction.owner == wallet)
-    )
-    total_executions = total_result.scalar_one()
-
-    # Count today's executions
-    today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-    daily_result = await db.execute(
-        select(func.count())
-        .select_from(Transaction)
-        .where(Transaction.owner == wallet, Transaction.date >= today_start)
-    )
-    daily_executions = daily_result.scalar_one()
+    # Execution counts from the maintained per-owner counter
+    total_executions = counter.total_count if counter else 0
+    daily_executions = counter.daily_count(datetime.now(timezone.utc).date()) if counter else 0
 
     # Calculate next execution ETA
     next_eta = None
@@ -69,3 +46,14 @@ async def get_strategy_status(
         daily_executions=daily_executions,
         daily_limit=profile.daily_limit,
     )
+
+
+@router.get("/status", response_model=StrategyStatus)
+async def get_strategy_status(
+    wallet: str = Depends(get_current_user_wallet),
+    db: AsyncSession = Depends(get_read_db_session),
+) -> StrategyStatus:
+    user_repo = UserRepository(db)
+    profile, vault, counter = await user_repo.get_account(wallet)
+
+    return build_strategy_status(profile, vault, counter)
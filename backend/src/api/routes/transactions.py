@@ -1,13 +1,17 @@
+import base64
+import binascii
 import csv
 import io
+import zlib
+from collections.abc import AsyncIterator
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_db_session, get_current_user_wallet
-from src.api.schemas.common import PaginationMeta
+from src.api.dependencies import get_read_db_session, get_current_user_wallet
+from src.api.schemas.common import CursorPaginationMeta, PaginationMeta
 from src.api.schemas.transactions import TransactionResponse, TransactionListResponse
 from src.common.constants import (
     lamports_to_sol,
@@ -15,38 +19,98 @@ from src.common.constants import (
     WSOL_MINT,
     SIGNAL_SOL_TO_USDC,
 )
+from src.common.exceptions import ValidationError
 from src.db.repositories.transaction_repo import TransactionRepository
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
 
-def _tx_to_response(tx) -> TransactionResponse:
-    """Convert a Transaction model to response schema with human-readable amounts."""
+CSV_HEADER = ["Date", "Type", "Amount In", "Amount Out", "Slippage BPS", "Fee", "Status", "Signature"]
+
+
+def _human_amounts(tx) -> tuple[float, float, float]:
+    """Amount in, amount out and fee of a transaction row in human-readable units."""
     is_sol_to_usdc = tx.type == SIGNAL_SOL_TO_USDC
     amount_in = lamports_to_sol(tx.amount_in) if is_sol_to_usdc else usdc_base_to_human(tx.amount_in)
     amount_out = usdc_base_to_human(tx.amount_out) if is_sol_to_usdc else lamports_to_sol(tx.amount_out)
     fee = lamports_to_sol(tx.fee) if tx.token_in == WSOL_MINT else usdc_base_to_human(tx.fee)
+    return round(amount_in, 9), round(amount_out, 9), round(fee, 9)
+
+
+def _tx_to_response(tx) -> TransactionResponse:
+    """Convert a Transaction model to response schema with human-readable amounts."""
+    amount_in, amount_out, fee = _human_amounts(tx)
 
     return TransactionResponse(
         id=tx.id,
         date=tx.date,
         type=tx.type,
-        amount_in=round(amount_in, 9),
-        amount_out=round(amount_out, 9),
+        amount_in=amount_in,
+        amount_out=amount_out,
         token_in=tx.token_in,
         token_out=tx.token_out,
         slippage_bps=tx.slippage_bps,
-        fee=round(fee, 9),
+        fee=fee,
         status=tx.status,
         signature=tx.signature,
         error_message=tx.error_message,
     )
 
 
+async def _csv_chunks(batches: AsyncIterator[list], compress: bool) -> AsyncIterator[bytes]:
+    """Render row batches as CSV, one (optionally gzipped) chunk per batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    compressor = zlib.compressobj(wbits=31) if compress else None
+
+    def drain() -> bytes:
+        data = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return compressor.compress(data) if compressor else data
+
+    writer.writerow(CSV_HEADER)
+    async for rows in batches:
+        for row in rows:
+            amount_in, amount_out, fee = _human_amounts(row)
+            writer.writerow([
+                row.date.isoformat(),
+                row.type,
+                amount_in,
+                amount_out,
+                row.slippage_bps,
+                fee,
+                row.status,
+                row.signature or "",
+            ])
+        chunk = drain()
+        if chunk:
+            yield chunk
+
+    chunk = drain()
+    if compressor:
+        chunk += compressor.flush()
+    if chunk:
+        yield chunk
+
+
+def _encode_cursor(tx) -> str:
+    raw = f"{tx.date.isoformat()}|{tx.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        date_str, tx_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(date_str), int(tx_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValidationError("Invalid pagination cursor")
+
+
 @router.get("", response_model=TransactionListResponse)
 async def list_transactions(
     wallet: str = Depends(get_current_user_wallet),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
     type: str | None = Query(None, description="Filter by type: SOL_TO_USDC or USDC_TO_SOL"),
     status: str | None = Query(None, description="Filter by status: confirmed, pending, failed"),
     date_from: datetime | None = Query(None, description="Filter from date"),
@@ -55,9 +119,41 @@ async def list_transactions(
     sort_dir: str = Query("desc", description="Sort direction: asc or desc"),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(
+        None, description="Keyset cursor from next_cursor; pass it empty for the first page"
+    ),
+    include_total: bool = Query(False, description="Also count all matches in cursor mode"),
 ) -> TransactionListResponse:
     tx_repo = TransactionRepository(db)
 
+    if cursor is not None:
+        if sort_by != "date":
+            raise ValidationError("Cursor pagination only supports sort_by=date")
+        transactions = await tx_repo.list_for_owner_after(
+            wallet,
+            type_filter=type,
+            status_filter=status,
+            date_from=date_from,
+            date_to=date_to,
+            sort_dir=sort_dir,
+            after=_decode_cursor(cursor) if cursor else None,
+            limit=page_size + 1,
+        )
+        has_more = len(transactions) > page_size
+        transactions = transactions[:page_size]
+        total = None
+        if include_total:
+            total = await tx_repo.count_for_owner(wallet, type, status, date_from, date_to)
+
+        return TransactionListResponse(
+            transactions=[_tx_to_response(tx) for tx in transactions],
+            pagination=CursorPaginationMeta(
+                page_size=page_size,
+                next_cursor=_encode_cursor(transactions[-1]) if has_more else None,
+                total=total,
+            ),
+        )
+
     transactions, total = await tx_repo.list_for_owner(
         wallet,
         type_filter=type,
@@ -86,44 +182,33 @@ async def list_transactions(
 @router.get("/export")
 async def export_transactions_csv(
     wallet: str = Depends(get_current_user_wallet),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
     type: str | None = Query(None),
     status: str | None = Query(None),
     date_from: datetime | None = Query(None),
     date_to: datetime | None = Query(None),
+    gzip: bool = Query(False, description="Return the CSV gzip-compressed"),
 ) -> StreamingResponse:
     tx_repo = TransactionRepository(db)
 
-    transactions, _ = await tx_repo.list_for_owner(
+    # The session stays open until the response has been sent, so rows are
+    # pulled from the database as the client consumes the stream
+    batches = tx_repo.stream_for_owner(
         wallet,
         type_filter=type,
         status_filter=status,
         date_from=date_from,
         date_to=date_to,
-        page=1,
-        page_size=10000,
     )
 
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(["Date", "Type", "Amount In", "Amount Out", "Slippage BPS", "Fee", "Status", "Signature"])
-
-    for tx in transactions:
-        resp = _tx_to_response(tx)
-        writer.writerow([
-            resp.date.isoformat(),
-            resp.type,
-            resp.amount_in,
-            resp.amount_out,
-            resp.slippage_bps,
-            resp.fee,
-            resp.status,
-            resp.signature or "",
-        ])
-
-    output.seek(0)
+    if gzip:
+        return StreamingResponse(
+            _csv_chunks(batches, compress=True),
+            media_type="application/gzip",
+            headers={"Content-Disposition": "attachment; filename=transactions.csv.gz"},
+        )
     return StreamingResponse(
-        iter([output.getvalue()]),
+        _csv_chunks(batches, compress=False),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=transactions.csv"},
     )
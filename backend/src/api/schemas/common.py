@@ -16,3 +16,9 @@ class PaginationMeta(BaseModel):
     page_size: int
     total: int
     total_pages: int
+
+
+class CursorPaginationMeta(BaseModel):
+    page_size: int
+    next_cursor: str | None
+    total: int | None = None
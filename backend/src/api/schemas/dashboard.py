@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+from src.api.schemas.pnl import PnlHistoryResponse
+from src.api.schemas.portfolio import PortfolioMetrics
+from src.api.schemas.strategy import StrategyStatus
+from src.api.schemas.vaults import VaultBalanceResponse
+
+
+class DashboardResponse(BaseModel):
+    portfolio: PortfolioMetrics
+    vaults: VaultBalanceResponse
+    strategy: StrategyStatus
+    pnl: PnlHistoryResponse
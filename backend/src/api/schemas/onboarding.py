@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+from src.api.schemas.settings import SettingsResponse
+from src.api.schemas.vaults import VaultBalanceResponse
+
+
+class OnboardingResponse(BaseModel):
+    created: bool
+    settings: SettingsResponse
+    vaults: VaultBalanceResponse
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pydantic import BaseModel, Field
 
 
@@ -11,3 +13,18 @@ class SignalResponse(BaseModel):
     signal_type: str
     status: str
     message: str
+
+
+class SignalLogEntry(BaseModel):
+    id: int
+    signal_type: str
+    status: str
+    received_at: datetime
+    processed_at: datetime | None
+    affected_users: int | None
+    end_to_end_ms: float | None
+    error_message: str | None
+
+
+class SignalHistoryResponse(BaseModel):
+    signals: list[SignalLogEntry]
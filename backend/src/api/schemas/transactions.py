@@ -2,7 +2,7 @@ from datetime import datetime
 
 from pydantic import BaseModel
 
-from src.api.schemas.common import PaginationMeta
+from src.api.schemas.common import CursorPaginationMeta, PaginationMeta
 
 
 class TransactionResponse(BaseModel):
@@ -22,4 +22,4 @@ class TransactionResponse(BaseModel):
 
 class TransactionListResponse(BaseModel):
     transactions: list[TransactionResponse]
-    pagination: PaginationMeta
+    pagination: PaginationMeta | CursorPaginationMeta
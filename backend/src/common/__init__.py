@@ -7,6 +7,7 @@ from .exceptions import (
     CooldownActiveError,
     DailyLimitExceededError,
     JupiterAPIError,
+    CircuitOpenError,
     SlippageExceededError,
 )
 
@@ -19,5 +20,6 @@ __all__ = [
     "CooldownActiveError",
     "DailyLimitExceededError",
     "JupiterAPIError",
+    "CircuitOpenError",
     "SlippageExceededError",
 ]
@@ -15,6 +15,9 @@ TX_CONFIRMED = "confirmed"
 TX_PENDING = "pending"
 TX_FAILED = "failed"
 
+# Execution outcome for users skipped before a transaction is created
+EXECUTION_SKIPPED = "skipped"
+
 # Signal log statuses
 SIGNAL_RECEIVED = "received"
 SIGNAL_PROCESSING = "processing"
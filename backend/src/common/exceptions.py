@@ -33,8 +33,15 @@ class DailyLimitExceededError(AppException):
 
 
 class JupiterAPIError(AppException):
-    def __init__(self, message: str = "Jupiter API error"):
+    def __init__(self, message: str = "Jupiter API error", upstream_status: int | None = None):
         super().__init__(message, status_code=502)
+        self.upstream_status = upstream_status
+
+
+class CircuitOpenError(JupiterAPIError):
+    def __init__(self, message: str = "Jupiter API circuit open"):
+        super().__init__(message)
+        self.status_code = 503
 
 
 class SlippageExceededError(AppException):
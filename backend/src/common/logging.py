@@ -1,38 +1,166 @@
+"""Logging setup shared by the API and the workers.
+
+Loggers created by ``setup_logger`` only hold a ``QueueHandler``: a log call
+formats its message and puts the record on an in-memory queue. A single
+``QueueListener`` thread per process writes records to the console and to a
+rotating file per logger, so no file I/O happens on the event loop.
+"""
+import atexit
+import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from src.config.settings import settings
 
+TEXT_FORMAT = "%(asctime)s | %(name)s | %(levelname)s | %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-def setup_logger(name: str) -> logging.Logger:
-    """Create a logger with rotating file handler for the given module name."""
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, settings.log_level.upper(), logging.INFO))
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+_file_router: "FileRouter | None" = None
 
-    if logger.handlers:
-        return logger
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, for log shippers."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class DebugSampler(logging.Filter):
+    """Keeps one in every N DEBUG records; records at INFO and above always pass."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.interval = max(1, round(1 / rate)) if rate > 0 else 0
+        self._seen = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        if self.interval == 0:
+            return False
+        self._seen += 1
+        return (self._seen - 1) % self.interval == 0
+
+
+class FileRouter(logging.Handler):
+    """Writes each record to the rotating file of the logger that created it."""
+
+    def __init__(self, log_dir: str, formatter: logging.Formatter):
+        super().__init__()
+        self.log_dir = log_dir
+        self.formatter = formatter
+        self._handlers: dict[str, RotatingFileHandler] = {}
+
+    def add_logger(self, name: str) -> None:
+        if name in self._handlers:
+            return
+        # File handler: 10MB max, 5 backups
+        handler = RotatingFileHandler(
+            os.path.join(self.log_dir, f"{name}.log"),
+            maxBytes=10 * 1024 * 1024,
+            backupCount=5,
+        )
+        handler.setFormatter(self.formatter)
+        self._handlers[name] = handler
+
+    def emit(self, record: logging.LogRecord) -> None:
+        handler = self._handlers.get(record.name.split(".", 1)[0])
+        if handler is not None:
+            handler.handle(record)
+
+    def close(self) -> None:
+        for handler in self._handlers.values():
+            handler.close()
+        super().close()
+
+
+class _RecordQueueHandler(QueueHandler):
+    """QueueHandler that merges args into the message but leaves formatting to the listener."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _start_listener() -> None:
+    global _listener, _queue_handler, _file_router
 
     log_dir = settings.log_dir
     os.makedirs(log_dir, exist_ok=True)
 
-    formatter = logging.Formatter(
-        "%(asctime)s | %(name)s | %(levelname)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    if settings.log_format == "json":
+        formatter: logging.Formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(TEXT_FORMAT, datefmt=DATE_FORMAT)
 
-    # File handler: 10MB max, 5 backups
-    file_handler = RotatingFileHandler(
-        os.path.join(log_dir, f"{name}.log"),
-        maxBytes=10 * 1024 * 1024,
-        backupCount=5,
-    )
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    _file_router = FileRouter(log_dir, formatter)
 
     # Console handler for development
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    _queue_handler = _RecordQueueHandler(queue.SimpleQueue())
+    _queue_handler.addFilter(DebugSampler(settings.log_debug_sample_rate))
+    _listener = QueueListener(_queue_handler.queue, console_handler, _file_router)
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """Write out queued records and stop the writer thread. Runs at interpreter exit."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+def _restart_in_child() -> None:
+    # A forked child (e.g. an RQ work horse) inherits the queue but not the writer thread
+    global _listener
+    if _listener is None:
+        return
+    _queue_handler.queue = queue.SimpleQueue()
+    _listener = QueueListener(_queue_handler.queue, *_listener.handlers)
+    _listener.start()
+
+
+atexit.register(stop_logging)
+os.register_at_fork(after_in_child=_restart_in_child)
+
+
+def setup_logger(name: str) -> logging.Logger:
+    """Return the logger for a module, writing to ``<log_dir>/<name>.log`` and the console."""
+    logger = logging.getLogger(name)
+    logger.setLevel(getattr(logging, settings.log_level.upper(), logging.INFO))
+
+    if logger.handlers:
+        return logger
+
+    if _queue_handler is None:
+        _start_listener()
+    _file_router.add_logger(name)
+    logger.addHandler(_queue_handler)
 
     return logger
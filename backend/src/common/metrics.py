@@ -0,0 +1,156 @@
+"""Prometheus metrics for the API, the RQ workers and Jupiter calls.
+
+All metrics live in the default registry. The API serves them at
+``/metrics``. Workers have no HTTP server, so they export after jobs
+through ``export_worker_metrics``: to a Pushgateway when
+``metrics_pushgateway_url`` is set, and/or to a node_exporter textfile
+when ``metrics_textfile_path`` is set.
+"""
+import os
+import socket
+import time
+
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram, push_to_gateway, write_to_textfile
+
+from src.common.logging import setup_logger
+from src.config.settings import settings
+
+logger = setup_logger("signals")
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "API request latency by route template",
+    ["method", "route", "status"],
+)
+
+SIGNAL_FANOUT_SECONDS = Histogram(
+    "signal_fanout_duration_seconds",
+    "Time to evaluate users and enqueue executions for one signal",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+SIGNAL_USERS = Counter(
+    "signal_users_total",
+    "Users evaluated during signal fan-out, by result",
+    ["result"],
+)
+SIGNAL_LAST_ELIGIBLE_USERS = Gauge(
+    "signal_last_eligible_users",
+    "Eligible users of the most recently processed signal",
+)
+
+EXECUTION_STAGE_SECONDS = Histogram(
+    "execution_stage_duration_seconds",
+    "Execution time per stage: quote, validate, build, commit",
+    ["stage"],
+)
+EXECUTIONS = Counter(
+    "executions_total",
+    "Per-user execution outcomes",
+    ["outcome"],
+)
+
+JUPITER_REQUEST_SECONDS = Histogram(
+    "jupiter_request_duration_seconds",
+    "Jupiter API call latency",
+    ["endpoint"],
+)
+JUPITER_ERRORS = Counter(
+    "jupiter_request_errors_total",
+    "Failed Jupiter API calls by reason (HTTP status, connection or circuit_open)",
+    ["endpoint", "reason"],
+)
+
+JUPITER_CIRCUIT_STATE = Gauge(
+    "jupiter_circuit_state",
+    "1 for the current Jupiter circuit breaker state (closed, open or half_open), 0 otherwise",
+    ["state"],
+)
+JUPITER_CIRCUIT_TRANSITIONS = Counter(
+    "jupiter_circuit_transitions_total",
+    "Jupiter circuit breaker state changes",
+    ["from_state", "to_state"],
+)
+JUPITER_CONCURRENCY_LIMIT = Gauge(
+    "jupiter_concurrency_limit",
+    "Current adaptive concurrency limit for Jupiter calls",
+)
+JUPITER_IN_FLIGHT = Gauge(
+    "jupiter_requests_in_flight",
+    "Jupiter calls holding a concurrency slot",
+)
+JUPITER_WAITING = Gauge(
+    "jupiter_requests_waiting",
+    "Jupiter calls waiting for a concurrency slot",
+)
+JUPITER_POOL_CONNECTIONS = Gauge(
+    "jupiter_pool_connections",
+    "Connections in the Jupiter HTTP pool: active, idle, and how many use HTTP/2",
+    ["state"],
+)
+
+QUOTE_CACHE_LOOKUPS = Counter(
+    "jupiter_quote_cache_lookups_total",
+    "Quote cache lookups by result: hit, miss or coalesced",
+    ["result"],
+)
+
+REPO_CACHE_LOOKUPS = Counter(
+    "repo_cache_lookups_total",
+    "Repository cache lookups by result: local_hit, hit, miss, stale or bypass",
+    ["entity", "result"],
+)
+REPO_CACHE_HIT_AGE_SECONDS = Histogram(
+    "repo_cache_hit_age_seconds",
+    "Age of cache entries when served",
+    ["entity"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+DB_READ_SESSIONS = Counter(
+    "db_read_sessions_total",
+    "Read-only sessions by target: replica, or primary when no replica is usable",
+    ["target"],
+)
+DB_REPLICA_LAG_SECONDS = Gauge(
+    "db_replica_lag_seconds",
+    "Replication lag measured by the replica lag guard",
+    ["replica"],
+)
+
+QUEUE_DEPTH = Gauge(
+    "rq_queue_depth",
+    "Jobs waiting in an RQ queue",
+    ["queue"],
+)
+
+_last_export = 0.0
+
+
+def export_worker_metrics(force: bool = False) -> None:
+    """Publish this worker's metrics, at most once per ``metrics_export_interval_seconds``.
+
+    Export failures are logged and never fail the job.
+    """
+    global _last_export
+    now = time.monotonic()
+    if not force and now - _last_export < settings.metrics_export_interval_seconds:
+        return
+    _last_export = now
+
+    instance = f"{socket.gethostname()}:{os.getpid()}"
+    if settings.metrics_pushgateway_url:
+        try:
+            push_to_gateway(
+                settings.metrics_pushgateway_url,
+                job="solanaswapdex_worker",
+                registry=REGISTRY,
+                grouping_key={"instance": instance},
+                timeout=2,
+            )
+        except Exception as e:
+            logger.warning("Metrics push failed: %s", str(e))
+    if settings.metrics_textfile_path:
+        try:
+            write_to_textfile(settings.metrics_textfile_path.format(pid=os.getpid()), REGISTRY)
+        except Exception as e:
+            logger.warning("Metrics textfile write failed: %s", str(e))
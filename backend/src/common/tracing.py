@@ -0,0 +1,116 @@
+"""OpenTelemetry tracing for the signal pipeline.
+
+A signal is traced from ``POST /api/signals`` through the signal worker to
+every execution job. The trace context travels in the ``trace`` entry of
+the RQ job meta (W3C ``traceparent``). Spans are recorded for each job,
+each SQL statement and each Jupiter call.
+
+``TRACING_EXPORTER`` selects where finished spans go: ``none`` (default,
+spans are not recorded), ``file`` (one JSON span per line in
+``TRACING_FILE``) or ``memory`` (kept in ``memory_exporter``, for tests and
+debugging).
+"""
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from opentelemetry import context as otel_context
+from opentelemetry import propagate, trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.config.settings import settings
+
+STATEMENT_MAX_LENGTH = 500
+
+memory_exporter: InMemorySpanExporter | None = None
+
+
+def setup_tracing() -> bool:
+    """Install the tracer provider configured by settings. Returns whether spans are recorded."""
+    global memory_exporter
+
+    exporter_name = settings.tracing_exporter
+    if exporter_name == "none":
+        return False
+
+    provider = TracerProvider(resource=Resource.create({"service.name": "solanaswapdex"}))
+    if exporter_name == "memory":
+        memory_exporter = InMemorySpanExporter()
+        provider.add_span_processor(SimpleSpanProcessor(memory_exporter))
+    else:
+        path = settings.tracing_file or os.path.join(settings.log_dir, "traces.jsonl")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        exporter = ConsoleSpanExporter(
+            out=open(path, "a"),
+            formatter=lambda span: span.to_json(indent=None) + "\n",
+        )
+        # Spans are written from a background thread, off the event loop
+        provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    return True
+
+
+tracing_enabled = setup_tracing()
+tracer = trace.get_tracer("solanaswapdex")
+
+
+def inject_trace_context() -> dict[str, str]:
+    """Current trace context as a carrier for RQ job meta."""
+    carrier: dict[str, str] = {}
+    propagate.inject(carrier)
+    return carrier
+
+
+@contextmanager
+def job_span(name: str, **attributes) -> Iterator[trace.Span]:
+    """Span for an RQ job, continuing the trace stored in the job's meta."""
+    from rq import get_current_job
+
+    job = get_current_job()
+    carrier = job.meta.get("trace", {}) if job is not None else {}
+    token = otel_context.attach(propagate.extract(carrier))
+    try:
+        with tracer.start_as_current_span(name, kind=trace.SpanKind.CONSUMER, attributes=attributes) as span:
+            yield span
+    finally:
+        otel_context.detach(token)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Record a span for every SQL statement run on ``engine``."""
+    if not tracing_enabled:
+        return
+    sync_engine = engine.sync_engine
+    system = sync_engine.dialect.name
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start_span(conn, cursor, statement, parameters, context, executemany):
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+        context._trace_span = tracer.start_span(
+            f"db {operation}",
+            kind=trace.SpanKind.CLIENT,
+            attributes={
+                "db.system": system,
+                "db.statement": statement[:STATEMENT_MAX_LENGTH],
+                "db.executemany": executemany,
+            },
+        )
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _end_span(conn, cursor, statement, parameters, context, executemany):
+        span = getattr(context, "_trace_span", None)
+        if span is not None:
+            span.end()
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _fail_span(exception_context):
+        span = getattr(exception_context.execution_context, "_trace_span", None)
+        if span is not None:
+            span.record_exception(exception_context.original_exception)
+            span.set_status(trace.StatusCode.ERROR)
+            span.end()
@@ -1,4 +1,4 @@
 from .base import Base, engine, async_session_factory
-from .session import get_db
+from .session import get_db, get_read_db, read_session
 
-__all__ = ["Base", "engine", "async_session_factory", "get_db"]
+__all__ = ["Base", "engine", "async_session_factory", "get_db", "get_read_db", "read_session"]
@@ -0,0 +1,45 @@
+"""Backfill execution counters from the transactions table.
+
+Run once before the counter-based execution limit goes live, with the
+execution workers stopped, since the rebuild replaces every counter:
+
+    python -m src.db.backfill_execution_counters
+"""
+import argparse
+import asyncio
+from datetime import date
+
+from sqlalchemy import func, select
+
+from src.common.logging import setup_logger
+from src.db.base import async_session_factory
+from src.db.models.execution_counter import ExecutionCounter
+from src.db.repositories.execution_counter_repo import ExecutionCounterRepository
+
+logger = setup_logger("signals")
+
+
+async def backfill(today: date | None = None) -> int:
+    """Rebuild every execution counter in one transaction. Returns the number of owners counted."""
+    async with async_session_factory() as session:
+        await ExecutionCounterRepository(session).rebuild(today=today)
+        await session.commit()
+        owners = (await session.execute(select(func.count()).select_from(ExecutionCounter))).scalar_one()
+    logger.info("Execution counters rebuilt for %d owners", owners)
+    return owners
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild execution counters from the transactions table")
+    parser.add_argument(
+        "--today",
+        type=date.fromisoformat,
+        default=None,
+        help="UTC day the daily counts are taken for (default: today)",
+    )
+    args = parser.parse_args()
+    asyncio.run(backfill(args.today))
+
+
+if __name__ == "__main__":
+    main()
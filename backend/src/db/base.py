@@ -1,9 +1,11 @@
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
+from src.common.tracing import instrument_engine
 from src.config.settings import settings
 
 engine = create_async_engine(settings.database_url, echo=False)
+instrument_engine(engine)
 async_session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
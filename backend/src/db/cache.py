@@ -0,0 +1,305 @@
+"""Read-through cache for hot single-row repository lookups.
+
+``UserRepository.get_by_owner`` and ``VaultRepository.get_by_owner`` go
+through ``repo_cache``. Entries live in Redis for ``repo_cache_ttl_seconds``,
+optionally fronted by a small in-process LRU (``repo_cache_local_size``).
+
+Every cached row has a version token in Redis. An entry is stored with
+the version read *before* the database query and only served while that
+version is current. Writes through the repositories mark the row dirty on
+the session. Later reads in the same session bypass the cache, and the
+version is bumped once the transaction commits. So a reader that raced
+the write can never re-publish the old row. Rows read from a replica are
+served but never cached, for the same reason. The in-process tier is not
+version checked: rows changed by other processes can be served for up to
+``repo_cache_local_ttl_seconds``.
+
+Disabled unless ``REPO_CACHE_BACKEND=redis``. Redis errors fail open to the
+database.
+"""
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime
+from typing import TypeVar
+
+import redis.asyncio as aioredis
+from sqlalchemy import DateTime, event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.util import await_only
+
+from src.common.logging import setup_logger
+from src.common.metrics import REPO_CACHE_HIT_AGE_SECONDS, REPO_CACHE_LOOKUPS
+from src.config.settings import settings
+from src.db.models.user_profile import UserProfile
+from src.db.models.vault_balance import VaultBalance
+from src.db.replicas import REPLICA_SESSION_KEY
+
+logger = setup_logger("api")
+
+M = TypeVar("M")
+
+DIRTY_KEY = "repo_cache_dirty"
+
+
+class LocalLRU:
+    """Bounded in-process tier with per-entry expiry."""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    def get(self, key: str) -> dict | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: dict) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class RepositoryCache:
+    """Versioned read-through cache of ORM rows keyed by entity and owner."""
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        ttl_seconds: float,
+        local: LocalLRU | None = None,
+        prefix: str = "repo:",
+    ):
+        self._redis = redis_client
+        self.ttl_ms = max(1, int(ttl_seconds * 1000))
+        self.local = local
+        self.prefix = prefix
+        self._entities: dict[type, str] = {}
+        self.hits = 0
+        self.local_hits = 0
+        self.misses = 0
+        self.stale = 0  # misses that found an outdated entry
+        self.bypassed = 0
+        self.errors = 0
+
+    def register(self, model: type, entity: str) -> None:
+        """Track ORM flushes of ``model`` rows so direct attribute changes also invalidate."""
+        self._entities[model] = entity
+
+    def _key(self, entity: str, owner: str) -> str:
+        return f"{self.prefix}{entity}:{owner}"
+
+    @staticmethod
+    def _dirty(session: Session) -> set[tuple[str, str]]:
+        return session.info.setdefault(DIRTY_KEY, set())
+
+    @staticmethod
+    def _dump(obj) -> dict:
+        return {
+            attr.key: value.isoformat() if isinstance(value, datetime) else value
+            for attr in inspect(type(obj)).column_attrs
+            for value in (getattr(obj, attr.key),)
+        }
+
+    @staticmethod
+    def _attach(session: AsyncSession, model: type[M], data: dict) -> M:
+        """Turn cached column values into a persistent instance of ``session`` without SQL."""
+        mapper = inspect(model)
+        pk = tuple(data[column.key] for column in mapper.primary_key)
+        existing = session.identity_map.get(identity_key(model, pk))
+        if existing is not None:
+            return existing
+
+        values = dict(data)
+        for attr in mapper.column_attrs:
+            if isinstance(attr.columns[0].type, DateTime) and values.get(attr.key) is not None:
+                values[attr.key] = datetime.fromisoformat(values[attr.key])
+        obj = model(**values)
+        make_transient_to_detached(obj)
+        return session.sync_session.merge(obj, load=False)
+
+    async def get(
+        self,
+        session: AsyncSession,
+        entity: str,
+        owner: str,
+        model: type[M],
+        load: Callable[[], Awaitable[M | None]],
+    ) -> M | None:
+        """Return the row for ``owner`` from the cache, or ``load()`` it and cache it."""
+        if (entity, owner) in self._dirty(session.sync_session):
+            # Uncommitted writes in this session are only visible in the database
+            self.bypassed += 1
+            REPO_CACHE_LOOKUPS.labels(entity, "bypass").inc()
+            return await load()
+
+        key = self._key(entity, owner)
+        if self.local is not None:
+            entry = self.local.get(key)
+            if entry is not None:
+                self.local_hits += 1
+                REPO_CACHE_LOOKUPS.labels(entity, "local_hit").inc()
+                REPO_CACHE_HIT_AGE_SECONDS.labels(entity).observe(time.time() - entry["t"])
+                return self._attach(session, model, entry["d"])
+
+        version = "0"
+        result = "miss"
+        try:
+            raw, raw_version = await self._redis.mget(key, key + ":v")
+            if raw_version is not None:
+                version = raw_version.decode()
+            if raw is not None:
+                entry = json.loads(raw)
+                if entry["v"] == version:
+                    self.hits += 1
+                    REPO_CACHE_LOOKUPS.labels(entity, "hit").inc()
+                    REPO_CACHE_HIT_AGE_SECONDS.labels(entity).observe(time.time() - entry["t"])
+                    if self.local is not None:
+                        self.local.set(key, entry)
+                    return self._attach(session, model, entry["d"])
+                # Written before the row's latest committed change
+                self.stale += 1
+                result = "stale"
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Repository cache unavailable: %s", str(e))
+            return await load()
+
+        self.misses += 1
+        REPO_CACHE_LOOKUPS.labels(entity, result).inc()
+        obj = await load()
+        # A lagging replica could return a row older than the version just read
+        if obj is not None and not session.info.get(REPLICA_SESSION_KEY):
+            entry = {"v": version, "t": time.time(), "d": self._dump(obj)}
+            try:
+                await self._redis.set(key, json.dumps(entry), px=self.ttl_ms)
+            except Exception as e:
+                self.errors += 1
+                logger.warning("Repository cache unavailable: %s", str(e))
+            if self.local is not None:
+                self.local.set(key, entry)
+        return obj
+
+    def invalidate(self, session: AsyncSession, entity: str, owners: Iterable[str]) -> None:
+        """Mark rows written in ``session``; their versions are bumped when it commits."""
+        dirty = self._dirty(session.sync_session)
+        for owner in owners:
+            dirty.add((entity, owner))
+            if self.local is not None:
+                self.local.discard(self._key(entity, owner))
+
+    async def bump(self, rows: Iterable[tuple[str, str]]) -> None:
+        """Give the rows a new version, invalidating every cached entry for them."""
+        keys = [self._key(entity, owner) for entity, owner in rows]
+        if self.local is not None:
+            for key in keys:
+                self.local.discard(key)
+        # A fresh token rather than INCR: once an expired version key is
+        # recreated it can never match an entry written under an older one
+        token = str(time.time_ns())
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.set(key + ":v", token, px=self.ttl_ms * 10)
+                await pipe.execute()
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Repository cache invalidation failed: %s", str(e))
+
+    def _after_flush(self, session: Session, flush_context) -> None:
+        for obj in (*session.new, *session.dirty, *session.deleted):
+            entity = self._entities.get(type(obj))
+            if entity is not None:
+                self._dirty(session).add((entity, obj.owner))
+
+    def _after_commit(self, session: Session) -> None:
+        dirty = session.info.pop(DIRTY_KEY, None)
+        if not dirty:
+            return
+        try:
+            # Runs inside AsyncSession.commit(), so the bump completes before commit() returns
+            await_only(self.bump(dirty))
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Repository cache invalidation failed: %s", str(e))
+
+    @staticmethod
+    def _after_rollback(session: Session) -> None:
+        session.info.pop(DIRTY_KEY, None)
+
+    def listen(self) -> None:
+        event.listen(Session, "after_flush", self._after_flush)
+        event.listen(Session, "after_commit", self._after_commit)
+        event.listen(Session, "after_rollback", self._after_rollback)
+
+    def unlisten(self) -> None:
+        event.remove(Session, "after_flush", self._after_flush)
+        event.remove(Session, "after_commit", self._after_commit)
+        event.remove(Session, "after_rollback", self._after_rollback)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.local_hits + self.misses
+        return {
+            "hits": self.hits,
+            "local_hits": self.local_hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "bypassed": self.bypassed,
+            "errors": self.errors,
+            "hit_ratio": (self.hits + self.local_hits) / lookups if lookups else 0.0,
+        }
+
+
+def create_repo_cache() -> RepositoryCache | None:
+    """Build the repository cache configured by settings, or None when disabled."""
+    if settings.repo_cache_backend == "none":
+        return None
+    if settings.repo_cache_backend != "redis":
+        logger.warning("Unknown repository cache backend %r, caching disabled", settings.repo_cache_backend)
+        return None
+    local = None
+    if settings.repo_cache_local_size > 0:
+        local = LocalLRU(settings.repo_cache_local_size, settings.repo_cache_local_ttl_seconds)
+    cache = RepositoryCache(aioredis.from_url(settings.redis_url), settings.repo_cache_ttl_seconds, local)
+    cache.register(UserProfile, "user")
+    cache.register(VaultBalance, "vault")
+    cache.listen()
+    return cache
+
+
+repo_cache = create_repo_cache()
+
+
+async def cached_get(
+    session: AsyncSession,
+    entity: str,
+    owner: str,
+    model: type[M],
+    load: Callable[[], Awaitable[M | None]],
+) -> M | None:
+    """``repo_cache.get`` when the cache is enabled, otherwise just ``load()``."""
+    if repo_cache is None:
+        return await load()
+    return await repo_cache.get(session, entity, owner, model, load)
+
+
+def invalidate_cached(session: AsyncSession, entity: str, owners: Iterable[str]) -> None:
+    if repo_cache is not None:
+        repo_cache.invalidate(session, entity, owners)
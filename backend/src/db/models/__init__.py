@@ -3,5 +3,6 @@ from .vault_balance import VaultBalance
 from .transaction import Transaction
 from .pnl_snapshot import PnlSnapshot
 from .signal_log import SignalLog
+from .execution_counter import ExecutionCounter
 
-__all__ = ["UserProfile", "VaultBalance", "Transaction", "PnlSnapshot", "SignalLog"]
+__all__ = ["UserProfile", "VaultBalance", "Transaction", "PnlSnapshot", "SignalLog", "ExecutionCounter"]
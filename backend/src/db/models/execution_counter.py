@@ -0,0 +1,27 @@
+from datetime import date, datetime
+
+from sqlalchemy import BigInteger, Date, ForeignKey, Integer, String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+
+from src.db.base import Base
+
+
+class ExecutionCounter(Base):
+    """Per-owner transaction counts, maintained on every transaction insert."""
+
+    __tablename__ = "execution_counters"
+
+    owner: Mapped[str] = mapped_column(String(44), ForeignKey("user_profiles.owner"), primary_key=True)
+    total_count: Mapped[int] = mapped_column(BigInteger, default=0)
+    # UTC day that day_count refers to
+    day: Mapped[date] = mapped_column(Date)
+    day_count: Mapped[int] = mapped_column(Integer, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    profile: Mapped["UserProfile"] = relationship(back_populates="execution_counter")  # noqa: F821
+
+    def daily_count(self, on: date) -> int:
+        return self.day_count if self.day == on else 0
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Integer, String, DateTime, Text, JSON
+from sqlalchemy import Float, Integer, String, DateTime, Text, JSON
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -18,3 +18,7 @@ class SignalLog(Base):
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     affected_users: Mapped[int | None] = mapped_column(Integer, nullable=True)
     metadata_: Mapped[dict | None] = mapped_column("metadata", JSON, nullable=True)
+    trace_id: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    # From received_at to the end of the last execution job, and the longest execution job
+    end_to_end_ms: Mapped[float | None] = mapped_column(Float, nullable=True)
+    slowest_execution_ms: Mapped[float | None] = mapped_column(Float, nullable=True)
@@ -43,3 +43,4 @@ class UserProfile(Base):
     vault_balance: Mapped["VaultBalance"] = relationship(back_populates="profile")  # noqa: F821
     transactions: Mapped[list["Transaction"]] = relationship(back_populates="profile")  # noqa: F821
     pnl_snapshots: Mapped[list["PnlSnapshot"]] = relationship(back_populates="profile")  # noqa: F821
+    execution_counter: Mapped["ExecutionCounter | None"] = relationship(back_populates="profile")  # noqa: F821
@@ -0,0 +1,106 @@
+"""Routing of read-only sessions to database replicas.
+
+Read-only API routes take their session from ``get_read_db``. When
+``database_replica_urls`` is set, each of those sessions goes to a
+replica in round-robin order. Writes and the workers always use the
+primary.
+
+Each replica's lag is checked at most every
+``database_replica_lag_check_seconds``. A replica that is further behind than
+``database_replica_max_lag_seconds``, or that cannot be reached, is skipped
+until its next check. When no replica is usable, reads go to the primary.
+"""
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from src.common.logging import setup_logger
+from src.common.metrics import DB_REPLICA_LAG_SECONDS
+from src.common.tracing import instrument_engine
+from src.config.settings import settings
+
+logger = setup_logger("api")
+
+# Set in the info of sessions bound to a replica
+REPLICA_SESSION_KEY = "replica"
+
+# Zero on a primary, or on a replica that has replayed everything it received;
+# otherwise the age of the last replayed transaction
+PG_LAG_QUERY = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+    " END"
+)
+
+
+class ReplicaRouter:
+    """Round-robin choice of replica, skipping those behind the lag limit."""
+
+    def __init__(self, engines: list[AsyncEngine], max_lag_seconds: float, check_interval_seconds: float):
+        self.engines = engines
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._factories = [
+            async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False) for engine in engines
+        ]
+        self._lag: list[float | None] = [None] * len(engines)  # None until measured or when unreachable
+        self._checked_at = [float("-inf")] * len(engines)
+        self._next = 0
+
+    @staticmethod
+    async def measure_lag(engine: AsyncEngine) -> float:
+        async with engine.connect() as conn:
+            if conn.dialect.name != "postgresql":
+                return 0.0
+            lag = (await conn.execute(PG_LAG_QUERY)).scalar()
+            return float(lag or 0.0)
+
+    async def _check(self, index: int) -> None:
+        # Claimed before the query so concurrent requests do not all check at once
+        self._checked_at[index] = time.monotonic()
+        try:
+            lag = await self.measure_lag(self.engines[index])
+        except Exception as e:
+            self._lag[index] = None
+            logger.warning("Replica %d unreachable, reading from other databases: %s", index, str(e))
+            return
+        self._lag[index] = lag
+        DB_REPLICA_LAG_SECONDS.labels(str(index)).set(lag)
+        if lag > self.max_lag_seconds:
+            logger.warning("Replica %d is %.1fs behind, skipping it", index, lag)
+
+    async def pick(self) -> async_sessionmaker[AsyncSession] | None:
+        """Session factory of the next usable replica, or None to read from the primary."""
+        count = len(self.engines)
+        for offset in range(count):
+            index = (self._next + offset) % count
+            if time.monotonic() - self._checked_at[index] >= self.check_interval_seconds:
+                await self._check(index)
+            lag = self._lag[index]
+            if lag is not None and lag <= self.max_lag_seconds:
+                self._next = index + 1
+                return self._factories[index]
+        return None
+
+    async def dispose(self) -> None:
+        for engine in self.engines:
+            await engine.dispose()
+
+
+def create_replica_router() -> ReplicaRouter:
+    engines = []
+    for url in settings.database_replica_urls:
+        engine = create_async_engine(url, echo=False)
+        instrument_engine(engine)
+        engines.append(engine)
+    return ReplicaRouter(
+        engines,
+        settings.database_replica_max_lag_seconds,
+        settings.database_replica_lag_check_seconds,
+    )
+
+
+replica_router = create_replica_router()
@@ -3,6 +3,7 @@ from .vault_repo import VaultRepository
 from .transaction_repo import TransactionRepository
 from .pnl_repo import PnlRepository
 from .signal_repo import SignalRepository
+from .execution_counter_repo import ExecutionCounterRepository
 
 __all__ = [
     "UserRepository",
@@ -10,4 +11,5 @@ __all__ = [
     "TransactionRepository",
     "PnlRepository",
     "SignalRepository",
+    "ExecutionCounterRepository",
 ]
@@ -0,0 +1,98 @@
+from collections import Counter
+from datetime import date, datetime, timezone
+
+from sqlalchemy import case, delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.settings import settings
+from src.db.models.execution_counter import ExecutionCounter
+from src.db.models.transaction import Transaction
+
+
+def utc_day(moment: datetime) -> date:
+    """UTC calendar day of a timestamp; naive timestamps are taken as UTC."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.date()
+
+
+class ExecutionCounterRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_by_owner(self, owner: str) -> ExecutionCounter | None:
+        result = await self.session.execute(
+            select(ExecutionCounter).where(ExecutionCounter.owner == owner)
+        )
+        return result.scalar_one_or_none()
+
+    def _upsert(self, rows: list[dict]):
+        dialect = self.session.bind.dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(ExecutionCounter).values(rows)
+        excluded = stmt.excluded
+        return stmt.on_conflict_do_update(
+            index_elements=[ExecutionCounter.owner],
+            set_={
+                "total_count": ExecutionCounter.total_count + excluded.total_count,
+                # A newer day restarts the daily count; late rows for a past day leave it alone
+                "day_count": case(
+                    (ExecutionCounter.day == excluded.day, ExecutionCounter.day_count + excluded.day_count),
+                    (ExecutionCounter.day < excluded.day, excluded.day_count),
+                    else_=ExecutionCounter.day_count,
+                ),
+                "day": case(
+                    (ExecutionCounter.day < excluded.day, excluded.day),
+                    else_=ExecutionCounter.day,
+                ),
+                "updated_at": func.now(),
+            },
+        )
+
+    async def increment(self, executions: list[tuple[str, datetime]]) -> None:
+        """Count new transactions, given as (owner, transaction date) pairs.
+
+        Runs in the caller's transaction, so counters commit or roll back
+        together with the rows they count.
+        """
+        pending = Counter((owner, utc_day(moment)) for owner, moment in executions)
+
+        # An upsert may touch each owner only once, so spread multi-day owners over rounds
+        while pending:
+            batch: dict[str, dict] = {}
+            for (owner, day), count in sorted(pending.items(), key=lambda item: item[0][1]):
+                if owner not in batch:
+                    batch[owner] = {"owner": owner, "total_count": count, "day": day, "day_count": count}
+                    del pending[(owner, day)]
+
+            rows = list(batch.values())
+            chunk_size = settings.db_bulk_chunk_size
+            for start in range(0, len(rows), chunk_size):
+                await self.session.execute(self._upsert(rows[start:start + chunk_size]))
+
+    async def rebuild(self, today: date | None = None) -> None:
+        """Recompute all counters from the transactions table.
+
+        Used to backfill counters for transactions created before they existed;
+        see ``src.db.backfill_execution_counters``.
+        """
+        today = today or datetime.now(timezone.utc).date()
+        today_start = datetime(today.year, today.month, today.day, tzinfo=timezone.utc)
+
+        await self.session.execute(delete(ExecutionCounter))
+        result = await self.session.execute(
+            select(
+                Transaction.owner,
+                func.count(),
+                func.count().filter(Transaction.date >= today_start),
+            ).group_by(Transaction.owner)
+        )
+        rows = [
+            {"owner": owner, "total_count": total, "day": today, "day_count": daily}
+            for owner, total, daily in result.all()
+        ]
+        chunk_size = settings.db_bulk_chunk_size
+        for start in range(0, len(rows), chunk_size):
+            await self.session.execute(self._upsert(rows[start:start + chunk_size]))
+        await self.session.flush()
@@ -1,8 +1,9 @@
 from datetime import date, timedelta
 
-from sqlalchemy import select, desc
+from sqlalchemy import and_, desc, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config.settings import settings
 from src.db.models.pnl_snapshot import PnlSnapshot
 
 
@@ -10,12 +11,22 @@ class PnlRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def create(self, **kwargs) -> PnlSnapshot:
-        snapshot = PnlSnapshot(**kwargs)
+    async def create(self, *, sol_price: float, **kwargs) -> PnlSnapshot:
+        """Create a snapshot valued at ``sol_price``, resolved by the caller."""
+        snapshot = PnlSnapshot(sol_price=sol_price, **kwargs)
         self.session.add(snapshot)
         await self.session.flush()
         return snapshot
 
+    async def bulk_create(self, rows: list[dict], *, sol_price: float) -> None:
+        """Insert many snapshots valued at ``sol_price``, one multi-row INSERT per chunk."""
+        chunk_size = settings.db_bulk_chunk_size
+        for start in range(0, len(rows), chunk_size):
+            await self.session.execute(
+                insert(PnlSnapshot),
+                [{**row, "sol_price": sol_price} for row in rows[start:start + chunk_size]],
+            )
+
     async def get_latest(self, owner: str) -> PnlSnapshot | None:
         result = await self.session.execute(
             select(PnlSnapshot)
@@ -25,6 +36,25 @@ class PnlRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_latest_by_owners(self, owners: list[str], on_or_before: date) -> dict[str, PnlSnapshot]:
+        """Latest snapshot of each owner dated ``on_or_before`` or earlier."""
+        latest: dict[str, PnlSnapshot] = {}
+        chunk_size = settings.db_bulk_chunk_size
+        for start in range(0, len(owners), chunk_size):
+            newest = (
+                select(PnlSnapshot.owner, func.max(PnlSnapshot.date).label("date"))
+                .where(PnlSnapshot.owner.in_(owners[start:start + chunk_size]), PnlSnapshot.date <= on_or_before)
+                .group_by(PnlSnapshot.owner)
+                .subquery()
+            )
+            result = await self.session.execute(
+                select(PnlSnapshot).join(
+                    newest, and_(PnlSnapshot.owner == newest.c.owner, PnlSnapshot.date == newest.c.date)
+                )
+            )
+            latest.update({snapshot.owner: snapshot for snapshot in result.scalars()})
+        return latest
+
     async def get_history(
         self, owner: str, days: int | None = None
     ) -> list[PnlSnapshot]:
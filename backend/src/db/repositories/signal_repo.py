@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import select, update, desc
+from sqlalchemy import desc, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models.signal_log import SignalLog
@@ -43,6 +43,25 @@ class SignalRepository:
         )
         await self.session.flush()
 
+    def _ms_since_received(self):
+        # Measured by the database clock, like received_at itself
+        if self.session.bind.dialect.name == "postgresql":
+            return func.extract("epoch", func.clock_timestamp() - SignalLog.received_at) * 1000
+        return (func.julianday("now") - func.julianday(SignalLog.received_at)) * 86_400_000
+
+    async def record_latency(self, log_id: int, slowest_execution_ms: float) -> None:
+        """Store the latency figures of a signal whose executions all finished.
+
+        ``end_to_end_ms`` is the time from receipt until now, on the database
+        clock, so this is called once, by the last execution job to finish.
+        """
+        await self.session.execute(
+            update(SignalLog)
+            .where(SignalLog.id == log_id)
+            .values(end_to_end_ms=self._ms_since_received(), slowest_execution_ms=slowest_execution_ms)
+        )
+        await self.session.flush()
+
     async def get_recent(self, limit: int = 20) -> list[SignalLog]:
         result = await self.session.execute(
             select(SignalLog).order_by(desc(SignalLog.received_at)).limit(limit)
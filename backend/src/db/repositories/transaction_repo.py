@@ -1,9 +1,13 @@
+from collections.abc import AsyncIterator
 from datetime import datetime
 
-from sqlalchemy import select, func, desc, asc
+from sqlalchemy import select, func, desc, asc, case, insert, tuple_, update, Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.common.constants import SIGNAL_SOL_TO_USDC, TX_CONFIRMED
+from src.config.settings import settings
 from src.db.models.transaction import Transaction
+from src.db.repositories.execution_counter_repo import ExecutionCounterRepository
 
 
 class TransactionRepository:
@@ -14,8 +18,28 @@ class TransactionRepository:
         tx = Transaction(**kwargs)
         self.session.add(tx)
         await self.session.flush()
+        await ExecutionCounterRepository(self.session).increment([(tx.owner, tx.date)])
         return tx
 
+    async def bulk_create(self, rows: list[dict]) -> list[Transaction]:
+        """Insert many transactions, one multi-row INSERT ... RETURNING per chunk.
+
+        Returns the created transactions in the order of ``rows``. Execution
+        counters are updated in the same transaction, as in ``create``.
+        """
+        txs: list[Transaction] = []
+        chunk_size = settings.db_bulk_chunk_size
+        for start in range(0, len(rows), chunk_size):
+            result = await self.session.scalars(
+                insert(Transaction).returning(Transaction, sort_by_parameter_order=True),
+                rows[start:start + chunk_size],
+            )
+            txs.extend(result.all())
+        await ExecutionCounterRepository(self.session).increment(
+            [(row["owner"], row["date"]) for row in rows]
+        )
+        return txs
+
     async def get_by_id(self, tx_id: int) -> Transaction | None:
         result = await self.session.execute(
             select(Transaction).where(Transaction.id == tx_id)
@@ -28,6 +52,26 @@ class TransactionRepository:
         )
         return result.scalar_one_or_none()
 
+    @staticmethod
+    def _apply_filters(
+        query,
+        owner: str,
+        type_filter: str | None,
+        status_filter: str | None,
+        date_from: datetime | None,
+        date_to: datetime | None,
+    ):
+        query = query.where(Transaction.owner == owner)
+        if type_filter:
+            query = query.where(Transaction.type == type_filter)
+        if status_filter:
+            query = query.where(Transaction.status == status_filter)
+        if date_from:
+            query = query.where(Transaction.date >= date_from)
+        if date_to:
+            query = query.where(Transaction.date <= date_to)
+        return query
+
     async def list_for_owner(
         self,
         owner: str,
@@ -41,21 +85,8 @@ class TransactionRepository:
         page: int = 1,
         page_size: int = 10,
     ) -> tuple[list[Transaction], int]:
-        query = select(Transaction).where(Transaction.owner == owner)
-        count_query = select(func.count()).select_from(Transaction).where(Transaction.owner == owner)
-
-        if type_filter:
-            query = query.where(Transaction.type == type_filter)
-            count_query = count_query.where(Transaction.type == type_filter)
-        if status_filter:
-            query = query.where(Transaction.status == status_filter)
-            count_query = count_query.where(Transaction.status == status_filter)
-        if date_from:
-            query = query.where(Transaction.date >= date_from)
-            count_query = count_query.where(Transaction.date >= date_from)
-        if date_to:
-            query = query.where(Transaction.date <= date_to)
-            count_query = count_query.where(Transaction.date <= date_to)
+        filters = (owner, type_filter, status_filter, date_from, date_to)
+        query = self._apply_filters(select(Transaction), *filters)
 
         # Sorting
         sort_column = getattr(Transaction, sort_by, Transaction.date)
@@ -67,9 +98,121 @@ class TransactionRepository:
         query = query.offset(offset).limit(page_size)
 
         result = await self.session.execute(query)
-        total_result = await self.session.execute(count_query)
+        total = await self.count_for_owner(*filters)
+
+        return list(result.scalars().all()), total
+
+    async def list_for_owner_after(
+        self,
+        owner: str,
+        *,
+        type_filter: str | None = None,
+        status_filter: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        sort_dir: str = "desc",
+        after: tuple[datetime, int] | None = None,
+        limit: int = 10,
+    ) -> list[Transaction]:
+        """Keyset page of transactions ordered by (date, id).
+
+        ``after`` is the (date, id) of the last row of the previous page. The
+        scan starts right after it on ``ix_transactions_owner_date`` instead
+        of skipping over an offset, so deep pages cost the same as the first.
+        """
+        query = self._apply_filters(
+            select(Transaction), owner, type_filter, status_filter, date_from, date_to
+        )
+        key = tuple_(Transaction.date, Transaction.id)
+        if sort_dir == "desc":
+            if after is not None:
+                query = query.where(key < tuple_(*after))
+            query = query.order_by(desc(Transaction.date), desc(Transaction.id))
+        else:
+            if after is not None:
+                query = query.where(key > tuple_(*after))
+            query = query.order_by(asc(Transaction.date), asc(Transaction.id))
+
+        result = await self.session.execute(query.limit(limit))
+        return list(result.scalars().all())
+
+    async def stream_for_owner(
+        self,
+        owner: str,
+        *,
+        type_filter: str | None = None,
+        status_filter: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[Row]]:
+        """Stream plain column rows newest first, ``batch_size`` rows at a time.
 
-        return list(result.scalars().all()), total_result.scalar_one()
+        Rows come from a server-side cursor and skip ORM object construction,
+        so memory stays flat regardless of how many transactions match.
+        """
+        query = self._apply_filters(
+            select(
+                Transaction.date,
+                Transaction.type,
+                Transaction.amount_in,
+                Transaction.amount_out,
+                Transaction.token_in,
+                Transaction.slippage_bps,
+                Transaction.fee,
+                Transaction.status,
+                Transaction.signature,
+            ),
+            owner,
+            type_filter,
+            status_filter,
+            date_from,
+            date_to,
+        ).order_by(desc(Transaction.date), desc(Transaction.id))
+
+        result = await self.session.stream(query.execution_options(yield_per=batch_size))
+        async for rows in result.partitions():
+            yield rows
+
+    async def count_for_owner(
+        self,
+        owner: str,
+        type_filter: str | None = None,
+        status_filter: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> int:
+        count_query = self._apply_filters(
+            select(func.count()).select_from(Transaction),
+            owner,
+            type_filter,
+            status_filter,
+            date_from,
+            date_to,
+        )
+        result = await self.session.execute(count_query)
+        return result.scalar_one()
+
+    async def net_flows_by_owner(self, date_from: datetime, date_to: datetime) -> dict[str, tuple[int, int]]:
+        """Net (lamports, USDC base units) each owner gained from confirmed swaps in ``[date_from, date_to)``.
+
+        Fees are charged to the SOL side. Owners without swaps are absent.
+        """
+        sol_to_usdc = Transaction.type == SIGNAL_SOL_TO_USDC
+        result = await self.session.execute(
+            select(
+                Transaction.owner,
+                func.sum(case((sol_to_usdc, -Transaction.amount_in), else_=Transaction.amount_out) - Transaction.fee),
+                func.sum(case((sol_to_usdc, Transaction.amount_out), else_=-Transaction.amount_in)),
+            )
+            .where(
+                Transaction.status == TX_CONFIRMED,
+                Transaction.date >= date_from,
+                Transaction.date < date_to,
+            )
+            .group_by(Transaction.owner)
+        )
+        return {owner: (int(sol), int(usdc)) for owner, sol, usdc in result.all()}
 
     async def update_status(self, tx_id: int, status: str, signature: str | None = None, error_message: str | None = None) -> None:
         tx = await self.get_by_id(tx_id)
@@ -80,3 +223,38 @@ class TransactionRepository:
             if error_message:
                 tx.error_message = error_message
             await self.session.flush()
+
+    async def bulk_update_status(
+        self,
+        tx_ids: list[int],
+        status: str,
+        *,
+        amounts_out: list[int] | None = None,
+        error_message: str | None = None,
+    ) -> None:
+        """Set the status of many transactions.
+
+        Without ``amounts_out`` each chunk is a single ``UPDATE ... WHERE id IN``;
+        with it, every transaction also gets its own ``amount_out`` through one
+        executemany per chunk.
+        """
+        values = {"status": status}
+        if error_message:
+            values["error_message"] = error_message
+
+        chunk_size = settings.db_bulk_chunk_size
+        for start in range(0, len(tx_ids), chunk_size):
+            chunk = tx_ids[start:start + chunk_size]
+            if amounts_out is None:
+                await self.session.execute(
+                    update(Transaction).where(Transaction.id.in_(chunk)).values(**values)
+                )
+            else:
+                await self.session.execute(
+                    update(Transaction),
+                    [
+                        {"id": tx_id, "amount_out": amount_out, **values}
+                        for tx_id, amount_out in zip(chunk, amounts_out[start:start + chunk_size])
+                    ],
+                )
+        await self.session.flush()
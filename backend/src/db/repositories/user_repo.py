@@ -2,20 +2,92 @@ from datetime import datetime, timezone
 
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
+from src.common.constants import (
+    DEFAULT_TRADE_SIZE_SOL,
+    DEFAULT_TRADE_SIZE_USDC,
+    DEFAULT_MIN_FEE_POOL,
+    DEFAULT_TARGET_FEE_POOL,
+    DEFAULT_MAX_SLIPPAGE_BPS,
+    DEFAULT_PROTOCOL_FEE_BPS,
+    DEFAULT_RELAYER_REFUND,
+    DEFAULT_DAILY_LIMIT,
+)
+from src.config.settings import settings
+from src.db.cache import cached_get, invalidate_cached
+from src.db.models.execution_counter import ExecutionCounter
 from src.db.models.user_profile import UserProfile
+from src.db.models.vault_balance import VaultBalance
+from src.db.repositories.vault_repo import VaultRepository
 
 
 class UserRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def get_by_owner(self, owner: str) -> UserProfile | None:
+    async def get_by_owner(self, owner: str, *, cached: bool = True) -> UserProfile | None:
+        """Profile of ``owner``; pass ``cached=False`` where it decides a money movement."""
+        if not cached:
+            return await self._load(owner)
+        return await cached_get(self.session, "user", owner, UserProfile, lambda: self._load(owner))
+
+    async def _load(self, owner: str) -> UserProfile | None:
+        # populate_existing: a cached copy already in the session must not win
+        result = await self.session.execute(
+            select(UserProfile).where(UserProfile.owner == owner).execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_by_owners(self, owners: list[str]) -> list[UserProfile]:
         result = await self.session.execute(
-            select(UserProfile).where(UserProfile.owner == owner)
+            select(UserProfile).where(UserProfile.owner.in_(owners))
+        )
+        return list(result.scalars().all())
+
+    async def get_with_details(self, owner: str) -> UserProfile | None:
+        """Profile with its vault balance and execution counter, in one joined query."""
+        result = await self.session.execute(
+            select(UserProfile)
+            .where(UserProfile.owner == owner)
+            .options(
+                joinedload(UserProfile.vault_balance),
+                joinedload(UserProfile.execution_counter),
+            )
         )
         return result.scalar_one_or_none()
 
+    async def get_account(self, owner: str) -> tuple[UserProfile, VaultBalance, ExecutionCounter | None]:
+        """Profile, vault and execution counter for read-only endpoints.
+
+        Nothing is written: a wallet without a profile or vault gets unsaved
+        defaults, the same values ``onboard`` would store.
+        """
+        profile = await self.get_with_details(owner)
+        if profile is None:
+            return self.default_profile(owner), VaultRepository.default_vault(owner), None
+        vault = profile.vault_balance or VaultRepository.default_vault(owner)
+        return profile, vault, profile.execution_counter
+
+    @staticmethod
+    def default_profile(owner: str) -> UserProfile:
+        """Unsaved profile with the default settings, for wallets that have not been onboarded."""
+        return UserProfile(
+            owner=owner,
+            enabled=True,
+            trade_size_sol=DEFAULT_TRADE_SIZE_SOL,
+            trade_size_usdc=DEFAULT_TRADE_SIZE_USDC,
+            min_fee_pool=DEFAULT_MIN_FEE_POOL,
+            target_fee_pool=DEFAULT_TARGET_FEE_POOL,
+            max_slippage_bps=DEFAULT_MAX_SLIPPAGE_BPS,
+            protocol_fee_bps=DEFAULT_PROTOCOL_FEE_BPS,
+            relayer_refund_lamports=DEFAULT_RELAYER_REFUND,
+            keeper_allowlist=None,
+            daily_limit=DEFAULT_DAILY_LIMIT,
+            last_execution=None,
+            nonce=0,
+        )
+
     async def create(self, owner: str, **kwargs) -> UserProfile:
         profile = UserProfile(owner=owner, **kwargs)
         self.session.add(profile)
@@ -28,8 +100,21 @@ class UserRepository:
             profile = await self.create(owner)
         return profile
 
+    async def onboard(self, owner: str) -> tuple[UserProfile, bool]:
+        """Provision the profile and vault for ``owner``. Returns the profile and whether anything was created."""
+        vault_repo = VaultRepository(self.session)
+        profile = await self.get_by_owner(owner)
+        created = profile is None
+        if created:
+            profile = await self.create(owner)
+        if await vault_repo.get_by_owner(owner) is None:
+            await vault_repo.create(owner)
+            created = True
+        return profile, created
+
     async def update(self, owner: str, **kwargs) -> UserProfile | None:
         kwargs["updated_at"] = datetime.now(timezone.utc)
+        invalidate_cached(self.session, "user", [owner])
         await self.session.execute(
             update(UserProfile).where(UserProfile.owner == owner).values(**kwargs)
         )
@@ -37,15 +122,31 @@ class UserRepository:
         return await self.get_by_owner(owner)
 
     async def get_enabled_users(self) -> list[UserProfile]:
+        """Enabled profiles, with their execution counters loaded in the same query."""
         result = await self.session.execute(
-            select(UserProfile).where(UserProfile.enabled.is_(True))
+            select(UserProfile)
+            .where(UserProfile.enabled.is_(True))
+            .options(joinedload(UserProfile.execution_counter))
         )
         return list(result.scalars().all())
 
     async def update_last_execution(self, owner: str, timestamp: datetime) -> None:
+        invalidate_cached(self.session, "user", [owner])
         await self.session.execute(
             update(UserProfile)
             .where(UserProfile.owner == owner)
             .values(last_execution=timestamp, nonce=UserProfile.nonce + 1)
         )
         await self.session.flush()
+
+    async def bulk_update_last_execution(self, owners: list[str], timestamp: datetime) -> None:
+        invalidate_cached(self.session, "user", owners)
+        chunk_size = settings.db_bulk_chunk_size
+        for start in range(0, len(owners), chunk_size):
+            await self.session.execute(
+                update(UserProfile)
+                .where(UserProfile.owner.in_(owners[start:start + chunk_size]))
+                .values(last_execution=timestamp, nonce=UserProfile.nonce + 1)
+                .execution_options(synchronize_session=False)
+            )
+        await self.session.flush()
@@ -1,6 +1,8 @@
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config.settings import settings
+from src.db.cache import cached_get, invalidate_cached
 from src.db.models.vault_balance import VaultBalance
 
 
@@ -8,11 +10,34 @@ class VaultRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def get_by_owner(self, owner: str) -> VaultBalance | None:
+    async def get_by_owner(self, owner: str, *, cached: bool = True) -> VaultBalance | None:
+        """Vault of ``owner``; pass ``cached=False`` where the balances decide a money movement."""
+        if not cached:
+            return await self._load(owner)
+        return await cached_get(self.session, "vault", owner, VaultBalance, lambda: self._load(owner))
+
+    async def get_for_update(self, owner: str) -> VaultBalance | None:
+        """Vault of ``owner`` from the database, locked until the transaction ends."""
+        return await self._load(owner, for_update=True)
+
+    async def _load(self, owner: str, *, for_update: bool = False) -> VaultBalance | None:
+        # populate_existing: a cached copy already in the session must not win
+        query = select(VaultBalance).where(VaultBalance.owner == owner).execution_options(populate_existing=True)
+        if for_update:
+            query = query.with_for_update()
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_by_owners(self, owners: list[str]) -> list[VaultBalance]:
         result = await self.session.execute(
-            select(VaultBalance).where(VaultBalance.owner == owner)
+            select(VaultBalance).where(VaultBalance.owner.in_(owners))
         )
-        return result.scalar_one_or_none()
+        return list(result.scalars().all())
+
+    @staticmethod
+    def default_vault(owner: str) -> VaultBalance:
+        """Unsaved empty vault, for wallets that have not been onboarded."""
+        return VaultBalance(owner=owner, sol_balance=0, usdc_balance=0, fee_pool_balance=0)
 
     async def create(self, owner: str, **kwargs) -> VaultBalance:
         vault = VaultBalance(owner=owner, **kwargs)
@@ -27,6 +52,7 @@ class VaultRepository:
         return vault
 
     async def update_sol_balance(self, owner: str, amount: int) -> None:
+        invalidate_cached(self.session, "vault", [owner])
         await self.session.execute(
             update(VaultBalance)
             .where(VaultBalance.owner == owner)
@@ -35,6 +61,7 @@ class VaultRepository:
         await self.session.flush()
 
     async def update_usdc_balance(self, owner: str, amount: int) -> None:
+        invalidate_cached(self.session, "vault", [owner])
         await self.session.execute(
             update(VaultBalance)
             .where(VaultBalance.owner == owner)
@@ -43,6 +70,7 @@ class VaultRepository:
         await self.session.flush()
 
     async def update_fee_pool_balance(self, owner: str, amount: int) -> None:
+        invalidate_cached(self.session, "vault", [owner])
         await self.session.execute(
             update(VaultBalance)
             .where(VaultBalance.owner == owner)
@@ -51,6 +79,7 @@ class VaultRepository:
         await self.session.flush()
 
     async def adjust_sol_balance(self, owner: str, delta: int) -> None:
+        invalidate_cached(self.session, "vault", [owner])
         await self.session.execute(
             update(VaultBalance)
             .where(VaultBalance.owner == owner)
@@ -59,6 +88,7 @@ class VaultRepository:
         await self.session.flush()
 
     async def adjust_usdc_balance(self, owner: str, delta: int) -> None:
+        invalidate_cached(self.session, "vault", [owner])
         await self.session.execute(
             update(VaultBalance)
             .where(VaultBalance.owner == owner)
@@ -67,9 +97,36 @@ class VaultRepository:
         await self.session.flush()
 
     async def adjust_fee_pool_balance(self, owner: str, delta: int) -> None:
+        invalidate_cached(self.session, "vault", [owner])
         await self.session.execute(
             update(VaultBalance)
             .where(VaultBalance.owner == owner)
             .values(fee_pool_balance=VaultBalance.fee_pool_balance + delta)
         )
         await self.session.flush()
+
+    async def bulk_adjust_balances(self, deltas: dict[str, tuple[int, int]]) -> None:
+        """Apply ``owner -> (sol_delta, usdc_delta)`` adjustments.
+
+        Each chunk of ``db_bulk_chunk_size`` owners is sent as one executemany
+        of a single prepared UPDATE, so a batch costs one round trip per chunk
+        instead of one per owner.
+        """
+        invalidate_cached(self.session, "vault", deltas)
+        table = VaultBalance.__table__
+        stmt = (
+            update(table)
+            .where(table.c.owner == bindparam("b_owner"))
+            .values(
+                sol_balance=table.c.sol_balance + bindparam("sol_delta"),
+                usdc_balance=table.c.usdc_balance + bindparam("usdc_delta"),
+            )
+        )
+        rows = [
+            {"b_owner": owner, "sol_delta": sol_delta, "usdc_delta": usdc_delta}
+            for owner, (sol_delta, usdc_delta) in deltas.items()
+        ]
+        chunk_size = settings.db_bulk_chunk_size
+        for start in range(0, len(rows), chunk_size):
+            await self.session.execute(stmt, rows[start:start + chunk_size])
+        await self.session.flush()
@@ -1,8 +1,12 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.common.metrics import DB_READ_SESSIONS
+
 from .base import async_session_factory
+from .replicas import REPLICA_SESSION_KEY, replica_router
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -13,3 +17,19 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+
+
+@asynccontextmanager
+async def read_session() -> AsyncIterator[AsyncSession]:
+    """Session for read-only work, on a replica when one is usable. Never commits."""
+    factory = await replica_router.pick()
+    DB_READ_SESSIONS.labels("primary" if factory is None else "replica").inc()
+    async with (factory or async_session_factory)() as session:
+        if factory is not None:
+            session.info[REPLICA_SESSION_KEY] = True
+        yield session
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    async with read_session() as session:
+        yield session
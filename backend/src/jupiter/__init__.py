@@ -1,11 +1,23 @@
 from .client import JupiterClient
-from .route_builder import get_quote, validate_route, build_swap_transaction, get_sol_to_usdc_route, get_usdc_to_sol_route
+from .price_service import get_sol_price
+from .route_builder import (
+    get_quote,
+    get_quote_cache_stats,
+    is_jupiter_available,
+    validate_route,
+    build_swap_transaction,
+    get_sol_to_usdc_route,
+    get_usdc_to_sol_route,
+)
 
 __all__ = [
     "JupiterClient",
     "get_quote",
+    "get_quote_cache_stats",
+    "is_jupiter_available",
     "validate_route",
     "build_swap_transaction",
     "get_sol_to_usdc_route",
     "get_usdc_to_sol_route",
+    "get_sol_price",
 ]
@@ -1,8 +1,29 @@
+import importlib.util
+import time
+
 import httpx
+from opentelemetry.trace import SpanKind
 
 from src.common.logging import setup_logger
-from src.common.exceptions import JupiterAPIError
+from src.common.exceptions import CircuitOpenError, JupiterAPIError
+from src.common.metrics import (
+    JUPITER_CIRCUIT_STATE,
+    JUPITER_CONCURRENCY_LIMIT,
+    JUPITER_ERRORS,
+    JUPITER_IN_FLIGHT,
+    JUPITER_POOL_CONNECTIONS,
+    JUPITER_REQUEST_SECONDS,
+    JUPITER_WAITING,
+)
+from src.common.tracing import tracer
 from src.config.settings import settings
+from src.jupiter.resilience import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+)
 
 logger = setup_logger("jupiter")
 
@@ -10,47 +31,170 @@ logger = setup_logger("jupiter")
 class JupiterClient:
     """Async HTTP client for Jupiter v6 API."""
 
-    def __init__(self, base_url: str | None = None):
+    def __init__(
+        self,
+        base_url: str | None = None,
+        *,
+        limits: httpx.Limits | None = None,
+        timeout: httpx.Timeout | None = None,
+        http2: bool | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
         self.base_url = base_url or settings.jupiter_api_url
+        self.limits = limits or httpx.Limits(
+            max_connections=settings.jupiter_max_connections,
+            max_keepalive_connections=settings.jupiter_max_keepalive_connections,
+            keepalive_expiry=settings.jupiter_keepalive_expiry,
+        )
+        self.timeout = timeout or httpx.Timeout(
+            connect=settings.jupiter_connect_timeout,
+            read=settings.jupiter_read_timeout,
+            write=settings.jupiter_write_timeout,
+            pool=settings.jupiter_pool_timeout,
+        )
+        self.http2 = settings.jupiter_http2 if http2 is None else http2
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed, using HTTP/1.1")
+            self.http2 = False
+        self.breaker = CircuitBreaker(
+            failure_threshold=settings.jupiter_breaker_failure_threshold,
+            recovery_seconds=settings.jupiter_breaker_recovery_seconds,
+        )
+        self.limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=settings.jupiter_concurrency_initial,
+            min_limit=settings.jupiter_concurrency_min,
+            max_limit=settings.jupiter_concurrency_max,
+            latency_target_ms=settings.jupiter_latency_target_ms,
+        )
+        self.transport = transport
         self._client: httpx.AsyncClient | None = None
+        self._requests = 0
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
-                timeout=httpx.Timeout(30.0),
+                limits=self.limits,
+                timeout=self.timeout,
+                http2=self.http2,
+                transport=self.transport,
             )
         return self._client
 
+    def pool_stats(self) -> dict:
+        """Snapshot of the underlying connection pool."""
+        stats = {
+            "requests": self._requests,
+            "connections": 0,
+            "active_connections": 0,
+            "idle_connections": 0,
+            "http2_connections": 0,
+            "max_connections": self.limits.max_connections,
+            "http2_enabled": self.http2,
+        }
+        if self._client is None or self._client.is_closed:
+            return stats
+        pool = getattr(self._client._transport, "_pool", None)
+        for connection in getattr(pool, "connections", []):
+            stats["connections"] += 1
+            if connection.is_idle():
+                stats["idle_connections"] += 1
+            else:
+                stats["active_connections"] += 1
+            if "HTTP/2" in connection.info():
+                stats["http2_connections"] += 1
+        return stats
+
+    def register_metrics(self) -> None:
+        """Report this client's state in the Prometheus registry, read at collection time."""
+        for state in ("active", "idle", "http2"):
+            JUPITER_POOL_CONNECTIONS.labels(state).set_function(
+                lambda state=state: self.pool_stats()[f"{state}_connections"]
+            )
+        for state in (CIRCUIT_CLOSED, CIRCUIT_OPEN, CIRCUIT_HALF_OPEN):
+            JUPITER_CIRCUIT_STATE.labels(state).set_function(
+                lambda state=state: 1 if self.breaker.state == state else 0
+            )
+        JUPITER_CONCURRENCY_LIMIT.set_function(lambda: self.limiter.metrics()["limit"])
+        JUPITER_IN_FLIGHT.set_function(lambda: self.limiter.metrics()["in_flight"])
+        JUPITER_WAITING.set_function(lambda: self.limiter.metrics()["waiting"])
+
     async def get(self, path: str, params: dict | None = None) -> dict:
-        client = await self._get_client()
-        try:
-            response = await client.get(path, params=params)
-            response.raise_for_status()
-            data = response.json()
-            logger.info("GET %s -> %d", path, response.status_code)
-            return data
-        except httpx.HTTPStatusError as e:
-            logger.error("Jupiter API error: %s %s -> %d", e.request.method, e.request.url, e.response.status_code)
-            raise JupiterAPIError(f"Jupiter API returned {e.response.status_code}") from e
-        except httpx.RequestError as e:
-            logger.error("Jupiter API request failed: %s", str(e))
-            raise JupiterAPIError(f"Jupiter API request failed: {str(e)}") from e
+        return await self._request("GET", path, params=params)
 
     async def post(self, path: str, json: dict | None = None) -> dict:
+        return await self._request("POST", path, json=json)
+
+    async def _request(self, method: str, path: str, **kwargs) -> dict:
+        # Spans the whole call, including circuit and concurrency limiter waits
+        with tracer.start_as_current_span(
+            f"jupiter {method} {path}",
+            kind=SpanKind.CLIENT,
+            attributes={"http.request.method": method, "url.path": path},
+        ) as span:
+            if not self.breaker.allow_request():
+                JUPITER_ERRORS.labels(path, "circuit_open").inc()
+                raise CircuitOpenError(
+                    f"Jupiter circuit open, retry in {self.breaker.retry_after():.0f}s"
+                )
+
+            try:
+                return await self._send(span, method, path, **kwargs)
+            except BaseException:
+                # Frees the probe slot of a call that did not settle the circuit,
+                # e.g. one cancelled by a job timeout
+                self.breaker.release_probe()
+                raise
+
+    async def _send(self, span, method: str, path: str, **kwargs) -> dict:
         client = await self._get_client()
-        try:
-            response = await client.post(path, json=json)
-            response.raise_for_status()
-            data = response.json()
-            logger.info("POST %s -> %d", path, response.status_code)
+        async with self.limiter.slot() as call:
+            self._requests += 1
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, path, **kwargs)
+                response.raise_for_status()
+                data = response.json()
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                span.set_attribute("http.response.status_code", status)
+                JUPITER_ERRORS.labels(path, str(status)).inc()
+                if status == 429 or status >= 500:
+                    self._record_failure(call)
+                else:
+                    self.breaker.record_success()
+                logger.error("Jupiter API error: %s %s -> %d", e.request.method, e.request.url, status)
+                raise JupiterAPIError(f"Jupiter API returned {status}", upstream_status=status) from e
+            except httpx.RequestError as e:
+                JUPITER_ERRORS.labels(path, "connection").inc()
+                self._record_failure(call)
+                logger.error("Jupiter API request failed: %s", str(e))
+                raise JupiterAPIError(f"Jupiter API request failed: {str(e)}") from e
+            except Exception as e:
+                # e.g. a non-JSON body; counted so a half-open probe always settles the circuit
+                JUPITER_ERRORS.labels(path, "invalid_response").inc()
+                self._record_failure(call)
+                logger.error("Jupiter API returned an unusable response: %s", str(e))
+                raise JupiterAPIError(f"Jupiter API returned an unusable response: {str(e)}") from e
+
+            latency_ms = (time.perf_counter() - start) * 1000
+            span.set_attribute("http.response.status_code", response.status_code)
+            JUPITER_REQUEST_SECONDS.labels(path).observe(latency_ms / 1000)
+            self.breaker.record_success()
+            self.limiter.on_success(latency_ms, call)
+            logger.debug("%s %s -> %d (%.0fms)", method, path, response.status_code, latency_ms)
             return data
-        except httpx.HTTPStatusError as e:
-            logger.error("Jupiter API error: %s %s -> %d", e.request.method, e.request.url, e.response.status_code)
-            raise JupiterAPIError(f"Jupiter API returned {e.response.status_code}") from e
-        except httpx.RequestError as e:
-            logger.error("Jupiter API request failed: %s", str(e))
-            raise JupiterAPIError(f"Jupiter API request failed: {str(e)}") from e
+
+    def _record_failure(self, call: int) -> None:
+        self.breaker.record_failure()
+        self.limiter.on_failure(call)
+
+    def resilience_stats(self) -> dict:
+        """Circuit breaker state and transitions plus concurrency limiter state."""
+        return {
+            "circuit": self.breaker.metrics(),
+            "concurrency": self.limiter.metrics(),
+        }
 
     async def close(self) -> None:
         if self._client and not self._client.is_closed:
@@ -0,0 +1,203 @@
+"""Local stand-in for the Jupiter v6 quote/swap API.
+
+Serves ``GET /quote`` and ``POST /swap`` with the same shapes as
+``QuoteResponse``/``SwapResponse``. Latency, error rate, rate limiting and
+the price curve are configurable, so the execution pipeline can be
+load-tested and benchmarked fully offline.
+
+In-process, pass the client from ``fake_jupiter_client(config)`` (or an
+``httpx.ASGITransport`` around ``create_fake_jupiter_app``) to the code under
+test. As a standalone server:
+
+    python -m src.jupiter.fake_server --port 8899 --latency-median-ms 80
+    JUPITER_API_URL=http://127.0.0.1:8899 rq worker ...
+"""
+import argparse
+import asyncio
+import base64
+import math
+import os
+import random
+import time
+
+import httpx
+from fastapi import FastAPI, Query, Request
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from src.common.constants import LAMPORTS_PER_SOL, USDC_BASE_UNITS, USDC_MINT, WSOL_MINT
+from src.config.settings import settings
+from src.jupiter.client import JupiterClient
+from src.jupiter.models import QuoteResponse, RoutePlanStep, SwapResponse
+
+
+class FakeJupiterConfig(BaseModel):
+    # Latency is log-normal around the median; sigma 0 makes it constant
+    latency_median_ms: float = 0.0
+    latency_sigma: float = 0.5
+    error_rate: float = 0.0
+    error_status: int = 500
+    rate_limit_per_second: float | None = None
+    # Constant-product pool: SOL price in USD and SOL-side depth
+    sol_price_usd: float = settings.price_static_sol_usd
+    pool_depth_sol: float = 500_000.0
+    fee_bps: int = 25
+    seed: int | None = None
+
+
+class _TokenBucket:
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class FakeJupiter:
+    """State behind the fake API: pricing, latency and failure injection."""
+
+    def __init__(self, config: FakeJupiterConfig):
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.bucket = _TokenBucket(config.rate_limit_per_second) if config.rate_limit_per_second else None
+        self.started = time.monotonic()
+        self.requests = {"quote": 0, "swap": 0, "errors": 0, "rate_limited": 0}
+
+    @property
+    def context_slot(self) -> int:
+        return 250_000_000 + int((time.monotonic() - self.started) / 0.4)
+
+    def reserves(self, input_mint: str) -> tuple[int, int]:
+        sol_reserve = int(self.config.pool_depth_sol * LAMPORTS_PER_SOL)
+        usdc_reserve = int(self.config.pool_depth_sol * self.config.sol_price_usd * USDC_BASE_UNITS)
+        if input_mint == WSOL_MINT:
+            return sol_reserve, usdc_reserve
+        return usdc_reserve, sol_reserve
+
+    def out_amount(self, input_mint: str, amount: int) -> int:
+        reserve_in, reserve_out = self.reserves(input_mint)
+        amount_after_fee = amount * (10000 - self.config.fee_bps) // 10000
+        return reserve_out * amount_after_fee // (reserve_in + amount_after_fee)
+
+    async def delay(self) -> None:
+        if self.config.latency_median_ms <= 0:
+            return
+        latency_ms = self.random.lognormvariate(math.log(self.config.latency_median_ms), self.config.latency_sigma)
+        await asyncio.sleep(latency_ms / 1000)
+
+    def failure(self) -> JSONResponse | None:
+        if self.bucket is not None and not self.bucket.take():
+            self.requests["rate_limited"] += 1
+            return JSONResponse(status_code=429, content={"error": "Rate limit exceeded"})
+        if self.config.error_rate > 0 and self.random.random() < self.config.error_rate:
+            self.requests["errors"] += 1
+            return JSONResponse(status_code=self.config.error_status, content={"error": "Injected failure"})
+        return None
+
+
+def create_fake_jupiter_app(config: FakeJupiterConfig | None = None) -> FastAPI:
+    fake = FakeJupiter(config or FakeJupiterConfig())
+    app = FastAPI(title="Fake Jupiter API")
+    app.state.fake = fake
+
+    @app.get("/quote")
+    async def quote(
+        input_mint: str = Query(..., alias="inputMint"),
+        output_mint: str = Query(..., alias="outputMint"),
+        amount: int = Query(..., gt=0),
+        slippage_bps: int = Query(50, alias="slippageBps"),
+    ):
+        fake.requests["quote"] += 1
+        await fake.delay()
+        failure = fake.failure()
+        if failure is not None:
+            return failure
+        if {input_mint, output_mint} != {WSOL_MINT, USDC_MINT}:
+            return JSONResponse(status_code=400, content={"error": "Unsupported pair"})
+
+        out_amount = fake.out_amount(input_mint, amount)
+        spot_out = amount * fake.reserves(input_mint)[1] // fake.reserves(input_mint)[0]
+        price_impact = 1 - out_amount / spot_out if spot_out else 0.0
+        response = QuoteResponse(
+            input_mint=input_mint,
+            in_amount=str(amount),
+            output_mint=output_mint,
+            out_amount=str(out_amount),
+            other_amount_threshold=str(out_amount * (10000 - slippage_bps) // 10000),
+            swap_mode="ExactIn",
+            slippage_bps=slippage_bps,
+            price_impact_pct=f"{price_impact:.8f}",
+            route_plan=[
+                RoutePlanStep(
+                    swap_info={
+                        "ammKey": "FakeAmm1111111111111111111111111111111111",
+                        "label": "FakeJupiter",
+                        "inputMint": input_mint,
+                        "outputMint": output_mint,
+                        "inAmount": str(amount),
+                        "outAmount": str(out_amount),
+                    },
+                    percent=100,
+                )
+            ],
+            context_slot=fake.context_slot,
+            time_taken=0.001,
+        )
+        return response.model_dump(by_alias=True)
+
+    @app.post("/swap")
+    async def swap(request: Request):
+        fake.requests["swap"] += 1
+        await fake.delay()
+        failure = fake.failure()
+        if failure is not None:
+            return failure
+        body = await request.json()
+        if "quoteResponse" not in body or "userPublicKey" not in body:
+            return JSONResponse(status_code=400, content={"error": "quoteResponse and userPublicKey required"})
+
+        response = SwapResponse(
+            swap_transaction=base64.b64encode(os.urandom(64)).decode(),
+            last_valid_block_height=fake.context_slot + 150,
+            prioritization_fee_lamports=5_000,
+        )
+        return response.model_dump(by_alias=True)
+
+    @app.get("/stats")
+    async def stats():
+        return fake.requests
+
+    return app
+
+
+def fake_jupiter_client(config: FakeJupiterConfig | None = None) -> tuple[JupiterClient, FakeJupiter]:
+    """JupiterClient wired to an in-process fake Jupiter app, plus the fake's state."""
+    app = create_fake_jupiter_app(config)
+    client = JupiterClient(base_url="http://fake-jupiter", transport=httpx.ASGITransport(app=app))
+    return client, app.state.fake
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run a local fake Jupiter API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8899)
+    for name, field in FakeJupiterConfig.model_fields.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", default=field.default)
+    args = parser.parse_args()
+
+    config = FakeJupiterConfig(**{name: getattr(args, name) for name in FakeJupiterConfig.model_fields})
+    uvicorn.run(create_fake_jupiter_app(config), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
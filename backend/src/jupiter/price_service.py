@@ -0,0 +1,163 @@
+import asyncio
+import json
+import time
+
+import redis.asyncio as aioredis
+
+from src.common.constants import LAMPORTS_PER_SOL, usdc_base_to_human
+from src.common.logging import setup_logger
+from src.config.settings import settings
+from src.jupiter.constants import USDC_MINT, WSOL_MINT
+from src.jupiter.route_builder import get_quote
+
+logger = setup_logger("jupiter")
+
+PRICE_KEY = "price:SOL_USD"
+
+
+class JupiterPriceFeed:
+    """SOL/USD derived from a Jupiter quote of 1 SOL into USDC."""
+
+    source = "jupiter"
+
+    async def fetch(self) -> float:
+        quote = await get_quote(WSOL_MINT, USDC_MINT, LAMPORTS_PER_SOL, slippage_bps=50)
+        return usdc_base_to_human(int(quote.out_amount))
+
+
+class StaticPriceFeed:
+    """Fixed price, for local development and tests."""
+
+    source = "static"
+
+    def __init__(self, price: float):
+        self.price = price
+
+    async def fetch(self) -> float:
+        return self.price
+
+
+class PriceService:
+    """Latest SOL/USD price, cached in process and optionally in Redis.
+
+    Readers never wait on the feed: ``get_price`` returns the cached price,
+    refreshed from Redis when the local copy is older than ``ttl_seconds``,
+    and falls back to the last known (or the configured fallback) price.
+    Fetching from the feed is left to ``refresh``, normally driven by the
+    background refresher. Redis errors fail open.
+    """
+
+    def __init__(
+        self,
+        feed,
+        ttl_seconds: float,
+        redis_client: aioredis.Redis | None = None,
+        fallback_price: float = settings.price_static_sol_usd,
+    ):
+        self.feed = feed
+        self.ttl_seconds = ttl_seconds
+        self._redis = redis_client
+        self.fallback_price = fallback_price
+        self._price: float | None = None
+        self._updated_at = 0.0  # wall-clock time, comparable across processes
+        self._refresher: asyncio.Task | None = None
+        self.refresh_failures = 0
+
+    def _is_fresh(self) -> bool:
+        return self._price is not None and time.time() - self._updated_at < self.ttl_seconds
+
+    def current_price(self) -> float:
+        """Latest known price without any I/O."""
+        return self._price if self._price is not None else self.fallback_price
+
+    async def get_price(self) -> float:
+        if not self._is_fresh() and self._redis is not None:
+            try:
+                raw = await self._redis.get(PRICE_KEY)
+                if raw is not None:
+                    cached = json.loads(raw)
+                    if cached["updated_at"] > self._updated_at:
+                        self._price, self._updated_at = cached["price"], cached["updated_at"]
+            except Exception as e:
+                logger.warning("Price cache unavailable: %s", str(e))
+        return self.current_price()
+
+    async def refresh(self) -> float:
+        """Fetch a new price from the feed and publish it. Keeps the old price on failure."""
+        try:
+            price = await self.feed.fetch()
+        except Exception as e:
+            self.refresh_failures += 1
+            logger.warning("SOL price refresh from %s failed: %s", self.feed.source, str(e))
+            return self.current_price()
+
+        self._price, self._updated_at = price, time.time()
+        if self._redis is not None:
+            try:
+                await self._redis.set(
+                    PRICE_KEY,
+                    json.dumps({"price": price, "updated_at": self._updated_at}),
+                    ex=max(1, int(self.ttl_seconds)),
+                )
+            except Exception as e:
+                logger.warning("Price cache unavailable: %s", str(e))
+        return price
+
+    async def _refresh_loop(self, interval_seconds: float) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(interval_seconds)
+
+    def start_refresher(self, interval_seconds: float) -> None:
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.create_task(self._refresh_loop(interval_seconds))
+
+    async def stop_refresher(self) -> None:
+        if self._refresher is None:
+            return
+        self._refresher.cancel()
+        try:
+            await self._refresher
+        except asyncio.CancelledError:
+            pass
+        self._refresher = None
+
+    def stats(self) -> dict:
+        return {
+            "price": self.current_price(),
+            "source": self.feed.source if self._price is not None else "fallback",
+            "age_seconds": round(time.time() - self._updated_at, 1) if self._price is not None else None,
+            "refresh_failures": self.refresh_failures,
+        }
+
+
+def create_price_service() -> PriceService:
+    """Build the price service configured by settings."""
+    if settings.price_feed == "static":
+        feed = StaticPriceFeed(settings.price_static_sol_usd)
+    else:
+        if settings.price_feed != "jupiter":
+            logger.warning("Unknown price feed %r, using jupiter", settings.price_feed)
+        feed = JupiterPriceFeed()
+    redis_client = aioredis.from_url(settings.redis_url) if settings.price_cache_backend == "redis" else None
+    return PriceService(feed, settings.price_ttl_seconds, redis_client)
+
+
+price_service = create_price_service()
+
+
+async def get_sol_price() -> float:
+    """Current SOL/USD price; never waits on the price feed."""
+    return await price_service.get_price()
+
+
+async def resolve_sol_price() -> float:
+    """Current SOL/USD price for batch jobs.
+
+    Unlike ``get_sol_price`` this fetches from the feed when the process
+    knows no price yet, instead of serving the fallback.
+    """
+    price = await price_service.get_price()
+    if price_service.stats()["source"] == "fallback":
+        price = await price_service.refresh()
+    return price
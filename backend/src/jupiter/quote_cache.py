@@ -0,0 +1,155 @@
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable
+
+import redis.asyncio as aioredis
+
+from src.common.logging import setup_logger
+from src.common.metrics import QUOTE_CACHE_LOOKUPS
+from src.config.settings import settings
+
+logger = setup_logger("jupiter")
+
+QuoteKey = tuple[str, str, int, int]  # (input_mint, output_mint, amount, slippage_bps)
+
+
+class MemoryQuoteBackend:
+    """In-process quote store with per-entry expiry."""
+
+    def __init__(self):
+        self._entries: dict[str, tuple[float, dict]] = {}
+
+    async def get(self, key: str) -> dict | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: dict, ttl_ms: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl_ms / 1000, value)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class RedisQuoteBackend:
+    """Redis quote store shared by all workers."""
+
+    def __init__(self, redis_url: str, prefix: str = "jupiter:quote:"):
+        self._redis = aioredis.from_url(redis_url)
+        self._prefix = prefix
+
+    async def get(self, key: str) -> dict | None:
+        raw = await self._redis.get(self._prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: dict, ttl_ms: int) -> None:
+        await self._redis.set(self._prefix + key, json.dumps(value), px=ttl_ms)
+
+    async def clear(self) -> None:
+        async for key in self._redis.scan_iter(match=self._prefix + "*"):
+            await self._redis.delete(key)
+
+
+class QuoteCache:
+    """Short-lived quote cache with single-flight request coalescing.
+
+    Entries expire after ``ttl_ms`` and are also treated as stale once the
+    newest observed ``contextSlot`` is more than ``max_slot_lag`` slots ahead
+    of the slot the quote was computed at. Concurrent lookups for the same key
+    share one in-flight fetch.
+    """
+
+    def __init__(self, backend, ttl_ms: int, max_slot_lag: int):
+        self.backend = backend
+        self.ttl_ms = ttl_ms
+        self.max_slot_lag = max_slot_lag
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._latest_slot = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def _key(key: QuoteKey) -> str:
+        return ":".join(str(part) for part in key)
+
+    def _is_fresh(self, quote: dict) -> bool:
+        slot = quote.get("contextSlot")
+        return slot is None or self._latest_slot - slot <= self.max_slot_lag
+
+    def _observe_slot(self, quote: dict) -> None:
+        slot = quote.get("contextSlot")
+        if slot is not None and slot > self._latest_slot:
+            self._latest_slot = slot
+
+    async def get_or_fetch(self, key: QuoteKey, fetch: Callable[[], Awaitable[dict]]) -> dict:
+        cache_key = self._key(key)
+
+        cached = await self.backend.get(cache_key)
+        if cached is not None:
+            self._observe_slot(cached)
+            if self._is_fresh(cached):
+                self.hits += 1
+                QUOTE_CACHE_LOOKUPS.labels("hit").inc()
+                return cached
+
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            self.coalesced += 1
+            QUOTE_CACHE_LOOKUPS.labels("coalesced").inc()
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        QUOTE_CACHE_LOOKUPS.labels("miss").inc()
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            quote = await fetch()
+            self._observe_slot(quote)
+            await self.backend.set(cache_key, quote, self.ttl_ms)
+            future.set_result(quote)
+            return quote
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an uncoalesced failure does not log a warning
+            future.exception()
+            raise
+        finally:
+            del self._inflight[cache_key]
+
+    async def clear(self) -> None:
+        await self.backend.clear()
+        self._latest_slot = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_ratio": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            "latest_slot": self._latest_slot,
+        }
+
+
+def create_quote_cache() -> QuoteCache | None:
+    """Build the quote cache configured by settings, or None when disabled."""
+    if settings.quote_cache_backend == "memory":
+        backend = MemoryQuoteBackend()
+    elif settings.quote_cache_backend == "redis":
+        backend = RedisQuoteBackend(settings.redis_url)
+    elif settings.quote_cache_backend == "none":
+        return None
+    else:
+        logger.warning("Unknown quote cache backend %r, caching disabled", settings.quote_cache_backend)
+        return None
+    return QuoteCache(backend, settings.quote_cache_ttl_ms, settings.quote_cache_max_slot_lag)
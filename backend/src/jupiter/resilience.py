@@ -0,0 +1,197 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+
+from src.common.logging import setup_logger
+from src.common.metrics import JUPITER_CIRCUIT_TRANSITIONS
+
+logger = setup_logger("jupiter")
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    Opens after ``failure_threshold`` consecutive failures and rejects calls
+    for ``recovery_seconds``. It then lets up to ``half_open_max_calls`` probe
+    calls through: a successful probe closes the circuit, a failed one opens
+    it again.
+    """
+
+    def __init__(self, failure_threshold: int, recovery_seconds: float, half_open_max_calls: int = 1):
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self._state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self.transitions: dict[str, int] = {}
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == CIRCUIT_OPEN and time.monotonic() - self._opened_at >= self.recovery_seconds:
+            self._transition(CIRCUIT_HALF_OPEN)
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == CIRCUIT_OPEN
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit admits probe calls."""
+        if self._state != CIRCUIT_OPEN:
+            return 0.0
+        return max(0.0, self.recovery_seconds - (time.monotonic() - self._opened_at))
+
+    def _transition(self, new_state: str) -> None:
+        old_state = self._state
+        self._state = new_state
+        key = f"{old_state}->{new_state}"
+        self.transitions[key] = self.transitions.get(key, 0) + 1
+        JUPITER_CIRCUIT_TRANSITIONS.labels(old_state, new_state).inc()
+        if new_state == CIRCUIT_OPEN:
+            self._opened_at = time.monotonic()
+        self._half_open_calls = 0
+        logger.warning("Jupiter circuit %s -> %s", old_state, new_state)
+
+    def allow_request(self) -> bool:
+        state = self.state
+        if state == CIRCUIT_CLOSED:
+            return True
+        if state == CIRCUIT_HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+            self._half_open_calls += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def release_probe(self) -> None:
+        """Hand back a half-open probe slot for a call that ended without a result."""
+        if self._state == CIRCUIT_HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def record_success(self) -> None:
+        self._failures = 0
+        if self._state == CIRCUIT_HALF_OPEN:
+            self._transition(CIRCUIT_CLOSED)
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state == CIRCUIT_HALF_OPEN:
+            self._transition(CIRCUIT_OPEN)
+        elif self._state == CIRCUIT_CLOSED and self._failures >= self.failure_threshold:
+            self._transition(CIRCUIT_OPEN)
+
+    def metrics(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "rejected": self.rejected,
+            "transitions": dict(self.transitions),
+        }
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limit for outbound calls.
+
+    The limit grows by ``1 / limit`` per call that completes within
+    ``latency_target_ms`` (roughly +1 per window of calls). It is multiplied
+    by ``backoff`` on failures or slow calls, bounded to
+    ``[min_limit, max_limit]``, at most once per window: calls already in
+    flight when the limit was cut belong to the same congestion episode, so
+    their failures do not cut it again.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        latency_target_ms: float,
+        backoff: float = 0.7,
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target_ms = latency_target_ms
+        self.backoff = backoff
+        self.in_flight = 0
+        self.increases = 0
+        self.decreases = 0
+        self._calls = 0
+        # Calls numbered below this were in flight at the last decrease
+        self._recovery_from = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._has_capacity():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    async def _acquire(self) -> None:
+        if self._has_capacity() and not self._waiters:
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was granted as we were cancelled, hand it on
+                self.in_flight -= 1
+                self._wake_waiters()
+            raise
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+        self._wake_waiters()
+
+    def on_success(self, latency_ms: float, call: int | None = None) -> None:
+        """Record a completed call; ``call`` is the number yielded by ``slot()``."""
+        if latency_ms > self.latency_target_ms:
+            self._decrease(call)
+            return
+        self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        self.increases += 1
+        self._wake_waiters()
+
+    def on_failure(self, call: int | None = None) -> None:
+        self._decrease(call)
+
+    def _decrease(self, call: int | None) -> None:
+        if call is not None and call < self._recovery_from:
+            return
+        self.limit = max(self.min_limit, self.limit * self.backoff)
+        self.decreases += 1
+        self._recovery_from = self._calls
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold a concurrency slot; yields the call's number for ``on_success``/``on_failure``."""
+        await self._acquire()
+        call = self._calls
+        self._calls += 1
+        try:
+            yield call
+        finally:
+            self._release()
+
+    def metrics(self) -> dict:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
@@ -3,10 +3,13 @@ from src.common.logging import setup_logger
 from src.jupiter.client import JupiterClient
 from src.jupiter.constants import WSOL_MINT, USDC_MINT
 from src.jupiter.models import QuoteResponse, SwapResponse
+from src.jupiter.quote_cache import create_quote_cache
 
 logger = setup_logger("jupiter")
 
 _client = JupiterClient()
+_client.register_metrics()
+_quote_cache = create_quote_cache()
 
 
 async def get_quote(
@@ -15,7 +18,11 @@ async def get_quote(
     amount: int,
     slippage_bps: int = 50,
 ) -> QuoteResponse:
-    """Get a swap quote from Jupiter v6."""
+    """Get a swap quote from Jupiter v6.
+
+    Identical requests within the quote cache TTL are served from the cache,
+    and concurrent identical requests share a single HTTP call.
+    """
     params = {
         "inputMint": input_mint,
         "outputMint": output_mint,
@@ -23,10 +30,16 @@ async def get_quote(
         "slippageBps": slippage_bps,
     }
 
-    data = await _client.get("/quote", params=params)
+    if _quote_cache is not None:
+        data = await _quote_cache.get_or_fetch(
+            (input_mint, output_mint, amount, slippage_bps),
+            lambda: _client.get("/quote", params=params),
+        )
+    else:
+        data = await _client.get("/quote", params=params)
     quote = QuoteResponse(**data)
 
-    logger.info(
+    logger.debug(
         "Quote: %s -> %s | in=%s out=%s | slippage=%d bps",
         input_mint[:8],
         output_mint[:8],
@@ -38,6 +51,16 @@ async def get_quote(
     return quote
 
 
+def is_jupiter_available() -> bool:
+    """False while the Jupiter circuit breaker is open."""
+    return not _client.breaker.is_open
+
+
+def get_quote_cache_stats() -> dict | None:
+    """Hit/miss statistics of the quote cache, or None when caching is disabled."""
+    return _quote_cache.stats() if _quote_cache is not None else None
+
+
 def validate_route(quote: QuoteResponse, max_slippage_bps: int) -> bool:
     """Validate that the route meets slippage requirements.
 
@@ -79,7 +102,7 @@ async def build_swap_transaction(
     data = await _client.post("/swap", json=payload)
     swap = SwapResponse(**data)
 
-    logger.info("Swap transaction built for user %s", user_pubkey[:8])
+    logger.debug("Swap transaction built for user %s", user_pubkey[:8])
 
     return swap
 
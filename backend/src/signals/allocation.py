@@ -0,0 +1,22 @@
+def allocate_pro_rata(total: int, weights: list[int]) -> list[int]:
+    """Split an integer ``total`` across ``weights`` proportionally.
+
+    Every share is floored, then the leftover units go one each to the
+    largest fractional remainders (earlier entries win ties). The shares
+    always sum to exactly ``total``.
+    """
+    weight_sum = sum(weights)
+    if weight_sum <= 0:
+        raise ValueError("weights must sum to a positive amount")
+
+    shares = []
+    remainders = []
+    for index, weight in enumerate(weights):
+        share, remainder = divmod(total * weight, weight_sum)
+        shares.append(share)
+        remainders.append((-remainder, index))
+
+    leftover = total - sum(shares)
+    for _, index in sorted(remainders)[:leftover]:
+        shares[index] += 1
+    return shares
@@ -0,0 +1,48 @@
+"""Per-signal execution latency, aggregated in Redis.
+
+Every execution job of a signal would otherwise update the same SignalLog
+row. Instead ``enqueue_executions`` stores how many jobs a signal fanned out
+to, each job folds its duration into Redis and counts itself off, and only
+the job that finishes last writes the figures to the signal log.
+"""
+import redis.asyncio as aioredis
+
+from src.config.settings import settings
+
+LATENCY_KEY_TTL_SECONDS = 86_400
+
+
+def pending_jobs_key(signal_id: int) -> str:
+    return f"signal_latency:{signal_id}:pending"
+
+
+def _slowest_key(signal_id: int) -> str:
+    return f"signal_latency:{signal_id}:slowest"
+
+
+class SignalLatency:
+    def __init__(self, redis_client: aioredis.Redis):
+        self._redis = redis_client
+
+    async def record(self, signal_id: int, execution_ms: float) -> float | None:
+        """Fold a finished execution job into its signal's figures.
+
+        Returns the slowest job duration in ms once the last job of the signal
+        has finished, otherwise None. Signals enqueued without a pending job
+        count never complete.
+        """
+        pending_key, slowest_key = pending_jobs_key(signal_id), _slowest_key(signal_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(slowest_key, {"ms": execution_ms}, gt=True)
+            pipe.expire(slowest_key, LATENCY_KEY_TTL_SECONDS)
+            pipe.decr(pending_key)
+            pipe.zscore(slowest_key, "ms")
+            _, _, remaining, slowest = await pipe.execute()
+        if remaining != 0:
+            return None
+        await self._redis.delete(pending_key, slowest_key)
+        return slowest
+
+
+def create_signal_latency() -> SignalLatency:
+    return SignalLatency(aioredis.from_url(settings.redis_url))
@@ -3,10 +3,17 @@ from rq import Queue
 
 from src.config.settings import settings
 from src.common.logging import setup_logger
+from src.common.tracing import inject_trace_context
+from src.signals.latency import LATENCY_KEY_TTL_SECONDS, pending_jobs_key
 
 logger = setup_logger("signals")
 
+EXECUTE_FOR_USER = "src.signals.workers.execution_worker.execute_for_user"
+EXECUTE_FOR_USERS = "src.signals.workers.execution_worker.execute_for_users"
+EXECUTE_AGGREGATE = "src.signals.workers.execution_worker.execute_aggregate"
+
 _redis_conn: redis.Redis | None = None
+_queues: dict[str, Queue] = {}
 
 
 def get_redis_connection() -> redis.Redis:
@@ -17,9 +24,94 @@ def get_redis_connection() -> redis.Redis:
     return _redis_conn
 
 
+def _get_queue(name: str) -> Queue:
+    queue = _queues.get(name)
+    if queue is None:
+        queue = Queue(name, connection=get_redis_connection())
+        _queues[name] = queue
+    return queue
+
+
 def get_signal_queue() -> Queue:
-    return Queue("signals", connection=get_redis_connection())
+    return _get_queue("signals")
 
 
 def get_execution_queue() -> Queue:
-    return Queue("executions", connection=get_redis_connection())
+    return _get_queue("executions")
+
+
+def queue_depths() -> dict[str, int]:
+    """Number of jobs waiting in each queue."""
+    return {name: _get_queue(name).count for name in ("signals", "executions")}
+
+
+def _job_timeout(args: tuple) -> int:
+    """RQ timeout for an execution job, scaled by the owners it covers."""
+    owners = args[2]
+    extra = len(owners) - 1 if isinstance(owners, list) else 0
+    return settings.execution_job_timeout_seconds + int(
+        extra * settings.execution_job_timeout_per_owner_seconds
+    )
+
+
+def enqueue_executions(
+    signal_id: int,
+    signal_type: str,
+    owners: list[str],
+    batch_size: int | None = None,
+    owners_per_job: int | None = None,
+) -> int:
+    """Enqueue execution jobs for the given owners using pipelined bulk writes.
+
+    With ``owners_per_job`` of 1 every owner gets an ``execute_for_user`` job;
+    larger values group owners into ``execute_for_users`` batch jobs. In
+    aggregate execution mode owners are instead grouped into
+    ``execute_aggregate`` jobs of up to ``execution_aggregate_max_owners``,
+    each running a single netted swap. Job timeouts grow with the number of
+    owners a job covers.
+
+    Jobs are written to Redis in batches of ``batch_size`` with a single
+    pipeline round trip per batch. Returns the number of owners enqueued.
+    """
+    batch_size = batch_size or settings.execution_enqueue_batch_size
+    owners_per_job = owners_per_job or settings.execution_owners_per_job
+    queue = get_execution_queue()
+
+    aggregate = settings.execution_mode == "aggregate"
+    if aggregate and not settings.execution_aggregate_wallet:
+        logger.warning("Aggregate execution mode needs EXECUTION_AGGREGATE_WALLET, executing per user")
+        aggregate = False
+
+    if aggregate:
+        func = EXECUTE_AGGREGATE
+        chunk = settings.execution_aggregate_max_owners
+        job_args = [
+            (signal_id, signal_type, owners[i:i + chunk])
+            for i in range(0, len(owners), chunk)
+        ]
+    elif owners_per_job > 1:
+        func = EXECUTE_FOR_USERS
+        job_args = [
+            (signal_id, signal_type, owners[i:i + owners_per_job])
+            for i in range(0, len(owners), owners_per_job)
+        ]
+    else:
+        func = EXECUTE_FOR_USER
+        job_args = [(signal_id, signal_type, owner) for owner in owners]
+
+    # The last job to finish writes the signal's latency figures
+    if job_args:
+        queue.connection.set(pending_jobs_key(signal_id), len(job_args), ex=LATENCY_KEY_TTL_SECONDS)
+
+    # Every execution job continues the signal's trace
+    meta = {"trace": inject_trace_context()}
+    for start in range(0, len(job_args), batch_size):
+        job_datas = [
+            Queue.prepare_data(func, args=args, timeout=_job_timeout(args), meta=meta)
+            for args in job_args[start:start + batch_size]
+        ]
+        with queue.connection.pipeline() as pipe:
+            queue.enqueue_many(job_datas, pipeline=pipe)
+            pipe.execute()
+
+    return len(owners)
@@ -1,4 +1,5 @@
 from src.common.logging import setup_logger
+from src.common.tracing import inject_trace_context
 from src.signals.queue import get_signal_queue
 
 logger = setup_logger("signals")
@@ -12,5 +13,6 @@ def enqueue_signal(signal_id: int, signal_type: str) -> None:
         signal_id,
         signal_type,
         job_timeout="5m",
+        meta={"trace": inject_trace_context()},
     )
     logger.info("Signal %d enqueued as job %s", signal_id, job.id)
@@ -1,43 +1,206 @@
 import asyncio
 import functools
-from collections.abc import Callable
+import random
+import time
+from collections.abc import Awaitable, Callable
 
+import redis.asyncio as aioredis
+
+from src.common.exceptions import AppException, CircuitOpenError, JupiterAPIError
 from src.common.logging import setup_logger
+from src.config.settings import settings
 
 logger = setup_logger("signals")
 
 
-def with_retry(max_retries: int = 3, base_delay: float = 1.0):
-    """Decorator for exponential backoff retry on async functions."""
+def default_classifier(exc: BaseException) -> bool:
+    """Decide whether an exception is worth retrying.
+
+    Jupiter errors are retried on rate limiting (429), server errors (5xx) and
+    transport failures. Other application errors such as
+    SlippageExceededError are deterministic and never retried, and neither is
+    an open circuit. Unknown exceptions are retried.
+    """
+    if isinstance(exc, CircuitOpenError):
+        return False
+    if isinstance(exc, JupiterAPIError):
+        status = exc.upstream_status
+        return status is None or status == 429 or status >= 500
+    if isinstance(exc, AppException):
+        return False
+    return isinstance(exc, Exception)
+
+
+def job_deadline() -> float | None:
+    """Monotonic deadline of the current RQ job's timeout, if running inside one."""
+    from rq import get_current_job
+
+    job = get_current_job()
+    if job is None or not job.timeout or job.timeout < 0 or job.started_at is None:
+        return None
+    elapsed = (time.time() - job.started_at.timestamp())
+    return time.monotonic() + job.timeout - elapsed
+
+
+class RetryBudget:
+    """Fleet-wide retry budget shared through Redis.
+
+    Every first attempt is counted as a request. A retry is only allowed while
+    retries in the current window stay under ``ratio`` of requests (with a
+    floor of ``min_retries``), so an outage cannot multiply load across all
+    workers. Redis errors fail open.
+    """
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        name: str,
+        ratio: float,
+        window_seconds: int,
+        min_retries: int,
+    ):
+        self._redis = redis_client
+        self.name = name
+        self.ratio = ratio
+        self.window_seconds = window_seconds
+        self.min_retries = min_retries
+
+    def _keys(self) -> tuple[str, str]:
+        window = int(time.time() // self.window_seconds)
+        prefix = f"retry_budget:{self.name}:{window}"
+        return f"{prefix}:requests", f"{prefix}:retries"
+
+    async def record_request(self) -> None:
+        requests_key, _ = self._keys()
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.incr(requests_key)
+                pipe.expire(requests_key, self.window_seconds * 2)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Retry budget unavailable: %s", str(e))
+
+    async def try_acquire(self) -> bool:
+        requests_key, retries_key = self._keys()
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.incr(retries_key)
+                pipe.expire(retries_key, self.window_seconds * 2)
+                pipe.get(requests_key)
+                retries, _, requests = await pipe.execute()
+            allowed = max(self.min_retries, self.ratio * int(requests or 0))
+            if retries > allowed:
+                await self._redis.decr(retries_key)
+                return False
+            return True
+        except Exception as e:
+            logger.warning("Retry budget unavailable: %s", str(e))
+            return True
+
+
+def create_retry_budget(name: str) -> RetryBudget | None:
+    if not settings.retry_budget_enabled:
+        return None
+    return RetryBudget(
+        aioredis.from_url(settings.redis_url),
+        name,
+        ratio=settings.retry_budget_ratio,
+        window_seconds=settings.retry_budget_window_seconds,
+        min_retries=settings.retry_budget_min_retries,
+    )
+
+
+class RetryPolicy:
+    """Retry policy with exception classification, full-jitter backoff,
+    deadline awareness and an optional shared retry budget."""
+
+    def __init__(
+        self,
+        max_retries: int | None = None,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        classifier: Callable[[BaseException], bool] = default_classifier,
+        budget: RetryBudget | None = None,
+    ):
+        self.max_retries = settings.signal_max_retries if max_retries is None else max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.classifier = classifier
+        self.budget = budget
+
+    def backoff(self, attempt: int) -> float:
+        """Full jitter: uniform in [0, min(max_delay, base_delay * 2**attempt)]."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    async def run(
+        self,
+        func: Callable[..., Awaitable],
+        *args,
+        deadline: float | None = None,
+        **kwargs,
+    ):
+        """Call ``func`` and retry it according to the policy.
+
+        ``deadline`` is a ``time.monotonic()`` timestamp; no retry is attempted
+        if its backoff would end past it.
+        """
+        name = getattr(func, "__name__", repr(func))
+        if self.budget is not None:
+            await self.budget.record_request()
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                if not self.classifier(e):
+                    raise
+                if attempt >= self.max_retries:
+                    logger.error(
+                        "All %d retries exhausted for %s: %s",
+                        self.max_retries,
+                        name,
+                        str(e),
+                    )
+                    raise
+                delay = self.backoff(attempt)
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    logger.error("Deadline reached for %s, not retrying: %s", name, str(e))
+                    raise
+                if self.budget is not None and not await self.budget.try_acquire():
+                    logger.error("Retry budget exhausted for %s: %s", name, str(e))
+                    raise
+                logger.warning(
+                    "Retry %d/%d for %s: %s (waiting %.1fs)",
+                    attempt + 1,
+                    self.max_retries,
+                    name,
+                    str(e),
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+
+def with_retry(
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    *,
+    max_delay: float = 30.0,
+    classifier: Callable[[BaseException], bool] = default_classifier,
+    budget: RetryBudget | None = None,
+):
+    """Decorator for jittered exponential backoff retry on async functions."""
+    policy = RetryPolicy(
+        max_retries=max_retries,
+        base_delay=base_delay,
+        max_delay=max_delay,
+        classifier=classifier,
+        budget=budget,
+    )
 
     def decorator(func: Callable):
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            last_exc = None
-            for attempt in range(max_retries + 1):
-                try:
-                    return await func(*args, **kwargs)
-                except Exception as e:
-                    last_exc = e
-                    if attempt < max_retries:
-                        delay = base_delay * (2 ** attempt)
-                        logger.warning(
-                            "Retry %d/%d for %s: %s (waiting %.1fs)",
-                            attempt + 1,
-                            max_retries,
-                            func.__name__,
-                            str(e),
-                            delay,
-                        )
-                        await asyncio.sleep(delay)
-                    else:
-                        logger.error(
-                            "All %d retries exhausted for %s: %s",
-                            max_retries,
-                            func.__name__,
-                            str(e),
-                        )
-            raise last_exc
+            return await policy.run(func, *args, **kwargs)
 
         return wrapper
 
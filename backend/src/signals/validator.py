@@ -8,15 +8,18 @@ from src.db.models.user_profile import UserProfile
 logger = setup_logger("signals")
 
 
-def validate_user_for_signal(profile: UserProfile, daily_executions: int) -> bool:
+def validate_user_for_signal(profile: UserProfile, daily_executions: int | None = None) -> bool:
     """Check if a user is eligible to receive a signal execution.
 
+    ``daily_executions`` defaults to today's count from the profile's
+    execution counter, which must be loaded.
+
     Raises CooldownActiveError or DailyLimitExceededError if not eligible.
     Returns True if eligible.
     """
     # Check enabled
     if not profile.enabled:
-        logger.info("User %s is disabled, skipping", profile.owner)
+        logger.debug("User %s is disabled, skipping", profile.owner)
         return False
 
     # Check cooldown
@@ -30,6 +33,9 @@ def validate_user_for_signal(profile: UserProfile, daily_executions: int) -> boo
             )
 
     # Check daily limit
+    if daily_executions is None:
+        counter = profile.execution_counter
+        daily_executions = counter.daily_count(datetime.now(timezone.utc).date()) if counter else 0
     if profile.daily_limit is not None and daily_executions >= profile.daily_limit:
         raise DailyLimitExceededError(
             f"User {profile.owner} has reached daily limit of {profile.daily_limit}"
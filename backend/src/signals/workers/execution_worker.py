@@ -1,5 +1,8 @@
 import asyncio
+import time
+from collections.abc import Awaitable
 from datetime import datetime, timezone
+from typing import TypeVar
 
 from src.common.constants import (
     WSOL_MINT,
@@ -9,40 +12,148 @@ from src.common.constants import (
     TX_PENDING,
     TX_CONFIRMED,
     TX_FAILED,
+    EXECUTION_SKIPPED,
 )
 from src.common.logging import setup_logger
+from src.common.metrics import EXECUTION_STAGE_SECONDS, EXECUTIONS
+from src.common.tracing import job_span
+from src.config.settings import settings
 from src.db.base import async_session_factory
+from src.db.repositories.signal_repo import SignalRepository
 from src.db.repositories.transaction_repo import TransactionRepository
 from src.db.repositories.user_repo import UserRepository
 from src.db.repositories.vault_repo import VaultRepository
-from src.jupiter.route_builder import get_quote, validate_route, build_swap_transaction
+from src.jupiter.route_builder import (
+    get_quote,
+    is_jupiter_available,
+    validate_route,
+    build_swap_transaction,
+)
+from src.signals.allocation import allocate_pro_rata
+from src.signals.latency import create_signal_latency
+from src.signals.retry import RetryPolicy, create_retry_budget, job_deadline
+from src.signals.workers.runtime import run_async
 
 logger = setup_logger("signals")
 
+T = TypeVar("T")
+
+_jupiter_retry = RetryPolicy(
+    max_retries=settings.signal_max_retries,
+    base_delay=settings.retry_base_delay,
+    max_delay=settings.retry_max_delay,
+    budget=create_retry_budget("jupiter"),
+)
+_signal_latency = create_signal_latency()
 
-def execute_for_user(signal_id: int, signal_type: str, owner: str) -> None:
+
+def execute_for_user(signal_id: int, signal_type: str, owner: str) -> str:
     """Entry point for RQ execution worker."""
-    asyncio.run(_execute_for_user_async(signal_id, signal_type, owner))
+    with job_span("execute_for_user", **{"signal.id": signal_id, "user.owner": owner}):
+        outcome = run_async(_timed_execution(signal_id, _execute_for_user_async(signal_id, signal_type, owner)))
+    EXECUTIONS.labels(outcome).inc()
+    return outcome
+
+
+def execute_for_users(signal_id: int, signal_type: str, owners: list[str]) -> dict[str, str]:
+    """Entry point for RQ batch execution worker. Returns the outcome per owner."""
+    with job_span("execute_for_users", **{"signal.id": signal_id, "users.count": len(owners)}):
+        results = run_async(_timed_execution(signal_id, _execute_for_users_async(signal_id, signal_type, owners)))
+    return _count_outcomes(results)
+
+
+def execute_aggregate(signal_id: int, signal_type: str, owners: list[str]) -> dict[str, str]:
+    """Entry point for RQ aggregate execution worker. Returns the outcome per owner."""
+    with job_span("execute_aggregate", **{"signal.id": signal_id, "users.count": len(owners)}):
+        results = run_async(_timed_execution(signal_id, _execute_aggregate_async(signal_id, signal_type, owners)))
+    return _count_outcomes(results)
+
+
+def _count_outcomes(results: dict[str, str]) -> dict[str, str]:
+    for outcome in results.values():
+        EXECUTIONS.labels(outcome).inc()
+    return results
+
+
+async def _timed_execution(signal_id: int, execution: Awaitable[T]) -> T:
+    """Await an execution job and fold its duration into the signal's latency."""
+    start = time.perf_counter()
+    try:
+        return await execution
+    finally:
+        await _record_signal_latency(signal_id, (time.perf_counter() - start) * 1000)
+
+
+async def _record_signal_latency(signal_id: int, execution_ms: float) -> None:
+    try:
+        slowest_ms = await _signal_latency.record(signal_id, execution_ms)
+        if slowest_ms is None:
+            return
+        # Last job of the signal: one short transaction writes the figures
+        async with async_session_factory() as session:
+            await SignalRepository(session).record_latency(signal_id, slowest_ms)
+            await session.commit()
+    except Exception as e:
+        logger.warning("Could not record latency for signal %d: %s", signal_id, str(e))
+
 
+async def _execute_for_users_async(
+    signal_id: int,
+    signal_type: str,
+    owners: list[str],
+    concurrency: int | None = None,
+) -> dict[str, str]:
+    """Run the per-user pipelines for a chunk of owners concurrently.
 
-async def _execute_for_user_async(signal_id: int, signal_type: str, owner: str) -> None:
-    """Build Jupiter route and prepare transaction for a single user."""
-    logger.info("Executing signal %d for user %s type=%s", signal_id, owner, signal_type)
+    Each owner gets its own session; at most ``concurrency`` pipelines are in
+    flight at once so Jupiter latency overlaps instead of serializing.
+    """
+    semaphore = asyncio.Semaphore(concurrency or settings.execution_concurrency)
+
+    async def run_one(owner: str) -> str:
+        async with semaphore:
+            try:
+                return await _execute_for_user_async(signal_id, signal_type, owner)
+            except Exception as e:
+                logger.error("Execution crashed for user %s: %s", owner, str(e))
+                return TX_FAILED
+
+    outcomes = await asyncio.gather(*(run_one(owner) for owner in owners))
+    results = dict(zip(owners, outcomes))
+
+    logger.info(
+        "Signal %d batch done: %d users, %d confirmed, %d failed, %d skipped",
+        signal_id,
+        len(owners),
+        outcomes.count(TX_CONFIRMED),
+        outcomes.count(TX_FAILED),
+        outcomes.count(EXECUTION_SKIPPED),
+    )
+    return results
+
+
+async def _execute_for_user_async(signal_id: int, signal_type: str, owner: str) -> str:
+    """Build Jupiter route and prepare transaction for a single user.
+
+    Returns the execution outcome: TX_CONFIRMED, TX_FAILED or EXECUTION_SKIPPED.
+    """
+    logger.debug("Executing signal %d for user %s type=%s", signal_id, owner, signal_type)
 
     async with async_session_factory() as session:
         user_repo = UserRepository(session)
         vault_repo = VaultRepository(session)
         tx_repo = TransactionRepository(session)
 
-        profile = await user_repo.get_by_owner(owner)
+        # Eligibility decides a balance write: never serve it from the cache
+        profile = await user_repo.get_by_owner(owner, cached=False)
         if not profile:
             logger.error("User %s not found", owner)
-            return
+            return EXECUTION_SKIPPED
 
-        vault = await vault_repo.get_by_owner(owner)
+        vault = await vault_repo.get_by_owner(owner, cached=False)
         if not vault:
             logger.error("Vault for user %s not found", owner)
-            return
+            return EXECUTION_SKIPPED
 
         # Determine swap parameters
         if signal_type == SIGNAL_SOL_TO_USDC:
@@ -51,17 +162,22 @@ async def _execute_for_user_async(signal_id: int, signal_type: str, owner: str)
             amount = profile.trade_size_sol
             if vault.sol_balance < amount:
                 logger.warning("User %s: insufficient SOL balance", owner)
-                return
+                return EXECUTION_SKIPPED
         elif signal_type == SIGNAL_USDC_TO_SOL:
             input_mint = USDC_MINT
             output_mint = WSOL_MINT
             amount = profile.trade_size_usdc
             if vault.usdc_balance < amount:
                 logger.warning("User %s: insufficient USDC balance", owner)
-                return
+                return EXECUTION_SKIPPED
         else:
             logger.error("Invalid signal type: %s", signal_type)
-            return
+            return EXECUTION_SKIPPED
+
+        # Fail fast while the Jupiter circuit is open instead of waiting out timeouts
+        if not is_jupiter_available():
+            logger.warning("User %s: Jupiter circuit open, skipping execution", owner)
+            return EXECUTION_SKIPPED
 
         # Create pending transaction
         tx = await tx_repo.create(
@@ -77,35 +193,41 @@ async def _execute_for_user_async(signal_id: int, signal_type: str, owner: str)
             status=TX_PENDING,
         )
         await session.commit()
+        tx_id = tx.id
 
         try:
             # Get Jupiter quote
-            quote = await get_quote(
-                input_mint, output_mint, amount, profile.max_slippage_bps
-            )
+            deadline = job_deadline()
+            with EXECUTION_STAGE_SECONDS.labels("quote").time():
+                quote = await _jupiter_retry.run(
+                    get_quote, input_mint, output_mint, amount, profile.max_slippage_bps, deadline=deadline
+                )
 
             # Validate route
-            validate_route(quote, profile.max_slippage_bps)
+            with EXECUTION_STAGE_SECONDS.labels("validate").time():
+                validate_route(quote, profile.max_slippage_bps)
 
             # Build swap transaction
-            swap = await build_swap_transaction(quote, owner)
+            with EXECUTION_STAGE_SECONDS.labels("build").time():
+                swap = await _jupiter_retry.run(build_swap_transaction, quote, owner, deadline=deadline)
 
-            # Update transaction with quote results
-            tx.amount_out = int(quote.out_amount)
-            tx.status = TX_CONFIRMED
+            with EXECUTION_STAGE_SECONDS.labels("commit").time():
+                # Update transaction with quote results
+                tx.amount_out = int(quote.out_amount)
+                tx.status = TX_CONFIRMED
 
-            # Update vault balances
-            if signal_type == SIGNAL_SOL_TO_USDC:
-                await vault_repo.adjust_sol_balance(owner, -amount)
-                await vault_repo.adjust_usdc_balance(owner, int(quote.out_amount))
-            else:
-                await vault_repo.adjust_usdc_balance(owner, -amount)
-                await vault_repo.adjust_sol_balance(owner, int(quote.out_amount))
+                # Update vault balances
+                if signal_type == SIGNAL_SOL_TO_USDC:
+                    await vault_repo.adjust_sol_balance(owner, -amount)
+                    await vault_repo.adjust_usdc_balance(owner, int(quote.out_amount))
+                else:
+                    await vault_repo.adjust_usdc_balance(owner, -amount)
+                    await vault_repo.adjust_sol_balance(owner, int(quote.out_amount))
 
-            # Update last execution
-            await user_repo.update_last_execution(owner, datetime.now(timezone.utc))
+                # Update last execution
+                await user_repo.update_last_execution(owner, datetime.now(timezone.utc))
 
-            await session.commit()
+                await session.commit()
             logger.info(
                 "Signal %d executed for user %s: %s -> %s (tx=%s)",
                 signal_id,
@@ -114,8 +236,134 @@ async def _execute_for_user_async(signal_id: int, signal_type: str, owner: str)
                 quote.out_amount,
                 swap.swap_transaction[:20],
             )
+            return TX_CONFIRMED
 
         except Exception as e:
             logger.error("Execution failed for user %s: %s", owner, str(e))
-            await tx_repo.update_status(tx.id, TX_FAILED, error_message=str(e))
+            # Discard partial writes before marking the transaction failed;
+            # if that fails too the error propagates to the job
+            await session.rollback()
+            await tx_repo.update_status(tx_id, TX_FAILED, error_message=str(e))
             await session.commit()
+            return TX_FAILED
+
+
+async def _execute_aggregate_async(signal_id: int, signal_type: str, owners: list[str]) -> dict[str, str]:
+    """Execute a signal for many users as one netted Jupiter swap.
+
+    The trade sizes of all eligible users are summed into a single quote and
+    swap signed by the aggregate wallet, under the strictest slippage limit
+    among them. The output is allocated back pro rata to each user's
+    transaction and vault balance.
+    """
+    results = {owner: EXECUTION_SKIPPED for owner in owners}
+
+    if signal_type == SIGNAL_SOL_TO_USDC:
+        input_mint, output_mint = WSOL_MINT, USDC_MINT
+    elif signal_type == SIGNAL_USDC_TO_SOL:
+        input_mint, output_mint = USDC_MINT, WSOL_MINT
+    else:
+        logger.error("Invalid signal type: %s", signal_type)
+        return results
+
+    async with async_session_factory() as session:
+        user_repo = UserRepository(session)
+        vault_repo = VaultRepository(session)
+        tx_repo = TransactionRepository(session)
+
+        profiles = {profile.owner: profile for profile in await user_repo.get_by_owners(owners)}
+        vaults = {vault.owner: vault for vault in await vault_repo.get_by_owners(owners)}
+
+        # (owner, amount, max slippage) for users with enough balance
+        participants: list[tuple[str, int, int]] = []
+        for owner in owners:
+            profile = profiles.get(owner)
+            vault = vaults.get(owner)
+            if not profile or not vault:
+                logger.error("User or vault %s not found", owner)
+                continue
+            if signal_type == SIGNAL_SOL_TO_USDC:
+                amount, balance = profile.trade_size_sol, vault.sol_balance
+            else:
+                amount, balance = profile.trade_size_usdc, vault.usdc_balance
+            if balance < amount:
+                logger.warning("User %s: insufficient balance", owner)
+                continue
+            participants.append((owner, amount, profile.max_slippage_bps))
+
+        if not participants:
+            return results
+
+        if not is_jupiter_available():
+            logger.warning("Signal %d: Jupiter circuit open, skipping aggregate execution", signal_id)
+            return results
+
+        amounts = [amount for _, amount, _ in participants]
+        total_in = sum(amounts)
+        slippage_bps = min(max_slippage for _, _, max_slippage in participants)
+
+        # Create pending transactions
+        now = datetime.now(timezone.utc)
+        txs = await tx_repo.bulk_create([
+            {
+                "owner": owner,
+                "date": now,
+                "type": signal_type,
+                "amount_in": amount,
+                "amount_out": 0,
+                "token_in": input_mint,
+                "token_out": output_mint,
+                "slippage_bps": slippage_bps,
+                "fee": 0,
+                "status": TX_PENDING,
+            }
+            for owner, amount, _ in participants
+        ])
+        tx_ids = [tx.id for tx in txs]
+        await session.commit()
+
+        try:
+            deadline = job_deadline()
+            with EXECUTION_STAGE_SECONDS.labels("quote").time():
+                quote = await _jupiter_retry.run(
+                    get_quote, input_mint, output_mint, total_in, slippage_bps, deadline=deadline
+                )
+            with EXECUTION_STAGE_SECONDS.labels("validate").time():
+                validate_route(quote, slippage_bps)
+            with EXECUTION_STAGE_SECONDS.labels("build").time():
+                swap = await _jupiter_retry.run(
+                    build_swap_transaction, quote, settings.execution_aggregate_wallet, deadline=deadline
+                )
+
+            shares = allocate_pro_rata(int(quote.out_amount), amounts)
+            participant_owners = [owner for owner, _, _ in participants]
+            if signal_type == SIGNAL_SOL_TO_USDC:
+                deltas = {owner: (-amount, share) for (owner, amount, _), share in zip(participants, shares)}
+            else:
+                deltas = {owner: (share, -amount) for (owner, amount, _), share in zip(participants, shares)}
+
+            with EXECUTION_STAGE_SECONDS.labels("commit").time():
+                await tx_repo.bulk_update_status(tx_ids, TX_CONFIRMED, amounts_out=shares)
+                await vault_repo.bulk_adjust_balances(deltas)
+                await user_repo.bulk_update_last_execution(participant_owners, datetime.now(timezone.utc))
+                await session.commit()
+            results.update(dict.fromkeys(participant_owners, TX_CONFIRMED))
+            logger.info(
+                "Signal %d aggregate executed for %d users: %s -> %s (tx=%s)",
+                signal_id,
+                len(participants),
+                quote.in_amount,
+                quote.out_amount,
+                swap.swap_transaction[:20],
+            )
+
+        except Exception as e:
+            logger.error("Aggregate execution failed for signal %d: %s", signal_id, str(e))
+            # Discard partial balance writes before marking the batch failed;
+            # if that fails too the error propagates to the job
+            await session.rollback()
+            await tx_repo.bulk_update_status(tx_ids, TX_FAILED, error_message=str(e))
+            await session.commit()
+            results.update({owner: TX_FAILED for owner, _, _ in participants})
+
+    return results
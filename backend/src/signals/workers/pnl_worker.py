@@ -0,0 +1,88 @@
+"""Daily PnL snapshots.
+
+Each enabled user's net gains from the day's confirmed swaps are valued at
+the current SOL/USD price and appended to their PnL history. Run once per
+UTC day, after midnight, as the RQ job ``snapshot_pnl`` or from cron:
+
+    python -m src.signals.workers.pnl_worker [--date YYYY-MM-DD]
+
+Users that already have a snapshot for the day are left alone, so re-runs
+are safe.
+"""
+import argparse
+from datetime import date, datetime, timedelta, timezone
+
+from src.common.constants import lamports_to_sol, usdc_base_to_human
+from src.common.logging import setup_logger
+from src.common.tracing import job_span
+from src.db.base import async_session_factory
+from src.db.models.pnl_snapshot import PnlSnapshot
+from src.db.repositories.pnl_repo import PnlRepository
+from src.db.repositories.transaction_repo import TransactionRepository
+from src.db.repositories.user_repo import UserRepository
+from src.jupiter.price_service import resolve_sol_price
+from src.signals.workers.runtime import run_async
+
+logger = setup_logger("signals")
+
+
+def snapshot_pnl(day: str | None = None) -> int:
+    """Entry point for RQ. ``day`` is an ISO date and defaults to yesterday (UTC)."""
+    with job_span("snapshot_pnl"):
+        return run_async(_snapshot_pnl_async(date.fromisoformat(day) if day else None))
+
+
+def _snapshot_row(owner: str, day: date, flows: tuple[int, int], sol_price: float, last: PnlSnapshot | None) -> dict:
+    sol_pnl = lamports_to_sol(flows[0])
+    usdc_pnl = usdc_base_to_human(flows[1])
+    daily_pnl = sol_pnl * sol_price + usdc_pnl
+
+    def cumulative(field: str, daily: float) -> float:
+        return float(getattr(last, field)) + daily if last is not None else daily
+
+    return {
+        "owner": owner,
+        "date": day,
+        "daily_pnl": round(daily_pnl, 2),
+        "cumulative_pnl": round(cumulative("cumulative_pnl", daily_pnl), 2),
+        "daily_sol_pnl": round(sol_pnl, 9),
+        "cumulative_sol_pnl": round(cumulative("cumulative_sol_pnl", sol_pnl), 9),
+        "daily_usdc_pnl": round(usdc_pnl, 6),
+        "cumulative_usdc_pnl": round(cumulative("cumulative_usdc_pnl", usdc_pnl), 6),
+    }
+
+
+async def _snapshot_pnl_async(day: date | None = None) -> int:
+    """Write the snapshots for ``day``. Returns the number of snapshots created."""
+    day = day or datetime.now(timezone.utc).date() - timedelta(days=1)
+    day_start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+    # Resolved once, so every snapshot of the day is valued at the same price
+    sol_price = await resolve_sol_price()
+
+    async with async_session_factory() as session:
+        pnl_repo = PnlRepository(session)
+        owners = [profile.owner for profile in await UserRepository(session).get_enabled_users()]
+        flows = await TransactionRepository(session).net_flows_by_owner(day_start, day_start + timedelta(days=1))
+        latest = await pnl_repo.get_latest_by_owners(owners, day)
+
+        rows = [
+            _snapshot_row(owner, day, flows.get(owner, (0, 0)), sol_price, latest.get(owner))
+            for owner in owners
+            if owner not in latest or latest[owner].date != day
+        ]
+        await pnl_repo.bulk_create(rows, sol_price=sol_price)
+        await session.commit()
+
+    logger.info("PnL snapshots for %s: %d created at SOL/USD %.2f", day, len(rows), sol_price)
+    return len(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write the daily PnL snapshots")
+    parser.add_argument("--date", default=None, help="UTC day to snapshot, YYYY-MM-DD (default: yesterday)")
+    args = parser.parse_args()
+    snapshot_pnl(args.date)
+
+
+if __name__ == "__main__":
+    main()
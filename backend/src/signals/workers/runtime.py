@@ -0,0 +1,79 @@
+"""Long-lived async runtime for RQ worker processes.
+
+Jobs run their coroutines through ``run_async`` so that every job in a
+process shares one event loop. This keeps the asyncpg pool behind the
+SQLAlchemy engine and the Jupiter ``httpx.AsyncClient`` warm between jobs.
+
+The default RQ ``Worker`` forks a fresh work horse per job, which throws the
+loop away again. Start workers with ``AsyncWorker`` to execute jobs in the
+worker process itself, export metrics and close the shared resources on
+shutdown:
+
+    rq worker -w src.signals.workers.runtime.AsyncWorker signals executions
+"""
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+from rq import SimpleWorker
+
+from src.common.logging import setup_logger
+from src.common.metrics import export_worker_metrics
+
+logger = setup_logger("signals")
+
+T = TypeVar("T")
+
+_runner: asyncio.Runner | None = None
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on this process's persistent event loop."""
+    global _runner
+    if _runner is None:
+        _runner = asyncio.Runner()
+        logger.info("Worker event loop started")
+    return _runner.run(coro)
+
+
+async def _close_resources() -> None:
+    from src.db.base import engine
+    from src.jupiter.route_builder import _client
+
+    await _client.close()
+    await engine.dispose()
+
+
+def shutdown() -> None:
+    """Close warm resources and the persistent event loop, if one was started."""
+    global _runner
+    if _runner is None:
+        return
+    try:
+        _runner.run(_close_resources())
+    except Exception as e:
+        logger.error("Error closing worker resources: %s", str(e))
+    finally:
+        _runner.close()
+        _runner = None
+        logger.info("Worker event loop closed")
+
+
+class AsyncWorker(SimpleWorker):
+    """RQ worker that runs jobs in-process on a persistent event loop.
+
+    Metrics are exported after jobs (rate limited) and once more on shutdown.
+    """
+
+    def execute_job(self, job, queue):
+        try:
+            return super().execute_job(job, queue)
+        finally:
+            export_worker_metrics()
+
+    def teardown(self):
+        try:
+            shutdown()
+        finally:
+            export_worker_metrics(force=True)
+            super().teardown()
@@ -1,28 +1,29 @@
-import asyncio
-from datetime import datetime, timezone
-
-from sqlalchemy import func, select
+import time
 
 from src.common.logging import setup_logger
 from src.common.exceptions import CooldownActiveError, DailyLimitExceededError
+from src.common.metrics import SIGNAL_FANOUT_SECONDS, SIGNAL_LAST_ELIGIBLE_USERS, SIGNAL_USERS
+from src.common.tracing import job_span
 from src.db.base import async_session_factory
-from src.db.models.transaction import Transaction
 from src.db.repositories.signal_repo import SignalRepository
 from src.db.repositories.user_repo import UserRepository
-from src.signals.queue import get_execution_queue
+from src.signals.queue import enqueue_executions
 from src.signals.validator import validate_user_for_signal
+from src.signals.workers.runtime import run_async
 
 logger = setup_logger("signals")
 
 
 def process_signal(signal_id: int, signal_type: str) -> None:
-    """Entry point for RQ signal worker. Runs the async logic in an event loop."""
-    asyncio.run(_process_signal_async(signal_id, signal_type))
+    """Entry point for RQ signal worker. Runs the async logic on the worker's event loop."""
+    with job_span("process_signal", **{"signal.id": signal_id, "signal.type": signal_type}):
+        run_async(_process_signal_async(signal_id, signal_type))
 
 
 async def _process_signal_async(signal_id: int, signal_type: str) -> None:
     """Fan out signal to all eligible users."""
     logger.info("Processing signal %d type=%s", signal_id, signal_type)
+    start = time.perf_counter()
 
     async with async_session_factory() as session:
         signal_repo = SignalRepository(session)
@@ -30,43 +31,28 @@ async def _process_signal_async(signal_id: int, signal_type: str) -> None:
 
         await signal_repo.update_status(signal_id, "processing")
 
+        # Execution counters are loaded with the profiles, so daily limits need no count queries
         enabled_users = await user_repo.get_enabled_users()
-        eligible_count = 0
+        eligible_owners: list[str] = []
+        skipped = errors = 0
 
         for profile in enabled_users:
             try:
-                # Count today's executions for this user
-                today_start = datetime.now(timezone.utc).replace(
-                    hour=0, minute=0, second=0, microsecond=0
-                )
-                result = await session.execute(
-                    select(func.count())
-                    .select_from(Transaction)
-                    .where(
-                        Transaction.owner == profile.owner,
-                        Transaction.date >= today_start,
-                    )
-                )
-                daily_count = result.scalar_one()
-
-                if validate_user_for_signal(profile, daily_count):
-                    # Enqueue execution for this user
-                    execution_queue = get_execution_queue()
-                    execution_queue.enqueue(
-                        "src.signals.workers.execution_worker.execute_for_user",
-                        signal_id,
-                        signal_type,
-                        profile.owner,
-                        job_timeout="5m",
-                    )
-                    eligible_count += 1
-                    logger.info("Enqueued execution for user %s", profile.owner)
+                if validate_user_for_signal(profile):
+                    eligible_owners.append(profile.owner)
+                else:
+                    skipped += 1
 
             except (CooldownActiveError, DailyLimitExceededError) as e:
-                logger.info("User %s skipped: %s", profile.owner, str(e))
+                skipped += 1
+                logger.debug("User %s skipped: %s", profile.owner, str(e))
             except Exception as e:
+                errors += 1
                 logger.error("Error processing user %s: %s", profile.owner, str(e))
 
+        # Enqueue executions for all eligible users in pipelined batches
+        eligible_count = enqueue_executions(signal_id, signal_type, eligible_owners)
+
         await signal_repo.update_status(
             signal_id,
             "completed",
@@ -74,4 +60,9 @@ async def _process_signal_async(signal_id: int, signal_type: str) -> None:
         )
         await session.commit()
 
+    SIGNAL_FANOUT_SECONDS.observe(time.perf_counter() - start)
+    SIGNAL_USERS.labels("eligible").inc(len(eligible_owners))
+    SIGNAL_USERS.labels("skipped").inc(skipped)
+    SIGNAL_USERS.labels("error").inc(errors)
+    SIGNAL_LAST_ELIGIBLE_USERS.set(len(eligible_owners))
     logger.info("Signal %d completed: %d users enqueued", signal_id, eligible_count)
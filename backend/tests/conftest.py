@@ -11,10 +11,12 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 os.environ["DATABASE_URL"] = "sqlite+aiosqlite://"
 os.environ["REDIS_URL"] = "redis://localhost:6379/15"
 os.environ["LOG_DIR"] = "test_logs"
+os.environ["TRACING_EXPORTER"] = "memory"
 
 from src.db.base import Base  # noqa: E402
 from src.api.main import create_app  # noqa: E402
-from src.api.dependencies import get_db_session  # noqa: E402
+from src.api.dependencies import get_db_session, get_read_db_session  # noqa: E402
+from src.common.tracing import instrument_engine  # noqa: E402
 
 # In-memory SQLite with shared cache so all connections see the same DB
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:?cache=shared"
@@ -24,6 +26,7 @@ test_engine = create_async_engine(
     connect_args={"check_same_thread": False},
     echo=False,
 )
+instrument_engine(test_engine)
 test_session_factory = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -58,6 +61,7 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db_session] = override_get_db
+    app.dependency_overrides[get_read_db_session] = override_get_db
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
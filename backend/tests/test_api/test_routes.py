@@ -1,7 +1,12 @@
-from datetime import date, datetime, timezone
+import gzip
+import logging
+from datetime import date, datetime, timedelta, timezone
 
+import fakeredis
 import pytest
 from httpx import AsyncClient
+from opentelemetry.trace import format_trace_id
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.common.constants import (
@@ -11,12 +16,15 @@ from src.common.constants import (
     USDC_MINT,
     TX_CONFIRMED,
 )
+from src.common import tracing
+from src.db.repositories.signal_repo import SignalRepository
 from src.db.repositories.user_repo import UserRepository
 from src.db.repositories.vault_repo import VaultRepository
 from src.db.repositories.pnl_repo import PnlRepository
 from src.db.repositories.transaction_repo import TransactionRepository
+from src.signals import queue as queue_module
 
-from tests.conftest import TEST_WALLET, WALLET_HEADERS
+from tests.conftest import TEST_WALLET, WALLET_HEADERS, test_engine
 
 
 @pytest.mark.asyncio
@@ -30,6 +38,58 @@ class TestHealthEndpoint:
         assert "redis" in data
 
 
+@pytest.mark.asyncio
+class TestRequestLogging:
+    async def test_request_id_header(self, client: AsyncClient):
+        first = await client.get("/api/health")
+        second = await client.get("/api/health")
+        assert first.headers["X-Request-ID"]
+        assert first.headers["X-Request-ID"] != second.headers["X-Request-ID"]
+
+    async def test_logs_status_and_request_id(self, client: AsyncClient, caplog):
+        with caplog.at_level(logging.INFO, logger="api"):
+            response = await client.get("/api/transactions?cursor=bogus", headers=WALLET_HEADERS)
+
+        assert response.status_code == 422
+        request_id = response.headers["X-Request-ID"]
+        # The error handler sees the same ID as the access log line
+        assert any(f"ERR {request_id} | 422" in r.getMessage() for r in caplog.records)
+        access = [r.getMessage() for r in caplog.records if r.getMessage().startswith(f"REQ {request_id}")]
+        assert len(access) == 1
+        assert "GET /api/transactions | 422 |" in access[0]
+        assert f"wallet={TEST_WALLET}" in access[0]
+
+
+@pytest.mark.asyncio
+class TestMetricsEndpoint:
+    async def test_exposes_request_and_queue_metrics(self, client: AsyncClient, monkeypatch):
+        monkeypatch.setattr(queue_module, "_redis_conn", fakeredis.FakeStrictRedis())
+        monkeypatch.setattr(queue_module, "_queues", {})
+        queue_module.enqueue_executions(1, SIGNAL_SOL_TO_USDC, ["a", "b"])
+
+        await client.get("/api/transactions?cursor=bogus", headers=WALLET_HEADERS)
+        await client.post("/api/vaults/invalid/deposit", json={"amount": 1.0}, headers=WALLET_HEADERS)
+        response = await client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        body = response.text
+        # Labelled with the route template, not the raw path
+        assert 'http_request_duration_seconds_count{method="GET",route="/api/transactions",status="422"}' in body
+        assert 'route="/api/vaults/{token}/deposit"' in body
+        assert 'rq_queue_depth{queue="executions"} 2.0' in body
+        assert 'rq_queue_depth{queue="signals"} 0.0' in body
+
+    async def test_queue_depth_failure_still_serves_metrics(self, client: AsyncClient, monkeypatch):
+        def unavailable():
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr("src.api.routes.metrics.queue_depths", unavailable)
+        response = await client.get("/metrics")
+        assert response.status_code == 200
+        assert "http_request_duration_seconds" in response.text
+
+
 @pytest.mark.asyncio
 class TestPortfolioEndpoint:
     async def test_get_metrics(self, client: AsyncClient, db_session: AsyncSession):
@@ -182,6 +242,61 @@ class TestTransactionsEndpoint:
         assert data["pagination"]["total"] == 15
         assert data["pagination"]["total_pages"] == 3
 
+    async def test_cursor_pagination(self, client: AsyncClient, db_session: AsyncSession):
+        user_repo = UserRepository(db_session)
+        tx_repo = TransactionRepository(db_session)
+        await user_repo.create(TEST_WALLET)
+        await db_session.commit()
+
+        base = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        # Several rows share a date so the id tie-breaker is exercised
+        dates = [base, base, base, base + timedelta(hours=1), base + timedelta(hours=1),
+                 base + timedelta(hours=2), base + timedelta(hours=3)]
+        for date in dates:
+            await tx_repo.create(
+                owner=TEST_WALLET,
+                date=date,
+                type=SIGNAL_SOL_TO_USDC,
+                amount_in=1_000_000_000,
+                amount_out=150_000_000,
+                token_in=WSOL_MINT,
+                token_out=USDC_MINT,
+                slippage_bps=50,
+                fee=10_000,
+                status=TX_CONFIRMED,
+            )
+        await db_session.commit()
+
+        for sort_dir, expected in [("desc", [7, 6, 5, 4, 3, 2, 1]), ("asc", [1, 2, 3, 4, 5, 6, 7])]:
+            seen = []
+            cursor = ""
+            while cursor is not None:
+                response = await client.get(
+                    "/api/transactions",
+                    params={"cursor": cursor, "page_size": 3, "sort_dir": sort_dir},
+                    headers=WALLET_HEADERS,
+                )
+                assert response.status_code == 200
+                data = response.json()
+                seen.extend(tx["id"] for tx in data["transactions"])
+                assert data["pagination"]["total"] is None
+                cursor = data["pagination"]["next_cursor"]
+            assert seen == expected
+
+        response = await client.get(
+            "/api/transactions",
+            params={"cursor": "", "page_size": 10, "include_total": True},
+            headers=WALLET_HEADERS,
+        )
+        pagination = response.json()["pagination"]
+        assert pagination == {"page_size": 10, "next_cursor": None, "total": 7}
+
+    async def test_invalid_cursor(self, client: AsyncClient):
+        response = await client.get(
+            "/api/transactions", params={"cursor": "not-a-cursor"}, headers=WALLET_HEADERS
+        )
+        assert response.status_code == 422
+
     async def test_csv_export(self, client: AsyncClient, db_session: AsyncSession):
         user_repo = UserRepository(db_session)
         tx_repo = TransactionRepository(db_session)
@@ -205,6 +320,43 @@ class TestTransactionsEndpoint:
         response = await client.get("/api/transactions/export", headers=WALLET_HEADERS)
         assert response.status_code == 200
         assert "text/csv" in response.headers["content-type"]
+        lines = response.text.splitlines()
+        assert lines[0] == "Date,Type,Amount In,Amount Out,Slippage BPS,Fee,Status,Signature"
+        assert lines[1].split(",")[1:] == ["SOL_TO_USDC", "2.5", "370.0", "50", "2.5e-05", "confirmed", ""]
+
+    async def test_csv_export_streams_all_rows_gzipped(self, client: AsyncClient, db_session: AsyncSession):
+        user_repo = UserRepository(db_session)
+        tx_repo = TransactionRepository(db_session)
+        await user_repo.create(TEST_WALLET)
+        await db_session.commit()
+
+        base = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        await tx_repo.bulk_create([
+            {
+                "owner": TEST_WALLET,
+                "date": base + timedelta(minutes=i),
+                "type": SIGNAL_SOL_TO_USDC,
+                "amount_in": 1_000_000_000,
+                "amount_out": 150_000_000,
+                "token_in": WSOL_MINT,
+                "token_out": USDC_MINT,
+                "slippage_bps": 50,
+                "fee": 10_000,
+                "status": TX_CONFIRMED,
+            }
+            for i in range(2_500)
+        ])
+        await db_session.commit()
+
+        response = await client.get(
+            "/api/transactions/export", params={"gzip": True}, headers=WALLET_HEADERS
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        lines = gzip.decompress(response.content).decode().splitlines()
+        assert len(lines) == 2_501
+        # Newest first
+        assert lines[1].startswith((base + timedelta(minutes=2_499)).strftime("%Y-%m-%dT%H:%M"))
 
 
 @pytest.mark.asyncio
@@ -290,6 +442,32 @@ class TestSignalsEndpoint:
         assert data["signal_type"] == "SOL_TO_USDC"
         assert data["status"] == "received"
 
+    async def test_receive_signal_starts_trace(self, client: AsyncClient, db_session: AsyncSession):
+        tracing.memory_exporter.clear()
+        response = await client.post("/api/signals", json={"signal_type": "SOL_TO_USDC"})
+        signal = await SignalRepository(db_session).get_by_id(response.json()["id"])
+
+        spans = tracing.memory_exporter.get_finished_spans()
+        root = next(span for span in spans if span.name == "receive_signal")
+        assert signal.trace_id == format_trace_id(root.context.trace_id)
+        assert root.attributes["signal.id"] == signal.id
+        # The INSERT runs inside the signal's span
+        assert any(
+            span.name == "db INSERT" and span.parent is not None and span.parent.span_id == root.context.span_id
+            for span in spans
+        )
+
+    async def test_signal_history(self, client: AsyncClient, db_session: AsyncSession):
+        for _ in range(3):
+            await client.post("/api/signals", json={"signal_type": "SOL_TO_USDC"})
+
+        response = await client.get("/api/signals", params={"limit": 2})
+        assert response.status_code == 200
+        signals = response.json()["signals"]
+        assert len(signals) == 2
+        assert signals[0]["signal_type"] == "SOL_TO_USDC"
+        assert signals[0]["status"] == "received"
+
     async def test_invalid_signal_type(self, client: AsyncClient):
         response = await client.post(
             "/api/signals",
@@ -314,3 +492,134 @@ class TestStrategyEndpoint:
         assert data["enabled"] is True
         assert data["current_position"] == "SOL"
         assert data["total_executions"] == 0
+
+    async def test_status_execution_counts(self, client: AsyncClient, db_session: AsyncSession):
+        await UserRepository(db_session).create(TEST_WALLET)
+        await db_session.commit()
+        tx_repo = TransactionRepository(db_session)
+        now = datetime.now(timezone.utc)
+        for when in [now, now - timedelta(days=2), now]:
+            await tx_repo.create(
+                owner=TEST_WALLET,
+                date=when,
+                type=SIGNAL_SOL_TO_USDC,
+                amount_in=1_000_000_000,
+                amount_out=150_000_000,
+                token_in=WSOL_MINT,
+                token_out=USDC_MINT,
+                slippage_bps=50,
+                fee=10_000,
+                status=TX_CONFIRMED,
+            )
+        await db_session.commit()
+
+        response = await client.get("/api/strategy/status", headers=WALLET_HEADERS)
+        data = response.json()
+        assert data["total_executions"] == 3
+        assert data["daily_executions"] == 2
+
+
+@pytest.mark.asyncio
+class TestDashboardEndpoint:
+    async def test_new_wallet(self, client: AsyncClient):
+        response = await client.get("/api/dashboard", headers=WALLET_HEADERS)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["vaults"]["sol_balance"] == 0
+        assert data["strategy"]["total_executions"] == 0
+        assert data["pnl"]["history"] == []
+
+    async def test_matches_individual_endpoints(self, client: AsyncClient, db_session: AsyncSession):
+        await UserRepository(db_session).create(TEST_WALLET)
+        await VaultRepository(db_session).create(TEST_WALLET, sol_balance=3_000_000_000, usdc_balance=250_000_000)
+        await PnlRepository(db_session).create(
+            owner=TEST_WALLET,
+            date=date.today(),
+            daily_pnl=12.5,
+            cumulative_pnl=40.0,
+            daily_sol_pnl=0.01,
+            cumulative_sol_pnl=0.2,
+            daily_usdc_pnl=3.0,
+            cumulative_usdc_pnl=9.0,
+            sol_price=148.32,
+        )
+        await TransactionRepository(db_session).create(
+            owner=TEST_WALLET,
+            date=datetime.now(timezone.utc),
+            type=SIGNAL_SOL_TO_USDC,
+            amount_in=1_000_000_000,
+            amount_out=150_000_000,
+            token_in=WSOL_MINT,
+            token_out=USDC_MINT,
+            slippage_bps=50,
+            fee=10_000,
+            status=TX_CONFIRMED,
+        )
+        await db_session.commit()
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            response = await client.get("/api/dashboard", headers=WALLET_HEADERS)
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+        data = response.json()
+        # Profile, vault and counter in one query, plus the PnL history
+        assert len(statements) == 2
+
+        for key, path in [
+            ("portfolio", "/api/portfolio/metrics"),
+            ("vaults", "/api/vaults/balances"),
+            ("strategy", "/api/strategy/status"),
+            ("pnl", "/api/pnl/history?range=30"),
+        ]:
+            assert data[key] == (await client.get(path, headers=WALLET_HEADERS)).json()
+
+
+@pytest.mark.asyncio
+class TestOnboardingEndpoint:
+    async def test_onboard(self, client: AsyncClient, db_session: AsyncSession):
+        response = await client.post("/api/onboarding", headers=WALLET_HEADERS)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["created"] is True
+        assert data["settings"]["owner"] == TEST_WALLET
+        assert data["vaults"]["sol_balance"] == 0
+        assert await UserRepository(db_session).get_by_owner(TEST_WALLET) is not None
+        assert await VaultRepository(db_session).get_by_owner(TEST_WALLET) is not None
+
+        response = await client.post("/api/onboarding", headers=WALLET_HEADERS)
+        assert response.json()["created"] is False
+
+    async def test_reads_for_new_wallet_do_not_write(self, client: AsyncClient, db_session: AsyncSession):
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        paths = [
+            "/api/settings",
+            "/api/vaults/balances",
+            "/api/strategy/status",
+            "/api/portfolio/metrics",
+            "/api/dashboard",
+        ]
+        event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            responses = [await client.get(path, headers=WALLET_HEADERS) for path in paths]
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+        assert all(response.status_code == 200 for response in responses)
+        assert all(statement.lstrip().upper().startswith("SELECT") for statement in statements)
+        assert responses[0].json()["max_slippage_bps"] == 50
+        assert await UserRepository(db_session).get_by_owner(TEST_WALLET) is None
+
+        # Defaults match what onboarding stores
+        onboarded = await client.post("/api/onboarding", headers=WALLET_HEADERS)
+        assert onboarded.json()["settings"] == responses[0].json()
+        assert onboarded.json()["vaults"] == responses[1].json()
@@ -0,0 +1,85 @@
+import json
+import logging
+import queue
+import sys
+from logging.handlers import QueueListener
+
+from src.common.logging import DebugSampler, FileRouter, JsonFormatter, _RecordQueueHandler, setup_logger
+
+
+def _record(level: int = logging.INFO, msg: str = "hello %s", args=("world",), name: str = "api", exc_info=None):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, exc_info)
+
+
+class TestDebugSampler:
+    def test_keeps_every_nth_debug_record(self):
+        sampler = DebugSampler(0.25)
+        kept = [sampler.filter(_record(logging.DEBUG)) for _ in range(8)]
+        assert kept == [True, False, False, False, True, False, False, False]
+
+    def test_info_and_above_always_pass(self):
+        sampler = DebugSampler(0.0)
+        assert not sampler.filter(_record(logging.DEBUG))
+        assert sampler.filter(_record(logging.INFO))
+        assert sampler.filter(_record(logging.ERROR))
+
+    def test_full_rate_keeps_everything(self):
+        sampler = DebugSampler(1.0)
+        assert all(sampler.filter(_record(logging.DEBUG)) for _ in range(5))
+
+
+class TestJsonFormatter:
+    def test_format(self):
+        entry = json.loads(JsonFormatter().format(_record()))
+        assert entry["message"] == "hello world"
+        assert entry["level"] == "INFO"
+        assert entry["logger"] == "api"
+        assert "exc_info" not in entry
+
+    def test_includes_exception(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = _record(logging.ERROR, exc_info=sys.exc_info())
+        entry = json.loads(JsonFormatter().format(record))
+        assert "ValueError: boom" in entry["exc_info"]
+
+
+class TestQueuePipeline:
+    def test_prepare_merges_args_and_exception(self):
+        handler = _RecordQueueHandler(queue.SimpleQueue())
+        try:
+            raise RuntimeError("bad")
+        except RuntimeError:
+            record = _record(logging.ERROR, exc_info=sys.exc_info())
+
+        prepared = handler.prepare(record)
+        assert prepared.msg == "hello world"
+        assert prepared.args is None
+        assert prepared.exc_info is None
+        assert "RuntimeError: bad" in prepared.exc_text
+        # The caller's record is left untouched for other handlers
+        assert record.args == ("world",)
+
+    def test_records_routed_to_logger_file(self, tmp_path):
+        router = FileRouter(str(tmp_path), JsonFormatter())
+        router.add_logger("api")
+        router.add_logger("signals")
+        handler = _RecordQueueHandler(queue.SimpleQueue())
+        listener = QueueListener(handler.queue, router)
+        listener.start()
+
+        handler.handle(_record(name="api", args=("api",)))
+        handler.handle(_record(name="signals", args=("signals",)))
+        handler.handle(_record(name="unknown", args=("unknown",)))
+        listener.stop()
+        router.close()
+
+        assert json.loads((tmp_path / "api.log").read_text())["message"] == "hello api"
+        assert json.loads((tmp_path / "signals.log").read_text())["message"] == "hello signals"
+        assert not (tmp_path / "unknown.log").exists()
+
+    def test_setup_logger_only_enqueues(self):
+        logger = setup_logger("api")
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], _RecordQueueHandler)
@@ -0,0 +1,35 @@
+from prometheus_client.parser import text_string_to_metric_families
+
+from src.common import metrics
+from src.config.settings import settings
+
+
+class TestExportWorkerMetrics:
+    def test_writes_textfile_per_process(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "metrics_textfile_path", str(tmp_path / "worker-{pid}.prom"))
+        monkeypatch.setattr(settings, "metrics_pushgateway_url", "")
+        metrics.EXECUTIONS.labels("confirmed").inc()
+
+        metrics.export_worker_metrics(force=True)
+
+        files = list(tmp_path.glob("worker-*.prom"))
+        assert len(files) == 1
+        names = {family.name for family in text_string_to_metric_families(files[0].read_text())}
+        assert "executions" in names
+        assert "execution_stage_duration_seconds" in names
+
+    def test_export_is_rate_limited(self, tmp_path, monkeypatch):
+        path = tmp_path / "worker.prom"
+        monkeypatch.setattr(settings, "metrics_textfile_path", str(path))
+        monkeypatch.setattr(settings, "metrics_export_interval_seconds", 3600)
+
+        metrics.export_worker_metrics(force=True)
+        path.unlink()
+        metrics.export_worker_metrics()
+        assert not path.exists()
+
+    def test_push_failure_does_not_raise(self, monkeypatch):
+        monkeypatch.setattr(settings, "metrics_textfile_path", "")
+        monkeypatch.setattr(settings, "metrics_pushgateway_url", "http://127.0.0.1:1")
+
+        metrics.export_worker_metrics(force=True)
@@ -0,0 +1,210 @@
+import fakeredis
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from src.db import cache as cache_module
+from src.db.cache import LocalLRU, RepositoryCache
+from src.db.models.user_profile import UserProfile
+from src.db.models.vault_balance import VaultBalance
+from src.db.replicas import REPLICA_SESSION_KEY
+from src.db.repositories.user_repo import UserRepository
+from src.db.repositories.vault_repo import VaultRepository
+
+from tests.conftest import TEST_WALLET, test_session_factory as session_factory
+
+
+def _make_cache(local: LocalLRU | None = None) -> RepositoryCache:
+    cache = RepositoryCache(fakeredis.FakeAsyncRedis(), ttl_seconds=5, local=local)
+    cache.register(UserProfile, "user")
+    cache.register(VaultBalance, "vault")
+    cache.listen()
+    return cache
+
+
+@pytest_asyncio.fixture
+async def repo_cache(monkeypatch):
+    cache = _make_cache()
+    monkeypatch.setattr(cache_module, "repo_cache", cache)
+    yield cache
+    cache.unlisten()
+
+
+@pytest.mark.asyncio
+class TestRepositoryCache:
+    async def test_hit_after_miss(self, repo_cache):
+        async with session_factory() as session:
+            await UserRepository(session).create(TEST_WALLET)
+            await session.commit()
+
+        async with session_factory() as session:
+            first = await UserRepository(session).get_by_owner(TEST_WALLET)
+        async with session_factory() as session:
+            second = await UserRepository(session).get_by_owner(TEST_WALLET)
+            assert second in session
+            assert second.owner == TEST_WALLET
+            assert second.trade_size_sol == first.trade_size_sol
+            assert second.created_at == first.created_at
+
+        stats = repo_cache.stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert stats["hit_ratio"] == 0.5
+
+    async def test_missing_row_not_cached(self, repo_cache):
+        async with session_factory() as session:
+            assert await UserRepository(session).get_by_owner(TEST_WALLET) is None
+            assert await UserRepository(session).get_by_owner(TEST_WALLET) is None
+        assert repo_cache.stats()["misses"] == 2
+
+    async def test_commit_invalidates(self, repo_cache):
+        async with session_factory() as session:
+            await VaultRepository(session).get_or_create(TEST_WALLET)
+            await session.commit()
+        async with session_factory() as session:
+            await VaultRepository(session).get_by_owner(TEST_WALLET)
+
+        async with session_factory() as session:
+            await VaultRepository(session).adjust_sol_balance(TEST_WALLET, 1_000)
+            await session.commit()
+
+        async with session_factory() as session:
+            vault = await VaultRepository(session).get_by_owner(TEST_WALLET)
+            assert vault.sol_balance == 1_000
+        assert repo_cache.stats()["stale"] == 1
+
+        async with session_factory() as session:
+            vault = await VaultRepository(session).get_by_owner(TEST_WALLET)
+            assert vault.sol_balance == 1_000
+        assert repo_cache.stats()["hits"] == 1
+
+    async def test_rollback_keeps_entry(self, repo_cache):
+        async with session_factory() as session:
+            await UserRepository(session).create(TEST_WALLET)
+            await session.commit()
+        async with session_factory() as session:
+            await UserRepository(session).get_by_owner(TEST_WALLET)
+
+        async with session_factory() as session:
+            await UserRepository(session).update(TEST_WALLET, enabled=False)
+            await session.rollback()
+
+        async with session_factory() as session:
+            profile = await UserRepository(session).get_by_owner(TEST_WALLET)
+            assert profile.enabled is True
+        assert repo_cache.stats()["hits"] == 1
+
+    async def test_same_session_write_bypasses_cache(self, repo_cache):
+        async with session_factory() as session:
+            await UserRepository(session).create(TEST_WALLET)
+            await session.commit()
+
+        async with session_factory() as session:
+            repo = UserRepository(session)
+            await repo.get_by_owner(TEST_WALLET)
+            await repo.update(TEST_WALLET, enabled=False)
+            session.expire_all()
+            profile = await repo.get_by_owner(TEST_WALLET)
+            assert profile.enabled is False
+            await session.commit()
+
+        # update() re-reads the row, then the explicit read
+        assert repo_cache.stats()["bypassed"] == 2
+        async with session_factory() as session:
+            profile = await UserRepository(session).get_by_owner(TEST_WALLET)
+            assert profile.enabled is False
+
+    async def test_money_path_reads_bypass_cache(self, repo_cache):
+        async with session_factory() as session:
+            await UserRepository(session).create(TEST_WALLET)
+            await VaultRepository(session).create(TEST_WALLET, sol_balance=5)
+            await session.commit()
+        async with session_factory() as session:
+            await VaultRepository(session).get_by_owner(TEST_WALLET)
+            # A write that never went through the repositories, e.g. from another service
+            await session.execute(text("UPDATE vault_balances SET sol_balance = 1"))
+            await session.commit()
+
+        async with session_factory() as session:
+            repo = VaultRepository(session)
+            assert (await repo.get_by_owner(TEST_WALLET)).sol_balance == 5
+            # Fresh from the database, even with the cached copy already in the session
+            assert (await repo.get_by_owner(TEST_WALLET, cached=False)).sol_balance == 1
+        async with session_factory() as session:
+            repo = VaultRepository(session)
+            await repo.get_by_owner(TEST_WALLET)
+            assert (await repo.get_for_update(TEST_WALLET)).sol_balance == 1
+        assert repo_cache.stats()["hits"] == 2
+
+    async def test_orm_flush_invalidates(self, repo_cache):
+        async with session_factory() as session:
+            profile = await UserRepository(session).create(TEST_WALLET)
+            await session.commit()
+        async with session_factory() as session:
+            profile = await UserRepository(session).get_by_owner(TEST_WALLET)
+            profile.daily_limit = 7
+            await session.commit()
+
+        async with session_factory() as session:
+            profile = await UserRepository(session).get_by_owner(TEST_WALLET)
+            assert profile.daily_limit == 7
+
+    async def test_local_tier(self, monkeypatch):
+        cache = _make_cache(LocalLRU(max_size=10, ttl_seconds=60))
+        monkeypatch.setattr(cache_module, "repo_cache", cache)
+        try:
+            async with session_factory() as session:
+                await UserRepository(session).create(TEST_WALLET)
+                await session.commit()
+            for _ in range(3):
+                async with session_factory() as session:
+                    await UserRepository(session).get_by_owner(TEST_WALLET)
+            assert cache.stats()["local_hits"] == 2
+
+            async with session_factory() as session:
+                await UserRepository(session).update(TEST_WALLET, enabled=False)
+                await session.commit()
+            async with session_factory() as session:
+                profile = await UserRepository(session).get_by_owner(TEST_WALLET)
+                assert profile.enabled is False
+        finally:
+            cache.unlisten()
+
+    async def test_replica_reads_are_not_cached(self, repo_cache):
+        async with session_factory() as session:
+            await UserRepository(session).create(TEST_WALLET)
+            await session.commit()
+        for _ in range(2):
+            async with session_factory() as session:
+                session.info[REPLICA_SESSION_KEY] = True
+                assert await UserRepository(session).get_by_owner(TEST_WALLET) is not None
+        assert repo_cache.stats()["misses"] == 2
+
+    async def test_redis_failure_falls_back_to_database(self, repo_cache, monkeypatch):
+        async def broken(*args, **kwargs):
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(repo_cache._redis, "mget", broken)
+        async with session_factory() as session:
+            await UserRepository(session).create(TEST_WALLET)
+            await session.commit()
+        async with session_factory() as session:
+            profile = await UserRepository(session).get_by_owner(TEST_WALLET)
+            assert profile.owner == TEST_WALLET
+        assert repo_cache.stats()["errors"] == 1
+
+
+class TestLocalLRU:
+    def test_evicts_least_recently_used(self):
+        lru = LocalLRU(max_size=2, ttl_seconds=60)
+        lru.set("a", {"n": 1})
+        lru.set("b", {"n": 2})
+        lru.get("a")
+        lru.set("c", {"n": 3})
+        assert lru.get("b") is None
+        assert lru.get("a") == {"n": 1}
+
+    def test_expires_entries(self):
+        lru = LocalLRU(max_size=2, ttl_seconds=0)
+        lru.set("a", {"n": 1})
+        assert lru.get("a") is None
@@ -0,0 +1,70 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.db import session as session_module
+from src.db.replicas import REPLICA_SESSION_KEY, ReplicaRouter
+from src.db.session import read_session
+
+
+def _router(count: int, lags: dict[int, float | Exception], interval: float = 60.0) -> ReplicaRouter:
+    """Router over ``count`` replicas whose lag checks report ``lags`` (default 0)."""
+    engines = [create_async_engine("sqlite+aiosqlite://") for _ in range(count)]
+    router = ReplicaRouter(engines, max_lag_seconds=2.0, check_interval_seconds=interval)
+    router.checks = []
+
+    async def measure_lag(engine):
+        index = engines.index(engine)
+        router.checks.append(index)
+        lag = lags.get(index, 0.0)
+        if isinstance(lag, Exception):
+            raise lag
+        return lag
+
+    router.measure_lag = measure_lag
+    return router
+
+
+@pytest.mark.asyncio
+class TestReplicaRouter:
+    async def test_round_robin(self):
+        router = _router(2, {})
+        picked = [await router.pick() for _ in range(4)]
+        assert picked[0] is picked[2]
+        assert picked[1] is picked[3]
+        assert picked[0] is not picked[1]
+        # Lag is only checked once per interval
+        assert router.checks == [0, 1]
+
+    async def test_skips_lagging_and_unreachable_replicas(self):
+        router = _router(3, {0: 10.0, 1: ConnectionError("down")})
+        healthy = await router.pick()
+        assert all([await router.pick() is healthy for _ in range(3)])
+
+    async def test_falls_back_to_primary(self):
+        router = _router(1, {0: 10.0})
+        assert await router.pick() is None
+        assert await ReplicaRouter([], 2.0, 5.0).pick() is None
+
+    async def test_rechecks_after_interval(self):
+        lags = {0: 10.0}
+        router = _router(1, lags, interval=0.0)
+        assert await router.pick() is None
+        lags[0] = 0.5
+        assert await router.pick() is not None
+
+    async def test_measure_lag_off_postgres(self):
+        engine = create_async_engine("sqlite+aiosqlite://")
+        assert await ReplicaRouter.measure_lag(engine) == 0.0
+        await engine.dispose()
+
+    async def test_read_session_routing(self, monkeypatch):
+        router = _router(1, {})
+        monkeypatch.setattr(session_module, "replica_router", router)
+        async with read_session() as session:
+            assert session.info[REPLICA_SESSION_KEY] is True
+            assert (await session.execute(text("SELECT 1"))).scalar() == 1
+
+        monkeypatch.setattr(session_module, "replica_router", ReplicaRouter([], 2.0, 5.0))
+        async with read_session() as session:
+            assert REPLICA_SESSION_KEY not in session.info
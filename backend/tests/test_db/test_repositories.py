@@ -1,16 +1,20 @@
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.common.constants import SIGNAL_SOL_TO_USDC, WSOL_MINT, USDC_MINT, TX_PENDING, TX_CONFIRMED
+from src.common.constants import SIGNAL_SOL_TO_USDC, WSOL_MINT, USDC_MINT, TX_PENDING, TX_CONFIRMED, TX_FAILED
+from src.config.settings import settings
+from src.db import backfill_execution_counters
 from src.db.repositories.user_repo import UserRepository
 from src.db.repositories.vault_repo import VaultRepository
 from src.db.repositories.transaction_repo import TransactionRepository
 from src.db.repositories.pnl_repo import PnlRepository
 from src.db.repositories.signal_repo import SignalRepository
+from src.db.repositories.execution_counter_repo import ExecutionCounterRepository
+from src.db.models.transaction import Transaction
 
-from tests.conftest import TEST_WALLET
+from tests.conftest import TEST_WALLET, test_session_factory as session_factory
 
 
 @pytest.mark.asyncio
@@ -54,6 +58,31 @@ class TestUserRepository:
         assert len(enabled) == 1
         assert enabled[0].owner == "wallet_1_aaaaaaaaaaaaaaaaaaaaaaaaaaa"
 
+    async def test_get_account_defaults_without_writing(self, db_session: AsyncSession):
+        repo = UserRepository(db_session)
+        default = await repo.create("wallet_1_aaaaaaaaaaaaaaaaaaaaaaaaaaa")
+
+        profile, vault, counter = await repo.get_account(TEST_WALLET)
+        assert profile.owner == TEST_WALLET
+        assert profile.trade_size_sol == default.trade_size_sol
+        assert profile.max_slippage_bps == default.max_slippage_bps
+        assert profile.daily_limit == default.daily_limit
+        assert vault.sol_balance == 0
+        assert counter is None
+        assert profile not in db_session and vault not in db_session
+        assert await repo.get_by_owner(TEST_WALLET) is None
+
+    async def test_onboard_is_idempotent(self, db_session: AsyncSession):
+        repo = UserRepository(db_session)
+        profile, created = await repo.onboard(TEST_WALLET)
+        await db_session.commit()
+        assert created is True
+        assert await VaultRepository(db_session).get_by_owner(TEST_WALLET) is not None
+
+        again, created = await repo.onboard(TEST_WALLET)
+        assert created is False
+        assert again.owner == profile.owner
+
 
 @pytest.mark.asyncio
 class TestVaultRepository:
@@ -89,6 +118,25 @@ class TestVaultRepository:
         assert vault.usdc_balance == 500_000_000
         assert vault.fee_pool_balance == 50_000_000
 
+    async def test_bulk_adjust_balances(self, db_session: AsyncSession, monkeypatch):
+        monkeypatch.setattr(settings, "db_bulk_chunk_size", 2)
+        owners = [f"wallet_{i}_{'a' * 30}" for i in range(5)]
+        user_repo = UserRepository(db_session)
+        repo = VaultRepository(db_session)
+        for owner in owners:
+            await user_repo.create(owner)
+            await repo.create(owner, sol_balance=1_000, usdc_balance=1_000)
+        await db_session.commit()
+
+        await repo.bulk_adjust_balances({owner: (-i, i * 10) for i, owner in enumerate(owners)})
+        await db_session.commit()
+
+        db_session.expire_all()
+        vaults = {vault.owner: vault for vault in await repo.get_by_owners(owners)}
+        assert [(vaults[o].sol_balance, vaults[o].usdc_balance) for o in owners] == [
+            (1_000 - i, 1_000 + i * 10) for i in range(5)
+        ]
+
 
 @pytest.mark.asyncio
 class TestTransactionRepository:
@@ -141,6 +189,121 @@ class TestTransactionRepository:
         txs, total = await repo.list_for_owner(TEST_WALLET, status_filter=TX_CONFIRMED)
         assert total == 2
 
+    async def test_bulk_create_and_update_status(self, db_session: AsyncSession, monkeypatch):
+        monkeypatch.setattr(settings, "db_bulk_chunk_size", 2)
+        user_repo = UserRepository(db_session)
+        await user_repo.create(TEST_WALLET)
+        await db_session.commit()
+
+        repo = TransactionRepository(db_session)
+        txs = await repo.bulk_create([
+            {
+                "owner": TEST_WALLET,
+                "date": datetime.now(timezone.utc),
+                "type": SIGNAL_SOL_TO_USDC,
+                "amount_in": amount_in,
+                "amount_out": 0,
+                "token_in": WSOL_MINT,
+                "token_out": USDC_MINT,
+                "slippage_bps": 50,
+                "fee": 0,
+                "status": TX_PENDING,
+            }
+            for amount_in in [100, 200, 300, 400, 500]
+        ])
+        await db_session.commit()
+        assert [tx.amount_in for tx in txs] == [100, 200, 300, 400, 500]
+
+        ids = [tx.id for tx in txs]
+        await repo.bulk_update_status(ids[:3], TX_CONFIRMED, amounts_out=[10, 20, 30])
+        await repo.bulk_update_status(ids[3:], TX_FAILED, error_message="route expired")
+        await db_session.commit()
+
+        db_session.expire_all()
+        stored, _ = await repo.list_for_owner(TEST_WALLET, sort_by="amount_in", sort_dir="asc")
+        assert [(tx.status, tx.amount_out, tx.error_message) for tx in stored] == [
+            (TX_CONFIRMED, 10, None),
+            (TX_CONFIRMED, 20, None),
+            (TX_CONFIRMED, 30, None),
+            (TX_FAILED, 0, "route expired"),
+            (TX_FAILED, 0, "route expired"),
+        ]
+
+
+def _tx_row(owner: str, when: datetime) -> dict:
+    return {
+        "owner": owner,
+        "date": when,
+        "type": SIGNAL_SOL_TO_USDC,
+        "amount_in": 1_000_000_000,
+        "amount_out": 150_000_000,
+        "token_in": WSOL_MINT,
+        "token_out": USDC_MINT,
+        "slippage_bps": 50,
+        "fee": 10_000,
+        "status": TX_CONFIRMED,
+    }
+
+
+@pytest.mark.asyncio
+class TestExecutionCounterRepository:
+    async def test_maintained_on_create(self, db_session: AsyncSession):
+        await UserRepository(db_session).create(TEST_WALLET)
+        await db_session.commit()
+
+        now = datetime.now(timezone.utc)
+        tx_repo = TransactionRepository(db_session)
+        await tx_repo.create(**_tx_row(TEST_WALLET, now - timedelta(days=2)))
+        await tx_repo.create(**_tx_row(TEST_WALLET, now))
+        await tx_repo.bulk_create([_tx_row(TEST_WALLET, now), _tx_row(TEST_WALLET, now - timedelta(days=3))])
+        await db_session.commit()
+
+        repo = ExecutionCounterRepository(db_session)
+        db_session.expire_all()
+        counter = await repo.get_by_owner(TEST_WALLET)
+        assert counter.total_count == 4
+        assert counter.daily_count(now.date()) == 2
+        assert counter.daily_count(now.date() - timedelta(days=1)) == 0
+
+    async def test_rolled_back_with_transaction(self, db_session: AsyncSession):
+        await UserRepository(db_session).create(TEST_WALLET)
+        await db_session.commit()
+
+        await TransactionRepository(db_session).create(**_tx_row(TEST_WALLET, datetime.now(timezone.utc)))
+        await db_session.rollback()
+
+        assert await ExecutionCounterRepository(db_session).get_by_owner(TEST_WALLET) is None
+
+    async def test_rebuild(self, db_session: AsyncSession):
+        await UserRepository(db_session).create(TEST_WALLET)
+        await db_session.commit()
+        now = datetime.now(timezone.utc)
+        for when in [now, now, now - timedelta(days=1)]:
+            db_session.add(Transaction(**_tx_row(TEST_WALLET, when)))
+        await db_session.commit()
+
+        repo = ExecutionCounterRepository(db_session)
+        await repo.rebuild(today=now.date())
+        await db_session.commit()
+
+        counter = await repo.get_by_owner(TEST_WALLET)
+        assert (counter.total_count, counter.day_count) == (3, 2)
+
+    async def test_backfill_entry_point(self, db_session: AsyncSession, monkeypatch):
+        await UserRepository(db_session).create(TEST_WALLET)
+        await db_session.commit()
+        now = datetime.now(timezone.utc)
+        for when in [now, now - timedelta(days=1)]:
+            db_session.add(Transaction(**_tx_row(TEST_WALLET, when)))
+        await db_session.commit()
+        monkeypatch.setattr(backfill_execution_counters, "async_session_factory", session_factory)
+
+        assert await backfill_execution_counters.backfill(today=now.date()) == 1
+
+        db_session.expire_all()
+        counter = await ExecutionCounterRepository(db_session).get_by_owner(TEST_WALLET)
+        assert (counter.total_count, counter.day_count) == (2, 1)
+
 
 @pytest.mark.asyncio
 class TestPnlRepository:
@@ -201,3 +364,17 @@ class TestSignalRepository:
         updated = await repo.get_by_id(log.id)
         assert updated.status == "completed"
         assert updated.affected_users == 5
+
+    async def test_record_latency(self, db_session: AsyncSession):
+        repo = SignalRepository(db_session)
+        log = await repo.create(signal_type=SIGNAL_SOL_TO_USDC, status="received")
+        await db_session.commit()
+
+        await repo.record_latency(log.id, 120.0)
+        await db_session.commit()
+
+        updated = await repo.get_by_id(log.id)
+        await db_session.refresh(updated)
+        assert updated.slowest_execution_ms == 120.0
+        assert updated.end_to_end_ms is not None
+        assert updated.end_to_end_ms >= 0
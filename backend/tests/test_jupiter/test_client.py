@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from src.config.settings import settings
+from src.jupiter import route_builder
+from src.jupiter.client import JupiterClient
+
+
+def _connection(idle: bool, info: str) -> MagicMock:
+    connection = MagicMock()
+    connection.is_idle.return_value = idle
+    connection.info.return_value = info
+    return connection
+
+
+@pytest.mark.asyncio
+class TestJupiterClientPool:
+    async def test_pool_configured_from_settings(self):
+        client = JupiterClient()
+        http_client = await client._get_client()
+
+        assert client.limits.max_connections == settings.jupiter_max_connections
+        assert client.limits.max_keepalive_connections == settings.jupiter_max_keepalive_connections
+        assert http_client.timeout.connect == settings.jupiter_connect_timeout
+        assert http_client.timeout.read == settings.jupiter_read_timeout
+        assert http_client.timeout.pool == settings.jupiter_pool_timeout
+        await client.close()
+
+    async def test_explicit_limits_and_timeout(self):
+        limits = httpx.Limits(max_connections=4, max_keepalive_connections=2)
+        client = JupiterClient(limits=limits, timeout=httpx.Timeout(1.0))
+        http_client = await client._get_client()
+
+        assert client.pool_stats()["max_connections"] == 4
+        assert http_client.timeout.read == 1.0
+        await client.close()
+
+    async def test_http2_falls_back_without_h2(self):
+        with patch("src.jupiter.client.importlib.util.find_spec", return_value=None):
+            client = JupiterClient(http2=True)
+        assert client.http2 is False
+
+    async def test_pool_stats(self):
+        client = JupiterClient()
+        assert client.pool_stats()["connections"] == 0
+
+        http_client = await client._get_client()
+        pool = SimpleNamespace(connections=[
+            _connection(idle=True, info="HTTP/2, IDLE, Request Count: 3"),
+            _connection(idle=False, info="HTTP/1.1, ACTIVE, Request Count: 1"),
+        ])
+        with patch.object(http_client, "_transport", SimpleNamespace(_pool=pool)):
+            stats = client.pool_stats()
+
+        assert stats["connections"] == 2
+        assert stats["idle_connections"] == 1
+        assert stats["active_connections"] == 1
+        assert stats["http2_connections"] == 1
+        await client.close()
+
+    async def test_pool_exported(self):
+        client = JupiterClient()
+        client.register_metrics()
+        http_client = await client._get_client()
+        pool = SimpleNamespace(connections=[
+            _connection(idle=True, info="HTTP/2, IDLE, Request Count: 3"),
+            _connection(idle=True, info="HTTP/1.1, IDLE, Request Count: 1"),
+        ])
+        try:
+            with patch.object(http_client, "_transport", SimpleNamespace(_pool=pool)):
+                assert REGISTRY.get_sample_value("jupiter_pool_connections", {"state": "idle"}) == 2
+                assert REGISTRY.get_sample_value("jupiter_pool_connections", {"state": "active"}) == 0
+                assert REGISTRY.get_sample_value("jupiter_pool_connections", {"state": "http2"}) == 1
+        finally:
+            route_builder._client.register_metrics()
@@ -0,0 +1,57 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.common.exceptions import JupiterAPIError
+from src.jupiter.constants import WSOL_MINT, USDC_MINT
+from src.jupiter.fake_server import FakeJupiterConfig, fake_jupiter_client
+from src.jupiter.route_builder import build_swap_transaction, get_quote, validate_route
+
+
+@pytest.mark.asyncio
+class TestFakeJupiter:
+    async def test_quote_and_swap_through_route_builder(self):
+        client, fake = fake_jupiter_client()
+
+        with patch("src.jupiter.route_builder._client", client), \
+                patch("src.jupiter.route_builder._quote_cache", None):
+            quote = await get_quote(WSOL_MINT, USDC_MINT, 2_500_000_000, 50)
+            assert validate_route(quote, max_slippage_bps=50) is True
+            swap = await build_swap_transaction(quote, "7xK3mBf9rQvZ8nJp4sW2yL6hT1cX5dA8kF3gN9fPq")
+
+        # 2.5 SOL at ~148 USD minus the 25 bps pool fee
+        assert 368_000_000 < int(quote.out_amount) < 370_800_000
+        assert quote.context_slot is not None
+        assert swap.last_valid_block_height > quote.context_slot
+        assert fake.requests["quote"] == 1
+        assert fake.requests["swap"] == 1
+        await client.close()
+
+    async def test_price_impact_grows_with_size(self):
+        client, _ = fake_jupiter_client(FakeJupiterConfig(pool_depth_sol=1_000))
+        small = await client.get("/quote", params={"inputMint": WSOL_MINT, "outputMint": USDC_MINT, "amount": 1_000_000_000})
+        large = await client.get("/quote", params={"inputMint": WSOL_MINT, "outputMint": USDC_MINT, "amount": 100_000_000_000})
+
+        assert float(large["priceImpactPct"]) > float(small["priceImpactPct"])
+        await client.close()
+
+    async def test_injected_errors(self):
+        client, fake = fake_jupiter_client(FakeJupiterConfig(error_rate=1.0, error_status=503))
+
+        with pytest.raises(JupiterAPIError) as exc_info:
+            await client.get("/quote", params={"inputMint": WSOL_MINT, "outputMint": USDC_MINT, "amount": 1})
+        assert exc_info.value.upstream_status == 503
+        assert fake.requests["errors"] == 1
+        await client.close()
+
+    async def test_rate_limit(self):
+        client, fake = fake_jupiter_client(FakeJupiterConfig(rate_limit_per_second=2))
+        params = {"inputMint": WSOL_MINT, "outputMint": USDC_MINT, "amount": 1_000}
+
+        await client.get("/quote", params=params)
+        await client.get("/quote", params=params)
+        with pytest.raises(JupiterAPIError) as exc_info:
+            await client.get("/quote", params=params)
+        assert exc_info.value.upstream_status == 429
+        assert fake.requests["rate_limited"] == 1
+        await client.close()
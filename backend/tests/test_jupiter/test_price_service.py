@@ -0,0 +1,65 @@
+import asyncio
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+
+from src.config.settings import settings
+from src.jupiter import price_service as price_module
+from src.jupiter.price_service import PriceService, StaticPriceFeed
+from tests.conftest import WALLET_HEADERS
+
+
+class FailingFeed:
+    source = "failing"
+
+    async def fetch(self) -> float:
+        raise RuntimeError("feed down")
+
+
+@pytest.mark.asyncio
+class TestPriceService:
+    async def test_fallback_until_refreshed(self):
+        service = PriceService(StaticPriceFeed(151.0), ttl_seconds=60)
+        assert await service.get_price() == settings.price_static_sol_usd
+        assert service.stats()["source"] == "fallback"
+
+        assert await service.refresh() == 151.0
+        assert await service.get_price() == 151.0
+        assert service.stats()["source"] == "static"
+
+    async def test_failed_refresh_keeps_last_price(self):
+        service = PriceService(StaticPriceFeed(151.0), ttl_seconds=60)
+        await service.refresh()
+        service.feed = FailingFeed()
+
+        assert await service.refresh() == 151.0
+        assert service.refresh_failures == 1
+
+    async def test_price_shared_through_redis(self):
+        redis_client = fakeredis.FakeAsyncRedis()
+        publisher = PriceService(StaticPriceFeed(152.5), ttl_seconds=60, redis_client=redis_client)
+        reader = PriceService(FailingFeed(), ttl_seconds=60, redis_client=redis_client)
+
+        await publisher.refresh()
+        assert await reader.get_price() == 152.5
+
+    async def test_background_refresher(self):
+        service = PriceService(StaticPriceFeed(153.0), ttl_seconds=60)
+        service.start_refresher(interval_seconds=0.01)
+        await asyncio.sleep(0.05)
+        await service.stop_refresher()
+        assert service.current_price() == 153.0
+
+
+@pytest.mark.asyncio
+class TestPriceConsumers:
+    async def test_vault_balances_use_current_price(self, client):
+        service = PriceService(StaticPriceFeed(200.0), ttl_seconds=60)
+        await service.refresh()
+
+        with patch.object(price_module, "price_service", service):
+            await client.post("/api/vaults/sol/deposit", json={"amount": 2.0}, headers=WALLET_HEADERS)
+            response = await client.get("/api/vaults/balances", headers=WALLET_HEADERS)
+
+        assert response.json()["sol_balance_usd"] == 400.0
@@ -0,0 +1,133 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import fakeredis
+import pytest
+from prometheus_client import REGISTRY
+
+from src.jupiter.constants import WSOL_MINT, USDC_MINT
+from src.jupiter.quote_cache import MemoryQuoteBackend, QuoteCache, RedisQuoteBackend
+from src.jupiter.route_builder import get_quote
+
+KEY = (WSOL_MINT, USDC_MINT, 2_500_000_000, 50)
+
+
+def _quote_data(context_slot: int = 1000, out_amount: str = "370000000") -> dict:
+    return {
+        "inputMint": WSOL_MINT,
+        "inAmount": "2500000000",
+        "outputMint": USDC_MINT,
+        "outAmount": out_amount,
+        "otherAmountThreshold": "368150000",
+        "swapMode": "ExactIn",
+        "slippageBps": 50,
+        "priceImpactPct": "0.01",
+        "routePlan": [],
+        "contextSlot": context_slot,
+    }
+
+
+@pytest.mark.asyncio
+class TestQuoteCache:
+    async def test_hit_after_miss(self):
+        cache = QuoteCache(MemoryQuoteBackend(), ttl_ms=2000, max_slot_lag=5)
+        fetch = AsyncMock(return_value=_quote_data())
+
+        first = await cache.get_or_fetch(KEY, fetch)
+        second = await cache.get_or_fetch(KEY, fetch)
+
+        assert first == second
+        assert fetch.await_count == 1
+        assert cache.stats()["hits"] == 1
+
+    async def test_lookups_exported(self):
+        def lookups(result):
+            return REGISTRY.get_sample_value("jupiter_quote_cache_lookups_total", {"result": result}) or 0
+
+        before = {result: lookups(result) for result in ("hit", "miss")}
+        cache = QuoteCache(MemoryQuoteBackend(), ttl_ms=2000, max_slot_lag=5)
+        fetch = AsyncMock(return_value=_quote_data())
+        await cache.get_or_fetch(KEY, fetch)
+        await cache.get_or_fetch(KEY, fetch)
+
+        assert lookups("miss") - before["miss"] == 1
+        assert lookups("hit") - before["hit"] == 1
+        assert cache.stats()["misses"] == 1
+
+    async def test_concurrent_requests_coalesce(self):
+        cache = QuoteCache(MemoryQuoteBackend(), ttl_ms=2000, max_slot_lag=5)
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return _quote_data()
+
+        results = await asyncio.gather(*(cache.get_or_fetch(KEY, fetch) for _ in range(10)))
+
+        assert calls == 1
+        assert all(r == results[0] for r in results)
+        assert cache.stats()["coalesced"] == 9
+
+    async def test_failure_is_shared_and_not_cached(self):
+        cache = QuoteCache(MemoryQuoteBackend(), ttl_ms=2000, max_slot_lag=5)
+        fetch = AsyncMock(side_effect=RuntimeError("down"))
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_fetch(KEY, fetch)
+
+        fetch.side_effect = None
+        fetch.return_value = _quote_data()
+        assert await cache.get_or_fetch(KEY, fetch) == _quote_data()
+
+    async def test_expired_entry_refetched(self):
+        cache = QuoteCache(MemoryQuoteBackend(), ttl_ms=1, max_slot_lag=5)
+        fetch = AsyncMock(return_value=_quote_data())
+
+        await cache.get_or_fetch(KEY, fetch)
+        await asyncio.sleep(0.01)
+        await cache.get_or_fetch(KEY, fetch)
+
+        assert fetch.await_count == 2
+
+    async def test_entry_stale_after_newer_slot(self):
+        cache = QuoteCache(MemoryQuoteBackend(), ttl_ms=2000, max_slot_lag=5)
+        other_key = (WSOL_MINT, USDC_MINT, 1_000_000_000, 50)
+
+        await cache.get_or_fetch(KEY, AsyncMock(return_value=_quote_data(context_slot=1000)))
+        await cache.get_or_fetch(other_key, AsyncMock(return_value=_quote_data(context_slot=1010)))
+
+        refetch = AsyncMock(return_value=_quote_data(context_slot=1010, out_amount="369000000"))
+        quote = await cache.get_or_fetch(KEY, refetch)
+
+        assert refetch.await_count == 1
+        assert quote["outAmount"] == "369000000"
+
+    async def test_redis_backend_shared_between_caches(self):
+        backend = RedisQuoteBackend("redis://localhost:6379/15")
+        backend._redis = fakeredis.FakeAsyncRedis()
+        worker_a = QuoteCache(backend, ttl_ms=2000, max_slot_lag=5)
+        worker_b = QuoteCache(backend, ttl_ms=2000, max_slot_lag=5)
+
+        await worker_a.get_or_fetch(KEY, AsyncMock(return_value=_quote_data()))
+        fetch = AsyncMock()
+        quote = await worker_b.get_or_fetch(KEY, fetch)
+
+        fetch.assert_not_awaited()
+        assert quote == _quote_data()
+        assert worker_b.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+class TestGetQuoteCaching:
+    @patch("src.jupiter.route_builder._client")
+    async def test_identical_quotes_hit_jupiter_once(self, mock_client):
+        mock_client.get = AsyncMock(return_value=_quote_data())
+        cache = QuoteCache(MemoryQuoteBackend(), ttl_ms=2000, max_slot_lag=5)
+
+        with patch("src.jupiter.route_builder._quote_cache", cache):
+            await asyncio.gather(*(get_quote(WSOL_MINT, USDC_MINT, 2_500_000_000, 50) for _ in range(5)))
+            await get_quote(WSOL_MINT, USDC_MINT, 2_500_000_000, 100)
+
+        assert mock_client.get.await_count == 2
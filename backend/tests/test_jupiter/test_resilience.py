@@ -0,0 +1,232 @@
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from src.common.exceptions import CircuitOpenError, JupiterAPIError
+from src.jupiter import route_builder
+from src.jupiter.client import JupiterClient
+from src.jupiter.resilience import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+)
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=3, recovery_seconds=30)
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state == CIRCUIT_CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CIRCUIT_OPEN
+        assert breaker.allow_request() is False
+        assert breaker.metrics()["rejected"] == 1
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2, recovery_seconds=30)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CIRCUIT_CLOSED
+
+    def test_half_open_probe_closes(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=0)
+        breaker.record_failure()
+
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+        breaker.record_success()
+
+        assert breaker.state == CIRCUIT_CLOSED
+        assert breaker.metrics()["transitions"] == {
+            "closed->open": 1,
+            "open->half_open": 1,
+            "half_open->closed": 1,
+        }
+
+    def test_half_open_failure_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=0)
+        breaker.record_failure()
+        assert breaker.allow_request() is True
+        breaker.recovery_seconds = 30
+        breaker.record_failure()
+        assert breaker.state == CIRCUIT_OPEN
+
+
+@pytest.mark.asyncio
+class TestAdaptiveConcurrencyLimiter:
+    async def test_bounds_in_flight_calls(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=2, min_limit=1, max_limit=10, latency_target_ms=1000
+        )
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(call() for _ in range(6)))
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+    async def test_additive_increase_multiplicative_decrease(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=10, min_limit=2, max_limit=20, latency_target_ms=100, backoff=0.5
+        )
+        for _ in range(10):
+            limiter.on_success(latency_ms=10)
+        assert limiter.metrics()["limit"] == 10  # ~+1 after a full window
+        assert limiter.limit > 10.9
+
+        limiter.on_failure()
+        assert limiter.metrics()["limit"] == 5
+
+        limiter.on_success(latency_ms=500)
+        limiter.on_success(latency_ms=500)
+        assert limiter.metrics()["limit"] == 2
+
+    async def test_decreases_once_per_window(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=16, min_limit=1, max_limit=32, latency_target_ms=100, backoff=0.5
+        )
+        burst = []
+        for _ in range(8):
+            slot = limiter.slot()
+            burst.append((slot, await slot.__aenter__()))
+
+        # Every call in flight fails: one congestion episode, one cut
+        for slot, call in burst:
+            limiter.on_failure(call)
+            await slot.__aexit__(None, None, None)
+        assert limiter.metrics()["limit"] == 8
+        assert limiter.metrics()["decreases"] == 1
+
+        # A call started after the cut opens the next window
+        async with limiter.slot() as call:
+            limiter.on_success(latency_ms=500, call=call)
+        assert limiter.metrics()["limit"] == 4
+
+
+def _failing_transport(status: int) -> httpx.MockTransport:
+    return httpx.MockTransport(lambda request: httpx.Response(status, json={}))
+
+
+@pytest.mark.asyncio
+class TestClientResilience:
+    async def test_server_errors_open_circuit_and_fail_fast(self):
+        client = JupiterClient()
+        client.breaker = CircuitBreaker(failure_threshold=2, recovery_seconds=30)
+        http_client = await client._get_client()
+
+        with patch.object(http_client, "_transport", _failing_transport(503)):
+            for _ in range(2):
+                with pytest.raises(JupiterAPIError):
+                    await client.get("/quote")
+
+            with pytest.raises(CircuitOpenError):
+                await client.get("/quote")
+
+        stats = client.resilience_stats()
+        assert stats["circuit"]["state"] == CIRCUIT_OPEN
+        assert stats["concurrency"]["decreases"] == 2
+        await client.close()
+
+    async def test_concurrent_timeouts_cut_limit_once(self):
+        client = JupiterClient()
+        client.breaker = CircuitBreaker(failure_threshold=100, recovery_seconds=30)
+        client.limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=16, min_limit=1, max_limit=32, latency_target_ms=1000, backoff=0.5
+        )
+        http_client = await client._get_client()
+
+        async def timeout(request):
+            await asyncio.sleep(0.01)
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        with patch.object(http_client, "_transport", httpx.MockTransport(timeout)):
+            results = await asyncio.gather(
+                *(client.get("/quote") for _ in range(10)), return_exceptions=True
+            )
+
+        assert all(isinstance(result, JupiterAPIError) for result in results)
+        assert client.resilience_stats()["concurrency"]["decreases"] == 1
+        assert client.limiter.metrics()["limit"] == 8
+        await client.close()
+
+    async def test_client_errors_do_not_trip_circuit(self):
+        client = JupiterClient()
+        client.breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=30)
+        http_client = await client._get_client()
+
+        with patch.object(http_client, "_transport", _failing_transport(400)):
+            with pytest.raises(JupiterAPIError):
+                await client.get("/quote")
+
+        assert client.breaker.state == CIRCUIT_CLOSED
+        await client.close()
+
+    async def _half_open_client(self) -> JupiterClient:
+        client = JupiterClient()
+        client.breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=0)
+        client.breaker.record_failure()
+        assert client.breaker.state == CIRCUIT_HALF_OPEN
+        return client
+
+    async def test_unusable_probe_response_settles_circuit(self):
+        client = await self._half_open_client()
+        http_client = await client._get_client()
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, text="<html>busy</html>"))
+
+        with patch.object(http_client, "_transport", transport):
+            with pytest.raises(JupiterAPIError):
+                await client.get("/quote")
+
+        # Reopened (and immediately half-open again with no recovery time), not stuck
+        assert client.breaker.transitions["half_open->open"] == 1
+        assert client.breaker.allow_request() is True
+        await client.close()
+
+    async def test_cancelled_probe_releases_slot(self):
+        client = await self._half_open_client()
+        http_client = await client._get_client()
+
+        async def hang(request):
+            await asyncio.sleep(10)
+
+        with patch.object(http_client, "_transport", httpx.MockTransport(hang)):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(client.get("/quote"), timeout=0.01)
+
+        assert client.breaker.state == CIRCUIT_HALF_OPEN
+        assert client.breaker.allow_request() is True
+        await client.close()
+
+    async def test_state_exported(self):
+        def transitions():
+            return REGISTRY.get_sample_value(
+                "jupiter_circuit_transitions_total", {"from_state": "closed", "to_state": "open"}
+            ) or 0
+
+        before = transitions()
+        client = JupiterClient()
+        client.breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=30)
+        client.register_metrics()
+        try:
+            client.breaker.record_failure()
+            assert transitions() == before + 1
+            assert REGISTRY.get_sample_value("jupiter_circuit_state", {"state": "open"}) == 1
+            assert REGISTRY.get_sample_value("jupiter_circuit_state", {"state": "closed"}) == 0
+            assert REGISTRY.get_sample_value("jupiter_concurrency_limit") == client.limiter.metrics()["limit"]
+            assert REGISTRY.get_sample_value("jupiter_requests_in_flight") == 0
+        finally:
+            route_builder._client.register_metrics()
@@ -0,0 +1,24 @@
+import pytest
+
+from src.signals.allocation import allocate_pro_rata
+
+
+class TestAllocateProRata:
+    def test_exact_split(self):
+        assert allocate_pro_rata(600, [1, 2, 3]) == [100, 200, 300]
+
+    def test_remainder_goes_to_largest_fractions(self):
+        # Exact shares are 3.33.., 3.33.., 3.33..; ties go to earlier entries
+        assert allocate_pro_rata(10, [1, 1, 1]) == [4, 3, 3]
+        # Exact shares are 1.4, 2.8, 5.6, 0.2
+        assert allocate_pro_rata(10, [7, 14, 28, 1]) == [1, 3, 6, 0]
+
+    def test_shares_always_sum_to_total(self):
+        weights = [2_500_000_000, 1_000_000_000, 333_333_333, 7]
+        shares = allocate_pro_rata(371_234_567, weights)
+        assert sum(shares) == 371_234_567
+        assert all(share >= 0 for share in shares)
+
+    def test_rejects_zero_weights(self):
+        with pytest.raises(ValueError):
+            allocate_pro_rata(10, [0, 0])
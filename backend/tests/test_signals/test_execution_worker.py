@@ -0,0 +1,215 @@
+import asyncio
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+from prometheus_client import REGISTRY
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.constants import (
+    EXECUTION_SKIPPED,
+    SIGNAL_SOL_TO_USDC,
+    TX_CONFIRMED,
+    TX_FAILED,
+    USDC_MINT,
+    WSOL_MINT,
+)
+from src.common.exceptions import JupiterAPIError
+from src.db.models.transaction import Transaction
+from src.db.repositories.signal_repo import SignalRepository
+from src.db.repositories.user_repo import UserRepository
+from src.db.repositories.vault_repo import VaultRepository
+from src.jupiter.models import QuoteResponse, SwapResponse
+from src.signals.latency import SignalLatency, pending_jobs_key
+from src.signals.workers import execution_worker
+from src.signals.workers.execution_worker import _execute_aggregate_async, _execute_for_users_async
+from tests.conftest import test_session_factory as session_factory
+
+
+@pytest.mark.asyncio
+class TestBatchExecution:
+    async def test_runs_owners_concurrently_with_bound(self):
+        in_flight = 0
+        peak = 0
+
+        async def fake_execute(signal_id, signal_type, owner):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return TX_CONFIRMED
+
+        owners = [f"wallet_{i:03d}" for i in range(10)]
+        with patch(
+            "src.signals.workers.execution_worker._execute_for_user_async",
+            side_effect=fake_execute,
+        ):
+            results = await _execute_for_users_async(1, SIGNAL_SOL_TO_USDC, owners, concurrency=3)
+
+        assert results == {owner: TX_CONFIRMED for owner in owners}
+        assert peak == 3
+
+    async def test_reports_outcome_per_user(self):
+        outcomes = {"ok": TX_CONFIRMED, "poor": EXECUTION_SKIPPED}
+
+        async def fake_execute(signal_id, signal_type, owner):
+            if owner == "boom":
+                raise RuntimeError("db down")
+            return outcomes[owner]
+
+        with patch(
+            "src.signals.workers.execution_worker._execute_for_user_async",
+            side_effect=fake_execute,
+        ):
+            results = await _execute_for_users_async(1, SIGNAL_SOL_TO_USDC, ["ok", "poor", "boom"])
+
+        assert results == {"ok": TX_CONFIRMED, "poor": EXECUTION_SKIPPED, "boom": TX_FAILED}
+
+
+def _quote(in_amount: int, out_amount: int) -> QuoteResponse:
+    return QuoteResponse(
+        input_mint=WSOL_MINT,
+        in_amount=str(in_amount),
+        output_mint=USDC_MINT,
+        out_amount=str(out_amount),
+        other_amount_threshold=str(out_amount * 9990 // 10000),
+        swap_mode="ExactIn",
+        slippage_bps=10,
+        price_impact_pct="0.001",
+    )
+
+
+@pytest.fixture
+def aggregate_worker():
+    with patch.object(execution_worker, "async_session_factory", session_factory), \
+            patch.object(execution_worker._jupiter_retry, "budget", None), \
+            patch.object(execution_worker._jupiter_retry, "max_retries", 0):
+        yield
+
+
+@pytest.mark.asyncio
+class TestAggregateExecution:
+    async def _seed(self, session: AsyncSession) -> None:
+        users = UserRepository(session)
+        vaults = VaultRepository(session)
+        for owner, size, slippage, balance in [
+            ("alice", 1_000_000_000, 50, 5_000_000_000),
+            ("bob", 2_000_000_000, 20, 5_000_000_000),
+            ("carol", 1_000_000_000, 50, 5_000_000_000),
+            ("dave", 1_000_000_000, 50, 0),
+        ]:
+            await users.create(owner, trade_size_sol=size, max_slippage_bps=slippage)
+            await vaults.create(owner, sol_balance=balance)
+        await session.commit()
+
+    async def test_single_swap_allocated_pro_rata(self, db_session, aggregate_worker):
+        await self._seed(db_session)
+        quote = _quote(4_000_000_000, 1_000_001)
+        stages = ("quote", "validate", "build", "commit")
+        before = {
+            stage: REGISTRY.get_sample_value("execution_stage_duration_seconds_count", {"stage": stage}) or 0
+            for stage in stages
+        }
+
+        with patch.object(execution_worker, "get_quote", return_value=quote) as get_quote, \
+                patch.object(
+                    execution_worker,
+                    "build_swap_transaction",
+                    return_value=SwapResponse(swap_transaction="AQID"),
+                ) as build_swap:
+            results = await _execute_aggregate_async(
+                7, SIGNAL_SOL_TO_USDC, ["alice", "bob", "carol", "dave", "erin"]
+            )
+
+        assert results == {
+            "alice": TX_CONFIRMED,
+            "bob": TX_CONFIRMED,
+            "carol": TX_CONFIRMED,
+            "dave": EXECUTION_SKIPPED,
+            "erin": EXECUTION_SKIPPED,
+        }
+        # One quote for the summed size under the strictest slippage limit
+        get_quote.assert_called_once_with(WSOL_MINT, USDC_MINT, 4_000_000_000, 20)
+        build_swap.assert_called_once()
+
+        db_session.expire_all()
+        txs = (await db_session.execute(select(Transaction).order_by(Transaction.owner))).scalars().all()
+        # Exact shares are 250000.25, 500000.5 and 250000.25
+        assert [(tx.owner, tx.amount_out, tx.status) for tx in txs] == [
+            ("alice", 250_000, TX_CONFIRMED),
+            ("bob", 500_001, TX_CONFIRMED),
+            ("carol", 250_000, TX_CONFIRMED),
+        ]
+        vault = await VaultRepository(db_session).get_by_owner("bob")
+        assert vault.sol_balance == 3_000_000_000
+        assert vault.usdc_balance == 500_001
+
+        # Each stage is timed once for the whole aggregate
+        for stage in stages:
+            count = REGISTRY.get_sample_value("execution_stage_duration_seconds_count", {"stage": stage})
+            assert count == before[stage] + 1
+
+    async def test_failed_swap_fails_all_transactions(self, db_session, aggregate_worker):
+        await self._seed(db_session)
+
+        with patch.object(execution_worker, "get_quote", side_effect=JupiterAPIError("down", 400)):
+            results = await _execute_aggregate_async(7, SIGNAL_SOL_TO_USDC, ["alice", "bob"])
+
+        assert results == {"alice": TX_FAILED, "bob": TX_FAILED}
+        db_session.expire_all()
+        vault = await VaultRepository(db_session).get_by_owner("alice")
+        assert vault.sol_balance == 5_000_000_000
+
+    async def test_failed_commit_rolls_back_balances(self, db_session, aggregate_worker):
+        await self._seed(db_session)
+
+        with patch.object(execution_worker, "get_quote", return_value=_quote(3_000_000_000, 750_000)), \
+                patch.object(
+                    execution_worker,
+                    "build_swap_transaction",
+                    return_value=SwapResponse(swap_transaction="AQID"),
+                ), \
+                patch.object(
+                    UserRepository,
+                    "bulk_update_last_execution",
+                    side_effect=RuntimeError("deadlock detected"),
+                ):
+            results = await _execute_aggregate_async(7, SIGNAL_SOL_TO_USDC, ["alice", "bob"])
+
+        assert results == {"alice": TX_FAILED, "bob": TX_FAILED}
+        db_session.expire_all()
+        txs = (await db_session.execute(select(Transaction))).scalars().all()
+        assert {tx.status for tx in txs} == {TX_FAILED}
+        assert {tx.error_message for tx in txs} == {"deadlock detected"}
+        vault = await VaultRepository(db_session).get_by_owner("bob")
+        assert (vault.sol_balance, vault.usdc_balance) == (5_000_000_000, 0)
+
+
+@pytest.mark.asyncio
+class TestSignalLatency:
+    async def test_last_job_records_latency_on_signal(self, db_session):
+        signal = await SignalRepository(db_session).create(signal_type=SIGNAL_SOL_TO_USDC, status="received")
+        await db_session.commit()
+        redis_client = fakeredis.FakeAsyncRedis()
+        await redis_client.set(pending_jobs_key(signal.id), 2)
+
+        async def execution(seconds: float):
+            await asyncio.sleep(seconds)
+            return TX_CONFIRMED
+
+        with patch.object(execution_worker, "async_session_factory", session_factory), \
+                patch.object(execution_worker, "_signal_latency", SignalLatency(redis_client)):
+            assert await execution_worker._timed_execution(signal.id, execution(0.03)) == TX_CONFIRMED
+            await db_session.refresh(signal)
+            # Jobs still running: the signal row is not touched
+            assert signal.slowest_execution_ms is None
+
+            await execution_worker._timed_execution(signal.id, execution(0.0))
+
+        await db_session.refresh(signal)
+        assert signal.slowest_execution_ms >= 30
+        assert signal.end_to_end_ms is not None
+        assert await redis_client.keys("signal_latency:*") == []
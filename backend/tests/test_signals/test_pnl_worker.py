@@ -0,0 +1,90 @@
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from src.common.constants import SIGNAL_SOL_TO_USDC, TX_CONFIRMED, TX_FAILED, USDC_MINT, WSOL_MINT
+from src.db.repositories.pnl_repo import PnlRepository
+from src.db.repositories.transaction_repo import TransactionRepository
+from src.db.repositories.user_repo import UserRepository
+from src.jupiter import price_service as price_module
+from src.jupiter.price_service import PriceService, StaticPriceFeed
+from src.signals.workers import pnl_worker
+from tests.conftest import test_session_factory as session_factory
+
+DAY = date(2026, 3, 2)
+
+
+def _swap(owner: str, when: datetime, status: str = TX_CONFIRMED) -> dict:
+    return {
+        "owner": owner,
+        "date": when,
+        "type": SIGNAL_SOL_TO_USDC,
+        "amount_in": 1_000_000_000,
+        "amount_out": 160_000_000,
+        "token_in": WSOL_MINT,
+        "token_out": USDC_MINT,
+        "slippage_bps": 50,
+        "fee": 5_000,
+        "status": status,
+    }
+
+
+@pytest.fixture
+def pnl_job():
+    # A fresh process: the price is fetched from the feed rather than the fallback served
+    service = PriceService(StaticPriceFeed(150.0), ttl_seconds=60)
+    with patch.object(pnl_worker, "async_session_factory", session_factory), \
+            patch.object(price_module, "price_service", service):
+        yield
+
+
+@pytest.mark.asyncio
+class TestPnlSnapshots:
+    async def _seed(self, session) -> None:
+        users = UserRepository(session)
+        await users.create("alice")
+        await users.create("bob")
+        await users.create("carol", enabled=False)
+        await PnlRepository(session).create(
+            owner="alice",
+            date=date(2026, 3, 1),
+            daily_pnl=10.0,
+            cumulative_pnl=10.0,
+            daily_sol_pnl=0,
+            cumulative_sol_pnl=0.5,
+            daily_usdc_pnl=10.0,
+            cumulative_usdc_pnl=10.0,
+            sol_price=140.0,
+        )
+        txs = TransactionRepository(session)
+        noon = datetime(2026, 3, 2, 12, tzinfo=timezone.utc)
+        await txs.create(**_swap("alice", noon))
+        await txs.create(**_swap("alice", noon, status=TX_FAILED))
+        await txs.create(**_swap("alice", datetime(2026, 3, 3, 0, 30, tzinfo=timezone.utc)))
+        await session.commit()
+
+    async def test_values_days_swaps_at_current_price(self, db_session, pnl_job):
+        await self._seed(db_session)
+
+        assert await pnl_worker._snapshot_pnl_async(DAY) == 2
+
+        repo = PnlRepository(db_session)
+        alice = await repo.get_by_date("alice", DAY)
+        # -1.000005 SOL (fee included) and +160 USDC, valued at 150 USD/SOL
+        assert float(alice.daily_sol_pnl) == -1.000005
+        assert float(alice.daily_usdc_pnl) == 160.0
+        assert float(alice.daily_pnl) == 10.0
+        assert float(alice.cumulative_pnl) == 20.0
+        assert float(alice.cumulative_sol_pnl) == -0.500005
+        assert float(alice.sol_price) == 150.0
+
+        bob = await repo.get_by_date("bob", DAY)
+        assert (float(bob.daily_pnl), float(bob.cumulative_pnl)) == (0.0, 0.0)
+        assert await repo.get_by_date("carol", DAY) is None
+
+    async def test_rerun_keeps_existing_snapshots(self, db_session, pnl_job):
+        await self._seed(db_session)
+
+        await pnl_worker._snapshot_pnl_async(DAY)
+        assert await pnl_worker._snapshot_pnl_async(DAY) == 0
@@ -0,0 +1,110 @@
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+
+from src.common import tracing
+from src.config.settings import settings
+from src.signals import queue as queue_module
+from src.signals.latency import pending_jobs_key
+from src.signals.queue import (
+    EXECUTE_AGGREGATE,
+    EXECUTE_FOR_USER,
+    EXECUTE_FOR_USERS,
+    enqueue_executions,
+    get_execution_queue,
+)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    conn = fakeredis.FakeStrictRedis()
+    monkeypatch.setattr(queue_module, "_redis_conn", conn)
+    monkeypatch.setattr(queue_module, "_queues", {})
+    return conn
+
+
+class TestEnqueueExecutions:
+    def test_enqueues_one_job_per_owner(self, fake_redis):
+        owners = [f"wallet_{i:03d}" for i in range(7)]
+
+        enqueued = enqueue_executions(42, "SOL_TO_USDC", owners, batch_size=3)
+
+        queue = get_execution_queue()
+        assert enqueued == 7
+        assert queue.count == 7
+        jobs = queue.get_jobs()
+        assert [job.args for job in jobs] == [(42, "SOL_TO_USDC", owner) for owner in owners]
+        assert all(job.func_name == EXECUTE_FOR_USER for job in jobs)
+        assert all(job.timeout == 300 for job in jobs)
+        assert int(fake_redis.get(pending_jobs_key(42))) == 7
+
+    def test_groups_owners_into_batch_jobs(self, fake_redis):
+        owners = [f"wallet_{i:03d}" for i in range(5)]
+
+        enqueued = enqueue_executions(42, "SOL_TO_USDC", owners, owners_per_job=2)
+
+        jobs = get_execution_queue().get_jobs()
+        assert enqueued == 5
+        assert [job.args[2] for job in jobs] == [owners[0:2], owners[2:4], owners[4:5]]
+        assert all(job.func_name == EXECUTE_FOR_USERS for job in jobs)
+
+    def test_no_owners(self, fake_redis):
+        assert enqueue_executions(1, "SOL_TO_USDC", []) == 0
+        assert get_execution_queue().count == 0
+
+    def test_queue_is_reused(self, fake_redis):
+        assert get_execution_queue() is get_execution_queue()
+
+    def test_aggregate_mode_groups_owners(self, fake_redis, monkeypatch):
+        monkeypatch.setattr(settings, "execution_mode", "aggregate")
+        monkeypatch.setattr(settings, "execution_aggregate_wallet", "AggWallet111")
+        monkeypatch.setattr(settings, "execution_aggregate_max_owners", 3)
+        owners = [f"wallet_{i:03d}" for i in range(5)]
+
+        assert enqueue_executions(42, "SOL_TO_USDC", owners) == 5
+
+        jobs = get_execution_queue().get_jobs()
+        assert [job.args[2] for job in jobs] == [owners[0:3], owners[3:5]]
+        assert all(job.func_name == EXECUTE_AGGREGATE for job in jobs)
+
+    def test_job_timeout_scales_with_owners(self, fake_redis, monkeypatch):
+        monkeypatch.setattr(settings, "execution_mode", "aggregate")
+        monkeypatch.setattr(settings, "execution_aggregate_wallet", "AggWallet111")
+        monkeypatch.setattr(settings, "execution_aggregate_max_owners", 1000)
+        monkeypatch.setattr(settings, "execution_job_timeout_seconds", 300)
+        monkeypatch.setattr(settings, "execution_job_timeout_per_owner_seconds", 0.5)
+        owners = [f"wallet_{i:04d}" for i in range(1001)]
+
+        enqueue_executions(42, "SOL_TO_USDC", owners)
+
+        assert [job.timeout for job in get_execution_queue().get_jobs()] == [799, 300]
+
+    def test_aggregate_mode_without_wallet_runs_per_user(self, fake_redis, monkeypatch):
+        monkeypatch.setattr(settings, "execution_mode", "aggregate")
+        monkeypatch.setattr(settings, "execution_aggregate_wallet", "")
+
+        enqueue_executions(42, "SOL_TO_USDC", ["a", "b"])
+
+        assert all(job.func_name == EXECUTE_FOR_USER for job in get_execution_queue().get_jobs())
+
+
+class TestTracePropagation:
+    def test_execution_jobs_continue_signal_trace(self, fake_redis):
+        with tracing.tracer.start_as_current_span("process_signal") as parent:
+            enqueue_executions(42, "SOL_TO_USDC", ["wallet_a", "wallet_b"])
+
+        jobs = get_execution_queue().get_jobs()
+        assert all("traceparent" in job.meta["trace"] for job in jobs)
+
+        with patch("rq.get_current_job", return_value=jobs[0]):
+            with tracing.job_span("execute_for_user") as span:
+                pass
+        assert span.get_span_context().trace_id == parent.get_span_context().trace_id
+        assert span.parent.span_id == parent.get_span_context().span_id
+
+    def test_job_without_trace_starts_new_trace(self):
+        with patch("rq.get_current_job", return_value=None):
+            with tracing.job_span("execute_for_user") as span:
+                assert span.is_recording()
+        assert span.parent is None
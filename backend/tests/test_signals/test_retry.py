@@ -1,6 +1,12 @@
+import time
+from unittest.mock import AsyncMock
+
+import fakeredis
 import pytest
 
-from src.signals.retry import with_retry
+from src.common.exceptions import CircuitOpenError, JupiterAPIError, SlippageExceededError
+from src.config.settings import settings
+from src.signals.retry import RetryBudget, RetryPolicy, with_retry
 
 
 @pytest.mark.asyncio
@@ -46,3 +52,71 @@ class TestRetryDecorator:
             await always_fails()
 
         assert call_count == 3  # initial + 2 retries
+
+
+@pytest.mark.asyncio
+class TestRetryPolicy:
+    async def test_never_retries_slippage(self):
+        func = AsyncMock(side_effect=SlippageExceededError())
+        policy = RetryPolicy(max_retries=3, base_delay=0.01)
+
+        with pytest.raises(SlippageExceededError):
+            await policy.run(func)
+        assert func.await_count == 1
+
+    async def test_retries_rate_limit_and_server_errors(self):
+        func = AsyncMock(side_effect=[
+            JupiterAPIError(upstream_status=429),
+            JupiterAPIError(upstream_status=503),
+            "ok",
+        ])
+        policy = RetryPolicy(max_retries=3, base_delay=0.01)
+
+        assert await policy.run(func) == "ok"
+        assert func.await_count == 3
+
+    async def test_no_retry_on_client_error_or_open_circuit(self):
+        policy = RetryPolicy(max_retries=3, base_delay=0.01)
+        for exc in (JupiterAPIError(upstream_status=400), CircuitOpenError()):
+            func = AsyncMock(side_effect=exc)
+            with pytest.raises(JupiterAPIError):
+                await policy.run(func)
+            assert func.await_count == 1
+
+    async def test_full_jitter_bounds(self):
+        policy = RetryPolicy(max_retries=3, base_delay=1.0, max_delay=5.0)
+        delays = [policy.backoff(attempt) for attempt in range(10) for _ in range(20)]
+        assert all(0 <= d <= 5.0 for d in delays)
+        assert len(set(delays)) > 1
+
+    async def test_stops_at_deadline(self):
+        func = AsyncMock(side_effect=JupiterAPIError(upstream_status=503))
+        policy = RetryPolicy(max_retries=5, base_delay=100.0, max_delay=1000.0)
+
+        with pytest.raises(JupiterAPIError):
+            await policy.run(func, deadline=time.monotonic() + 0.5)
+        assert func.await_count <= 2
+
+    async def test_shared_budget_caps_retries(self):
+        redis_client = fakeredis.FakeAsyncRedis()
+        budgets = [
+            RetryBudget(redis_client, "test", ratio=0.1, window_seconds=60, min_retries=2)
+            for _ in range(2)
+        ]
+        attempts = 0
+
+        async def always_fails():
+            nonlocal attempts
+            attempts += 1
+            raise JupiterAPIError(upstream_status=503)
+
+        for budget in budgets:
+            policy = RetryPolicy(max_retries=5, base_delay=0.001, budget=budget)
+            with pytest.raises(JupiterAPIError):
+                await policy.run(always_fails)
+
+        # 2 first attempts + the fleet-wide floor of 2 retries
+        assert attempts == 4
+
+    async def test_settings_drive_default_max_retries(self):
+        assert RetryPolicy().max_retries == settings.signal_max_retries
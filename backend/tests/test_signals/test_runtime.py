@@ -0,0 +1,34 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from src.signals.workers import runtime
+from src.signals.workers.runtime import run_async, shutdown
+
+
+async def _current_loop():
+    return asyncio.get_running_loop()
+
+
+class TestWorkerRuntime:
+    def test_jobs_share_one_event_loop(self):
+        try:
+            first = run_async(_current_loop())
+            second = run_async(_current_loop())
+            assert first is second
+            assert not first.is_closed()
+        finally:
+            shutdown()
+
+    @patch("src.signals.workers.runtime._close_resources", new_callable=AsyncMock)
+    def test_shutdown_closes_resources_and_loop(self, mock_close):
+        loop = run_async(_current_loop())
+
+        shutdown()
+
+        mock_close.assert_awaited_once()
+        assert loop.is_closed()
+        assert runtime._runner is None
+
+    def test_shutdown_without_loop_is_noop(self):
+        shutdown()
+        assert runtime._runner is None
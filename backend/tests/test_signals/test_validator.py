@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from src.common.exceptions import CooldownActiveError, DailyLimitExceededError
+from src.db.models.execution_counter import ExecutionCounter
 from src.signals.validator import validate_user_for_signal
 
 
@@ -56,3 +57,20 @@ class TestSignalValidator:
     def test_no_daily_limit(self):
         profile = _make_profile(daily_limit=None)
         assert validate_user_for_signal(profile, daily_executions=100) is True
+
+    def test_daily_count_read_from_counter(self):
+        today = datetime.now(timezone.utc).date()
+        profile = _make_profile(
+            daily_limit=5,
+            execution_counter=ExecutionCounter(owner="w", total_count=40, day=today, day_count=5),
+        )
+        with pytest.raises(DailyLimitExceededError):
+            validate_user_for_signal(profile)
+
+    def test_stale_counter_day_counts_as_zero(self):
+        yesterday = datetime.now(timezone.utc).date() - timedelta(days=1)
+        profile = _make_profile(
+            daily_limit=5,
+            execution_counter=ExecutionCounter(owner="w", total_count=40, day=yesterday, day_count=5),
+        )
+        assert validate_user_for_signal(profile) is True